@@ -1,10 +1,14 @@
 from abc import abstractmethod
+from contextlib import contextmanager
+from timeit import default_timer
 
 from enable.colors import ColorTrait
-from traits.api import ABCHasStrictTraits, Any, Event, Instance, Trait, Tuple
+from traits.api import (ABCHasStrictTraits, Any, Bool, Event, Float,
+                        Instance, Int, Trait, Tuple)
 
 from ..core.component import Component
 from ..core.container import Container
+from .dirty_region import DirtyRegion
 
 
 # XXX: Rename to Window (and subclasses) to WindowCanvas?
@@ -32,6 +36,40 @@ class AbstractWindow(ABCHasStrictTraits):
     # Integer size of the Window (width, height).
     _size = Trait(None, Tuple)
 
+    #: If True, only damaged regions of the window are repainted; the rest of
+    #: the graphics context is kept from the previous paint. This requires a
+    #: graphics context that persists between paints (e.g. an off-screen
+    #: buffer), so it's disabled by default.
+    partial_repaint = Bool(False)
+
+    #: Regions damaged since the last paint.
+    _dirty_region = Instance(DirtyRegion, ())
+
+    #: Maximum number of paints per second triggered by redraw requests. Any
+    #: requests made before the next frame is due are merged into one paint.
+    #: If 0, a paint is requested as soon as a redraw is requested.
+    max_fps = Float(60.0)
+
+    #: Number of times `redraw` was called.
+    redraw_count = Int(0)
+
+    #: Number of times the window was actually rendered. Compare with
+    #: `redraw_count` to see how many redraw requests were coalesced.
+    render_count = Int(0)
+
+    #: True if a paint was requested from the toolkit but hasn't happened yet.
+    _paint_pending = Bool(False)
+
+    #: Nesting depth of `_coalesced_redraws` blocks; paints are only requested
+    #: when the outermost block exits.
+    _coalesce_depth = Int(0)
+
+    #: True while the window is rendering.
+    _rendering = Bool(False)
+
+    #: Time of the last render, as given by `timeit.default_timer`.
+    _last_render_time = Float(-1e9)
+
     # --------------------------------------------------------------------------
     #  Abstract methods
     # --------------------------------------------------------------------------
@@ -78,13 +116,24 @@ class AbstractWindow(ABCHasStrictTraits):
         """ Return width and height of event. """
 
     @abstractmethod
-    def redraw(self, rect=None):
-        """ Request a redraw of the window.
+    def _request_paint(self):
+        """ Ask the toolkit to paint the damaged regions of the window.
 
-        If `rect` is provided, draw within just the (x, y, w, h) rectangle.
-        Otherwise, draw over the entire window.
+        The toolkit should eventually call `render`; backends without an event
+        loop may call it directly. Return True if a paint was requested, or
+        False if the window can't be painted (e.g. it has no control).
         """
 
+    def _call_later(self, delay, callback):
+        """ Call `callback` after `delay` seconds.
+
+        Toolkit backends should schedule the call on their event loop. By
+        default, `callback` is called immediately and `delay` is ignored,
+        since there's no event loop to wait on; windows that don't override
+        this aren't throttled by `max_fps`.
+        """
+        callback()
+
     # -----------------------------------------------------------------------
     # Public methods
     # -----------------------------------------------------------------------
@@ -115,6 +164,21 @@ class AbstractWindow(ABCHasStrictTraits):
             self.component.size = list(size)
         self.redraw()
 
+    def redraw(self, rect=None):
+        """ Request a redraw of the window.
+
+        If `rect` is provided, draw within just the (x, y, w, h) rectangle.
+        Otherwise, draw over the entire window.
+
+        Redraws aren't performed immediately: requests made while handling an
+        event, or before the next frame is due (see `max_fps`), are merged
+        into a single paint of the damaged regions.
+        """
+        self.redraw_count += 1
+        self._invalidate(rect)
+        if self._coalesce_depth == 0 and not self._rendering:
+            self._schedule_paint()
+
     # --------------------------------------------------------------------------
     #  Generic keyboard event handler:
     # --------------------------------------------------------------------------
@@ -136,7 +200,8 @@ class AbstractWindow(ABCHasStrictTraits):
         if (not key_event.handled) and (self.component is not None):
             if self.component.is_in(key_event.x, key_event.y):
                 # Fire the actual event
-                self.component.dispatch(key_event, event_type)
+                with self._coalesced_redraws():
+                    self.component.dispatch(key_event, event_type)
 
         return key_event.handled
 
@@ -156,6 +221,10 @@ class AbstractWindow(ABCHasStrictTraits):
             return False
 
         mouse_event = self._create_mouse_event(event)
+        with self._coalesced_redraws():
+            return self._dispatch_mouse_event(event_type, mouse_event)
+
+    def _dispatch_mouse_event(self, event_type, mouse_event):
         xy = (mouse_event.x, mouse_event.y)
 
         if (not mouse_event.handled) and (self.component is not None):
@@ -196,20 +265,42 @@ class AbstractWindow(ABCHasStrictTraits):
         """ This method is called directly by the UI toolkit's callback
         mechanism on the paint event.
         """
+        self._paint_pending = False
+        self._rendering = True
+        try:
+            self._render_damaged(event)
+        finally:
+            self._rendering = False
+        self.render_count += 1
+        self._last_render_time = default_timer()
+
+        # Components may request redraws while drawing (e.g. when an overlay
+        # moves); those are painted in a following frame.
+        if not self._dirty_region.is_empty:
+            self._schedule_paint()
+
+    def _render_damaged(self, event):
         # Create a new GC if necessary
         size = self._get_control_size()
         if (self._size != tuple(size)) or (self._gc is None):
             self._size = tuple(size)
             self._gc = self._create_gc(size)
+            self._dirty_region.invalidate_all()
 
-        # Always give the GC a chance to initialize
-        self._init_gc()
+        if not self.partial_repaint or self.component.layout_needed:
+            self._dirty_region.invalidate_all()
 
         # Layout components and draw
         if hasattr(self.component, "do_layout"):
             self.component.do_layout()
-        gc = self._gc
-        self.component.render(gc, view_rect=(0, 0, size[0], size[1]))
+        if self._dirty_region.all_dirty:
+            self._dirty_region.clear()
+            self._render_all(size)
+        else:
+            # If nothing is damaged (e.g. the window was just exposed), the
+            # previous paint is copied to the screen as is.
+            for rect in self._dirty_region.pop_rects(size):
+                self._render_rect(rect)
 
         # Perform a paint of the GC to the window (only necessary on backends
         # that render to an off-screen buffer)
@@ -230,6 +321,59 @@ class AbstractWindow(ABCHasStrictTraits):
     #  Private interface
     # -------------------------------------------------------------------------
 
+    def _invalidate(self, rect=None):
+        """ Record damaged (x, y, w, h) `rect`, or the whole window if None.
+        """
+        self._dirty_region.add(rect)
+
+    @contextmanager
+    def _coalesced_redraws(self):
+        """ Merge all redraws requested within this block into one paint. """
+        self._coalesce_depth += 1
+        try:
+            yield
+        finally:
+            self._coalesce_depth -= 1
+        if self._coalesce_depth == 0 and not self._dirty_region.is_empty:
+            self._schedule_paint()
+
+    def _schedule_paint(self):
+        """ Request a paint, unless one is pending, when the next frame is due.
+        """
+        if self._paint_pending:
+            return
+        self._paint_pending = True
+
+        delay = 0.0
+        if self.max_fps > 0:
+            next_frame = self._last_render_time + 1.0 / self.max_fps
+            delay = next_frame - default_timer()
+        if delay > 0:
+            self._call_later(delay, self._issue_paint)
+        else:
+            self._issue_paint()
+
+    def _issue_paint(self):
+        # If no paint was requested, a later redraw must request one again.
+        if not self._request_paint():
+            self._paint_pending = False
+
+    def _render_all(self, size):
+        # Always give the GC a chance to initialize
+        self._init_gc()
+        self.component.render(self._gc, view_rect=(0, 0, size[0], size[1]))
+
+    def _render_rect(self, rect):
+        """ Repaint the background and components within `rect`. """
+        gc = self._gc
+        with gc:
+            gc.clip_to_rect(*rect)
+            gc.set_fill_color(self.bgcolor_)
+            gc.begin_path()
+            gc.rect(*rect)
+            gc.fill_path()
+            self.component.render(gc, view_rect=rect)
+
     def _init_gc(self):
         """ Gives a GC a chance to initialize itself before components perform
         layout and draw.  This is called every time through the paint loop.
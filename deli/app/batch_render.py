@@ -0,0 +1,189 @@
+""" Render many graphs off-screen, in parallel over a pool of processes.
+"""
+import argparse
+import os
+from collections import namedtuple
+from multiprocessing import Pool
+from timeit import default_timer
+
+from ..serialization import api as serialization
+from ..serialization.binary import MAGIC
+from .offscreen import OffscreenWindow
+
+
+__all__ = ['RenderResult', 'batch_render']
+
+
+#: Rendered image of a job, with timings given in seconds.
+#:
+#: index : int
+#:     Position of the job in the list of jobs.
+#: image : bytes or array
+#:     PNG-encoded image or RGBA array, depending on the requested format.
+#: build_time : float
+#:     Time taken to create the graph.
+#: render_time : float
+#:     Time taken to render (and encode) the image.
+RenderResult = namedtuple('RenderResult',
+                          ['index', 'image', 'build_time', 'render_time'])
+
+
+#: Window of the current worker process, reused for all of its jobs so that
+#: its graphics context (and Kiva's font cache) is only created once.
+_worker_window = None
+
+#: Image format returned by the current worker process.
+_worker_image_format = None
+
+
+def batch_render(jobs, size=(400, 300), dpi=72.0, image_format='png',
+                 processes=None, chunksize=1):
+    """ Render graphs in worker processes and yield results as they complete.
+
+    Parameters
+    ----------
+    jobs : iterable
+        Descriptions of the graphs (or any components) to render, which are
+        sent to the workers. Each job is one of:
+
+        - the output of `serialize` or `serialize_binary`,
+        - bytes returned by `dumps`,
+        - the path of a file written by `dump` (arrays are memory-mapped, so
+          only the data that's drawn is read),
+        - a picklable callable (e.g. a module-level function or a
+          `functools.partial` wrapping one) that returns the component.
+    size : (width, height)
+        Size of the rendered graphs in points.
+    dpi : float
+        Resolution of the rendered images.
+    image_format : {'png', 'array'}
+        Return PNG-encoded bytes or RGBA arrays.
+    processes : int, optional
+        Number of worker processes; defaults to the number of CPUs. If 0, jobs
+        are rendered in this process, which is useful for debugging.
+    chunksize : int
+        Number of jobs sent to a worker at once. Larger chunks reduce the
+        communication overhead when there are many small graphs.
+
+    Yields
+    ------
+    result : RenderResult
+        Results are yielded in the order they complete, not the order of
+        `jobs`; use `result.index` to match them.
+    """
+    if image_format not in ('png', 'array'):
+        msg = "Unknown image format {!r}; expected 'png' or 'array'."
+        raise ValueError(msg.format(image_format))
+
+    init_args = (tuple(size), dpi, image_format)
+    if processes == 0:
+        _init_worker(*init_args)
+        for indexed_job in enumerate(jobs):
+            yield _render_job(indexed_job)
+        return
+
+    pool = Pool(processes, initializer=_init_worker, initargs=init_args)
+    try:
+        for result in pool.imap_unordered(_render_job, enumerate(jobs),
+                                          chunksize):
+            yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def main(argv=None):
+    """ Render graphs saved with `dump` to PNG files from the command line.
+
+    Each PNG file has the path of its input relative to the current
+    directory, under the output directory. Inputs outside of the current
+    directory are written directly to the output directory.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.strip())
+    parser.add_argument('files', nargs='+',
+                        help="graphs written by deli.serialization.api.dump")
+    parser.add_argument('-o', '--output-dir', default='.',
+                        help="directory of the PNG files (default: .)")
+    parser.add_argument('--size', type=int, nargs=2, default=(400, 300),
+                        metavar=('WIDTH', 'HEIGHT'),
+                        help="size of the images in points (default: 400 300)")
+    parser.add_argument('--dpi', type=float, default=72.0,
+                        help="resolution of the images (default: %(default)s)")
+    parser.add_argument('-j', '--processes', type=int, default=None,
+                        help="number of worker processes (default: CPUs)")
+    args = parser.parse_args(argv)
+
+    filenames = [_output_filename(path, args.output_dir)
+                 for path in args.files]
+    inputs = {}
+    for path, filename in zip(args.files, filenames):
+        if filename in inputs:
+            parser.error("{} and {} would both be written to {}".format(
+                inputs[filename], path, filename))
+        inputs[filename] = path
+
+    results = batch_render(args.files, size=args.size, dpi=args.dpi,
+                           processes=args.processes)
+    for result in results:
+        filename = filenames[result.index]
+        directory = os.path.dirname(filename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(filename, 'wb') as f:
+            f.write(result.image)
+        print('{}: built in {:.3f} s, rendered in {:.3f} s'.format(
+            filename, result.build_time, result.render_time))
+
+
+def _output_filename(path, output_dir):
+    """ Return the PNG file written by `main` for the input `path`. """
+    name = os.path.relpath(os.path.abspath(path))
+    if name.startswith(os.pardir + os.sep):
+        name = os.path.basename(path)
+    name = os.path.splitext(name)[0] + '.png'
+    return os.path.normpath(os.path.join(output_dir, name))
+
+
+# -----------------------------------------------------------------------------
+#  Worker functions
+# -----------------------------------------------------------------------------
+
+def _init_worker(size, dpi, image_format):
+    global _worker_window, _worker_image_format
+    _worker_window = OffscreenWindow(size=size, dpi=dpi)
+    _worker_image_format = image_format
+
+
+def _render_job(indexed_job):
+    index, job = indexed_job
+    window = _worker_window
+
+    t_start = default_timer()
+    component = _build_component(job)
+    t_built = default_timer()
+
+    window.component = component
+    if _worker_image_format == 'png':
+        image = window.render_to_png()
+    else:
+        image = window.render_to_array()
+    t_rendered = default_timer()
+
+    # Release the component, but keep the graphics context for the next job.
+    window.component = None
+    return RenderResult(index, image, t_built - t_start, t_rendered - t_built)
+
+
+def _build_component(job):
+    if callable(job):
+        return job()
+    if isinstance(job, bytes) and job.startswith(MAGIC):
+        return serialization.loads(job)
+    if isinstance(job, (bytes, type(u''))):
+        return serialization.load(job)
+    return serialization.deserialize(job)
+
+
+if __name__ == '__main__':
+    main()
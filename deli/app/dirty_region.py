@@ -0,0 +1,126 @@
+""" Tracking of window areas that need to be repainted.
+"""
+from functools import reduce
+from math import ceil, floor
+
+
+class DirtyRegion(object):
+    """ Set of damaged rectangles that is coalesced as rectangles are added.
+
+    Rectangles are given as (x, y, width, height). A new rectangle is merged
+    with any rectangle that it overlaps (or nearly overlaps), so the region is
+    described by a few disjoint rectangles. If there are more than `max_rects`
+    rectangles, they are all merged into their bounding rectangle.
+
+    Parameters
+    ----------
+    max_rects : int
+        Maximum number of rectangles that are repainted separately.
+    """
+
+    def __init__(self, max_rects=8):
+        self.max_rects = max_rects
+        #: Damaged rectangles given as (x0, y0, x1, y1) extents.
+        self._extents = []
+        self._all_dirty = False
+
+    @property
+    def is_empty(self):
+        return not (self._all_dirty or self._extents)
+
+    @property
+    def all_dirty(self):
+        return self._all_dirty
+
+    def add(self, rect=None):
+        """ Add a damaged rectangle; if `rect` is None, everything is damaged.
+        """
+        if rect is None:
+            self.invalidate_all()
+            return
+        if self._all_dirty:
+            return
+
+        x, y, width, height = rect
+        if width <= 0 or height <= 0:
+            return
+        new = (x, y, x + width, y + height)
+
+        # Merging may make the new rectangle overlap others, so repeat until
+        # no rectangle can be merged.
+        merged = True
+        while merged:
+            merged = False
+            for extents in self._extents:
+                if _should_merge(extents, new):
+                    self._extents.remove(extents)
+                    new = _union(extents, new)
+                    merged = True
+                    break
+        self._extents.append(new)
+
+        if len(self._extents) > self.max_rects:
+            self._extents = [reduce(_union, self._extents)]
+
+    def invalidate_all(self):
+        """ Mark the whole window as damaged. """
+        self._all_dirty = True
+        self._extents = []
+
+    def clear(self):
+        self._all_dirty = False
+        self._extents = []
+
+    def pop_rects(self, size):
+        """ Return damaged rectangles within a window and clear the region.
+
+        See `get_rects` for a description of the parameters.
+        """
+        rects = self.get_rects(size)
+        self.clear()
+        return rects
+
+    def get_rects(self, size):
+        """ Return damaged rectangles within a window.
+
+        Rectangles are expanded to integer pixels and clipped to the window.
+
+        Parameters
+        ----------
+        size : (width, height)
+            Size of the window.
+
+        Returns
+        -------
+        rects : list of (x, y, width, height)
+            Damaged rectangles. If everything is damaged, this is a single
+            rectangle covering the window.
+        """
+        width, height = size
+        if self._all_dirty:
+            rects = [(0, 0, width, height)]
+        else:
+            rects = []
+            for x0, y0, x1, y1 in self._extents:
+                x0, y0 = max(int(floor(x0)), 0), max(int(floor(y0)), 0)
+                x1 = min(int(ceil(x1)), width)
+                y1 = min(int(ceil(y1)), height)
+                if x1 > x0 and y1 > y0:
+                    rects.append((x0, y0, x1 - x0, y1 - y0))
+        return rects
+
+
+def _union(a, b):
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _area(extents):
+    x0, y0, x1, y1 = extents
+    return (x1 - x0) * (y1 - y0)
+
+
+def _should_merge(a, b):
+    """ Return True if repainting the union of `a` and `b` costs no more than
+    repainting `a` and `b` separately.
+    """
+    return _area(_union(a, b)) <= _area(a) + _area(b)
@@ -3,6 +3,7 @@ A Simple server used to show deli images.
 """
 import flask
 
+from ...serialization.snapshot import dumps_delta
 from .flask_utils import open_app
 
 
@@ -20,13 +21,38 @@ def send_css_files(filename):
     return flask.send_from_directory('static/css', filename)
 
 
-def create_plot(data, url='/', template='base.html'):
+def create_plot(data, url='/', template='base.html', buffers=()):
     """Create web page displaying the given data and route the given URL there.
+
+    Array `buffers` referenced by `data` (see `deli.serialization.binary`) are
+    served as binary data at `<url>buffers/<index>`.
     """
     def server():
         return flask.render_template(template, data=data)
     app.add_url_rule(url, view_func=server)
 
+    def buffer_server(index):
+        if not 0 <= index < len(buffers):
+            flask.abort(404)
+        return flask.Response(buffers[index],
+                              mimetype='application/octet-stream')
+    app.add_url_rule(url + 'buffers/<int:index>', view_func=buffer_server)
+
+
+def create_delta_endpoint(history, url='/delta'):
+    """Route the given URL to changes of a live plot since a given version.
+
+    Clients pass the version they last received as the `since` query
+    parameter, and receive the JSON of `history.delta(since)`, where
+    `history` is a `deli.serialization.snapshot.SnapshotHistory`.
+    """
+    def delta_server():
+        since = flask.request.args.get('since', type=int)
+        history.update()
+        return flask.Response(dumps_delta(history.delta(since)),
+                              mimetype='application/json')
+    app.add_url_rule(url, view_func=delta_server)
+
 
 def show():
     open_app(app)
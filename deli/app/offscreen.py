@@ -0,0 +1,133 @@
+""" Window that renders components to an off-screen image without a GUI.
+"""
+from io import BytesIO
+
+from kiva.image import GraphicsContext
+from traits.api import Any, Float, Int, Tuple
+
+from .abstract_window import AbstractWindow
+
+
+__all__ = ['OffscreenWindow', 'Window']
+
+
+DEFAULT_WIDTH = 400
+DEFAULT_HEIGHT = 300
+
+
+class OffscreenWindow(AbstractWindow):
+    """ Headless window that renders its component into a Kiva agg buffer.
+
+    The graphics context is created on the first render and reused for all
+    following renders until the size or resolution changes. Renders are only
+    performed when an image is requested, so redraw requests are cheap.
+
+    Events aren't generated by a toolkit; `handle_mouse_event` and
+    `handle_key_event` accept Enable `MouseEvent` and `KeyEvent` instances.
+    """
+
+    #: Size of the window in points (width, height).
+    size = Tuple(Int(DEFAULT_WIDTH), Int(DEFAULT_HEIGHT))
+
+    #: Resolution of rendered images. At 72 dpi, one point is one pixel.
+    dpi = Float(72.0)
+
+    #: Off-screen windows have no toolkit control.
+    control = Any
+
+    def __init__(self, component=None, **traits):
+        super(OffscreenWindow, self).__init__(**traits)
+        # Set the component after the size, so it's sized to fit the window.
+        if component is not None:
+            self.component = component
+
+    # -----------------------------------------------------------------------
+    #  Public interface
+    # -----------------------------------------------------------------------
+
+    def render_to_array(self):
+        """ Render the component and return the image as an array.
+
+        Returns
+        -------
+        image : (height, width, 4) uint8 array
+            RGBA pixels, starting at the top-left corner of the window.
+        """
+        self.render()
+        return self._gc.bmp_array.copy()
+
+    def render_to_png(self, filename=None):
+        """ Render the component and encode the image as PNG.
+
+        Parameters
+        ----------
+        filename : str or file-like, optional
+            Destination of the PNG image. If None, the encoded bytes are
+            returned instead.
+        """
+        from PIL import Image
+
+        image = Image.fromarray(self.render_to_array(), 'RGBA')
+        if filename is not None:
+            image.save(filename, 'png', dpi=(self.dpi, self.dpi))
+            return
+        stream = BytesIO()
+        image.save(stream, 'png', dpi=(self.dpi, self.dpi))
+        return stream.getvalue()
+
+    # -----------------------------------------------------------------------
+    #  AbstractWindow interface
+    # -----------------------------------------------------------------------
+
+    def _create_gc(self, size, pix_format="rgba32"):
+        scale = self.dpi / 72.0
+        gc_size = (int(round(size[0] * scale)), int(round(size[1] * scale)))
+        # With bottom_up=0, the first row of the buffer is the top of the
+        # window, as expected by image formats.
+        gc = GraphicsContext(gc_size, pix_format=pix_format, bottom_up=0)
+        gc.scale_ctm(scale, scale)
+        return gc
+
+    def _render(self, event):
+        pass
+
+    def _request_paint(self):
+        # Damaged regions are rendered when an image is requested.
+        return False
+
+    def _create_key_event(self, event_type, event):
+        return event
+
+    def _create_mouse_event(self, event):
+        return event
+
+    def _get_control_size(self):
+        return self.size
+
+    def _get_event_size(self, event):
+        return tuple(event)
+
+    def set_pointer(self, pointer):
+        pass
+
+    def set_tooltip(self, tooltip):
+        pass
+
+    def _set_focus(self):
+        pass
+
+    # -----------------------------------------------------------------------
+    #  Trait change handlers
+    # -----------------------------------------------------------------------
+
+    def _size_changed(self, new):
+        if self.component is not None:
+            self.on_resize(new)
+            self.redraw()
+
+    def _dpi_changed(self):
+        self._gc = None
+
+
+#: Name used to select this window with `deli.app.backend.use('offscreen')`.
+Window = OffscreenWindow
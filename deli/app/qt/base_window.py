@@ -1,4 +1,6 @@
-from pyface.qt import QtGui
+from math import ceil, floor
+
+from pyface.qt import QtCore, QtGui
 
 from enable.events import KeyEvent, MouseEvent
 from traits.api import Instance, Tuple
@@ -78,12 +80,19 @@ class BaseWindow(AbstractWindow):
         kwargs.update(get_button_state(buttons))
         return MouseEvent(x=x, y=self._flip_y(y), window=self, **kwargs)
 
-    def redraw(self, rect=None):
-        if self.control:
-            if rect is None:
-                self.control.update()
-            else:
-                self.control.update(*rect)
+    def _request_paint(self):
+        if not self.control:
+            return False
+        region = self._dirty_region
+        if region.all_dirty or self._size is None:
+            self.control.update()
+        else:
+            for rect in region.get_rects(self._size):
+                self.control.update(*self._to_control_rect(rect))
+        return True
+
+    def _call_later(self, delay, callback):
+        QtCore.QTimer.singleShot(int(ceil(delay * 1000)), callback)
 
     def _get_control_size(self):
         if self.control:
@@ -112,6 +121,17 @@ class BaseWindow(AbstractWindow):
         "Converts between a Kiva and a Qt y coordinate"
         return int(self._size[1] - y - 1)
 
+    def _to_control_rect(self, rect):
+        """ Return Qt (x, y, w, h) rect, with a top-left origin, that covers
+        (x, y, w, h) `rect` given in Kiva coordinates.
+        """
+        x, y, width, height = rect
+        x0 = int(floor(x)) - 1
+        y0 = int(floor(self._size[1] - y - height)) - 1
+        x1 = int(ceil(x + width)) + 1
+        y1 = int(ceil(self._size[1] - y)) + 1
+        return x0, y0, x1 - x0, y1 - y0
+
     def get_size_hint(self, qt_size_hint):
         """ Combine the Qt and enable size hints.
 
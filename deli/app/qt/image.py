@@ -1,29 +1,64 @@
+import sys
+
 from kiva.agg import GraphicsContextSystem as GraphicsContext
 from pyface.qt import QtCore, QtGui
+from traits.api import Any
 
 from .base_window import BaseWindow
 
 
 class Window(BaseWindow):
 
+    #: The Kiva graphics context is an off-screen buffer that persists between
+    #: paints, so only damaged regions need to be repainted.
+    partial_repaint = True
+
+    #: QImage that wraps the pixel buffer of the graphics context, or None if
+    #: the buffer layout doesn't match a QImage format.
+    _image = Any
+
     def _create_gc(self, size, pix_format="bgra32"):
         gc_size = (size[0]+1, size[1]+1)
         # We have to set bottom_up=0 or otherwise the PixelMap will appear
         # upside down in the QImage.
         gc = GraphicsContext(gc_size, pix_format=pix_format, bottom_up=0)
         gc.translate_ctm(0.5, 0.5)
+        self._image = wrap_pixel_buffer(gc, pix_format)
         return gc
 
     def _render(self, event):
         if self.control is None:
             return
 
-        w = self._gc.width()
-        h = self._gc.height()
-        data = self._gc.pixel_map.convert_to_argb32string()
-
-        image = QtGui.QImage(data, w, h, QtGui.QImage.Format_ARGB32)
-        rect = QtCore.QRect(0, 0, w, h)
+        image = self._image
+        if image is None:
+            image = convert_to_image(self._gc)
+        rect = QtCore.QRect(0, 0, image.width(), image.height())
 
         painter = QtGui.QPainter(self.control)
         painter.drawImage(rect, image)
+
+
+def wrap_pixel_buffer(gc, pix_format):
+    """ Return a QImage that shares the pixel buffer of a Kiva `gc`.
+
+    A "bgra32" buffer on a little-endian machine has the same memory layout
+    as `QImage.Format_ARGB32`, so the image is painted without copying and
+    shows the latest drawing of `gc`. For other layouts, None is returned.
+    """
+    if pix_format != "bgra32" or sys.byteorder != "little":
+        return None
+    buffer = gc.bmp_array
+    height, width = buffer.shape[:2]
+    image = QtGui.QImage(buffer.data, width, height, buffer.strides[0],
+                         QtGui.QImage.Format_ARGB32)
+    # QImage doesn't own the buffer, so keep it alive as long as the image.
+    image.pixel_buffer = buffer
+    return image
+
+
+def convert_to_image(gc):
+    """ Return a QImage with a copy of the pixels of a Kiva `gc`. """
+    data = gc.pixel_map.convert_to_argb32string()
+    return QtGui.QImage(data, gc.width(), gc.height(),
+                        QtGui.QImage.Format_ARGB32)
@@ -0,0 +1,25 @@
+import gc as garbage_collector
+import weakref
+
+import numpy as np
+from numpy.testing.decorators import skipif
+
+from deli.testing.helpers import Bunch, qt_available
+
+
+@skipif(not qt_available(), "Qt is unavailable")
+def test_wrapped_image_keeps_buffer_alive():
+    from deli.app.qt.image import wrap_pixel_buffer
+
+    gc = Bunch(bmp_array=np.zeros((10, 20, 4), dtype=np.uint8))
+    buffer = weakref.ref(gc.bmp_array)
+    image = wrap_pixel_buffer(gc, 'bgra32')
+    if image is None:
+        # The buffer layout doesn't match a QImage format on this machine.
+        return
+
+    del gc
+    garbage_collector.collect()
+    assert buffer() is not None
+    assert image.pixel_buffer is buffer()
+    assert (image.width(), image.height()) == (20, 10)
@@ -1,8 +1,9 @@
 from __future__ import absolute_import
 
-from traits.api import Instance
+from traits.api import Bool, Instance
 
-from ..vispy.graphics_context import GraphicsContext
+from ..vispy.graphics_context import (GraphicsContext, RetainedDrawingCache,
+                                      get_renderers)
 from ..vispy.qgl_backend import QGLBackend
 from .base_window import BaseWindow
 
@@ -13,14 +14,36 @@ class Window(BaseWindow):
 
     control = Instance(QGLBackend)
 
+    #: If True, artists' GPU commands are retained between frames, so panning
+    #: and zooming only update transforms instead of re-uploading data.
+    retained = Bool(False)
+
+    _drawing_cache = Instance(RetainedDrawingCache, ())
+
     def _create_control(self, parent, proxy_window):
         """ Create the toolkit control. """
         return QGLBackend(parent, proxy_window)
 
     def _create_gc(self, size, pix_format="bgra32"):
-        self._gc = GraphicsContext(size)
+        drawing_cache = self._drawing_cache if self.retained else None
+        self._gc = GraphicsContext(size, drawing_cache=drawing_cache,
+                                   renderers=self._get_renderers())
         return self._gc
 
+    def warm_up(self):
+        """ Create renderers and load fonts now instead of on the first draw.
+        """
+        self._get_renderers().warm_up()
+
+    def _get_renderers(self):
+        glcontext = None if self.control is None else self.control.glcontext
+        return get_renderers(glcontext)
+
+    def _retained_changed(self):
+        self._drawing_cache.clear()
+        self._gc = None
+        self.redraw()
+
     def _render(self, event):
         if self.control is None:
             return
@@ -121,6 +121,7 @@ class MockWindow(AbstractWindow):
     def _create_gc(self, size):
         context = MagicMock()
         context.get_full_text_extent.side_effect = calculate_text_extent
+        context.get_ctm.return_value = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
         return context
 
     def _create_key_event(self, event_type, event):
@@ -138,8 +139,9 @@ class MockWindow(AbstractWindow):
         self._last_mouse_position = (event.x, event.y)
         return MouseEvent(window=self, **event.to_dict())
 
-    def redraw(self, rect=None):
+    def _request_paint(self):
         self.render()
+        return True
 
     def _get_control_size(self):
         if self.control:
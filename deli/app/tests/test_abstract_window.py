@@ -0,0 +1,103 @@
+from timeit import default_timer
+
+from mock import patch
+from traits.api import Int, List
+
+from deli.app.testing.mock_window import MockWindow
+
+
+class DeferredWindow(MockWindow):
+    """ Window that records scheduled paints instead of calling them. """
+
+    scheduled = List
+
+    def _call_later(self, delay, callback):
+        self.scheduled.append((delay, callback))
+
+
+class ClosedWindow(MockWindow):
+    """ Window whose toolkit control can't be painted. """
+
+    paint_requests = Int(0)
+
+    def _request_paint(self):
+        self.paint_requests += 1
+        return False
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+
+def test_redraw_renders_once_per_event():
+    window = MockWindow()
+    window.render_count = window.redraw_count = 0
+    with window._coalesced_redraws():
+        window.redraw((0, 0, 10, 10))
+        window.redraw()
+        assert window.render_count == 0
+    assert window.redraw_count == 2
+    assert window.render_count == 1
+
+
+def test_redraw_waits_for_next_frame():
+    window = DeferredWindow(max_fps=10)
+    window.render()
+    window.render_count = 0
+
+    window.redraw()
+    window.redraw()
+    assert window.render_count == 0
+    assert len(window.scheduled) == 1
+    delay, callback = window.scheduled[0]
+    assert 0 < delay <= 0.1
+
+    callback()
+    assert window.render_count == 1
+    assert window._dirty_region.is_empty
+
+
+def test_redraw_without_frame_limit():
+    window = DeferredWindow(max_fps=0)
+    window.render()
+    window.render_count = 0
+    window._last_render_time = default_timer()
+
+    window.redraw()
+    assert window.render_count == 1
+    assert not window.scheduled
+
+
+@patch('deli.app.abstract_window.default_timer', new_callable=FakeClock)
+def test_redraw_throttled_by_max_fps(clock):
+    window = DeferredWindow(max_fps=10)
+    window.render()
+    window.render_count = 0
+
+    clock.time += 0.04
+    window.redraw()
+    delay, callback = window.scheduled.pop()
+    assert abs(delay - 0.06) < 1e-9
+    clock.time += delay
+    callback()
+    assert window.render_count == 1
+
+    # Redraws after the frame interval are painted immediately.
+    clock.time += 0.1
+    window.redraw()
+    assert not window.scheduled
+    assert window.render_count == 2
+
+
+def test_paint_not_pending_if_not_requested():
+    window = ClosedWindow(max_fps=0)
+    window.paint_requests = 0
+    window.redraw()
+    window.redraw()
+    assert not window._paint_pending
+    assert window.paint_requests == 2
@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+from functools import partial
+
+import numpy as np
+from mock import patch
+from numpy.testing.decorators import skipif
+
+from deli.app.batch_render import RenderResult, batch_render, main
+from deli.artist.line_artist import LineArtist
+from deli.graph import Graph
+from deli.serialization.api import dumps, serialize
+from deli.testing.helpers import agg_available, mock_graphics_context
+
+
+def make_graph(n_points=10):
+    graph = Graph()
+    x = np.arange(n_points)
+    graph.add_artist(LineArtist(x_data=x, y_data=x))
+    return graph
+
+
+@patch('deli.app.offscreen.GraphicsContext', side_effect=mock_graphics_context)
+def test_batch_render_in_process(create_gc):
+    jobs = [partial(make_graph, n) for n in (10, 20, 30)]
+    results = list(batch_render(jobs, size=(100, 50), image_format='array',
+                                processes=0))
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert all(r.build_time >= 0 and r.render_time >= 0 for r in results)
+    # The graphics context is shared by all jobs.
+    assert create_gc.call_count == 1
+
+
+@patch('deli.app.offscreen.GraphicsContext', side_effect=mock_graphics_context)
+def test_batch_render_serialized_graphs(create_gc):
+    graph = make_graph()
+    jobs = [serialize(graph), dumps(graph)]
+    results = list(batch_render(jobs, size=(100, 50), image_format='array',
+                                processes=0))
+    assert [r.index for r in results] == [0, 1]
+
+
+def test_batch_render_rejects_unknown_format():
+    try:
+        list(batch_render([make_graph], image_format='gif', processes=0))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError")
+
+
+@skipif(not agg_available(), "Kiva agg graphics context is unavailable")
+def test_batch_render_pool():
+    jobs = [partial(make_graph, n) for n in (10, 20, 30)]
+    results = list(batch_render(jobs, size=(100, 50), processes=2))
+    assert sorted(r.index for r in results) == [0, 1, 2]
+    assert all(r.image.startswith(b'\x89PNG') for r in results)
+
+
+@patch('deli.app.batch_render.batch_render')
+def test_main_writes_png_files(batch_render):
+    batch_render.return_value = [RenderResult(1, b'png 1', 0.0, 0.0),
+                                 RenderResult(0, b'png 0', 0.0, 0.0)]
+    output_dir = tempfile.mkdtemp()
+    try:
+        main(['data/a.deli', 'b.deli', '-o', output_dir, '--size', '200',
+              '100', '--dpi', '144', '-j', '2'])
+        batch_render.assert_called_once_with(
+            ['data/a.deli', 'b.deli'], size=[200, 100], dpi=144.0,
+            processes=2)
+        for name, image in [('data/a.png', b'png 0'), ('b.png', b'png 1')]:
+            with open(os.path.join(output_dir, name), 'rb') as f:
+                assert f.read() == image
+    finally:
+        shutil.rmtree(output_dir)
+
+
+@patch('deli.app.batch_render.batch_render')
+def test_main_keeps_inputs_with_same_name_apart(batch_render):
+    batch_render.return_value = [RenderResult(0, b'png 0', 0.0, 0.0),
+                                 RenderResult(1, b'png 1', 0.0, 0.0)]
+    output_dir = tempfile.mkdtemp()
+    try:
+        main(['a/plot.bin', 'b/plot.bin', '-o', output_dir])
+        for name, image in [('a/plot.png', b'png 0'),
+                            ('b/plot.png', b'png 1')]:
+            with open(os.path.join(output_dir, name), 'rb') as f:
+                assert f.read() == image
+    finally:
+        shutil.rmtree(output_dir)
+
+
+@patch('deli.app.batch_render.batch_render')
+def test_main_rejects_inputs_with_same_output(batch_render):
+    for files in (['plot.bin', 'plot.deli'], ['../a/plot.bin', 'plot.bin']):
+        try:
+            main(files + ['-o', 'output'])
+        except SystemExit:
+            pass
+        else:
+            raise AssertionError("Expected SystemExit")
+    assert not batch_render.called
@@ -0,0 +1,62 @@
+from deli.app.dirty_region import DirtyRegion
+
+
+SIZE = (100, 100)
+
+
+def test_empty():
+    region = DirtyRegion()
+    assert region.is_empty
+    region.add((10, 10, 0, 5))
+    assert region.is_empty
+    assert region.pop_rects(SIZE) == []
+
+
+def test_merge_overlapping():
+    region = DirtyRegion()
+    region.add((10, 10, 20, 20))
+    region.add((15, 15, 20, 20))
+    assert region.pop_rects(SIZE) == [(10, 10, 25, 25)]
+    assert region.is_empty
+
+
+def test_disjoint_rects_are_kept_separate():
+    region = DirtyRegion()
+    region.add((0, 0, 10, 10))
+    region.add((50, 50, 10, 10))
+    assert sorted(region.pop_rects(SIZE)) == [(0, 0, 10, 10),
+                                              (50, 50, 10, 10)]
+
+
+def test_merge_cascades():
+    region = DirtyRegion()
+    region.add((0, 0, 10, 10))
+    region.add((20, 0, 10, 10))
+    # Covers the gap between both rects, so all are merged.
+    region.add((5, 0, 20, 10))
+    assert region.pop_rects(SIZE) == [(0, 0, 30, 10)]
+
+
+def test_max_rects():
+    region = DirtyRegion(max_rects=2)
+    region.add((0, 0, 1, 1))
+    region.add((10, 10, 1, 1))
+    region.add((20, 20, 1, 1))
+    assert region.pop_rects(SIZE) == [(0, 0, 21, 21)]
+
+
+def test_pop_rects_aligns_and_clips():
+    region = DirtyRegion()
+    region.add((-5.5, 90.5, 10, 20))
+    region.add((200, 200, 10, 10))
+    assert region.pop_rects(SIZE) == [(0, 90, 5, 10)]
+
+
+def test_invalidate_all():
+    region = DirtyRegion()
+    region.add((0, 0, 10, 10))
+    region.add(None)
+    assert region.all_dirty
+    region.add((0, 0, 10, 10))
+    assert region.pop_rects(SIZE) == [(0, 0, 100, 100)]
+    assert not region.all_dirty
@@ -0,0 +1,40 @@
+import numpy as np
+from mock import patch
+from numpy.testing.decorators import skipif
+
+from deli.app.offscreen import OffscreenWindow
+from deli.graph import Graph
+from deli.testing.helpers import agg_available, mock_graphics_context
+
+
+@patch('deli.app.offscreen.GraphicsContext', side_effect=mock_graphics_context)
+def test_gc_reused_for_same_size(create_gc):
+    window = OffscreenWindow(Graph(), size=(200, 100))
+    window.render()
+    window.render()
+    assert create_gc.call_count == 1
+    assert window._gc.size == (200, 100)
+    assert window.component.size == [200, 100]
+
+    window.size = (300, 100)
+    window.render()
+    assert create_gc.call_count == 2
+    assert window.component.size == [300, 100]
+
+
+@patch('deli.app.offscreen.GraphicsContext', side_effect=mock_graphics_context)
+def test_dpi_scales_gc(create_gc):
+    window = OffscreenWindow(Graph(), size=(200, 100), dpi=144)
+    window.render()
+    assert window._gc.size == (400, 200)
+    window._gc.scale_ctm.assert_called_once_with(2.0, 2.0)
+
+
+@skipif(not agg_available(), "Kiva agg graphics context is unavailable")
+def test_render_to_array():
+    window = OffscreenWindow(Graph(), size=(200, 100))
+    image = window.render_to_array()
+    assert image.shape == (100, 200, 4)
+    assert image.dtype == np.uint8
+    png = window.render_to_png()
+    assert png.startswith(b'\x89PNG')
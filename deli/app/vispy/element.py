@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
 from contextlib import contextmanager
 
+import numpy as np
 from vispy import gloo
 from vispy.gloo import gl
 
@@ -11,13 +12,52 @@ class GLElement(object):
 
     def __init__(self, vert_shader, frag_shader):
         self._program = gloo.Program(vert_shader, frag_shader)
+        self._vertex_buffer = PersistentBuffer(gloo.VertexBuffer)
+        self._source = None
 
     def __setitem__(self, key, value):
         self._program[key] = value
 
     def update(self, state):
+        self.update_clip(state)
+
+    def update_clip(self, state):
         self._rect_clip = state.rect_clip
 
+    def is_same_source(self, points, style, version=None):
+        """ Return True if `points` and `style` match the previous update.
+
+        If `version` is given, it identifies the points (e.g. the data version
+        of the artist that draws them) and is compared instead of the points.
+        Otherwise, points are compared by identity, which is only safe for
+        read-only arrays, so writeable arrays are never considered the same.
+        This lets callers skip rebuilding vertex data for unchanged points.
+        """
+        if version is not None:
+            source = (True, version, style)
+        elif isinstance(points, np.ndarray) and not points.flags.writeable:
+            source = (False, points, style)
+        else:
+            source = None
+
+        previous = self._source
+        self._source = source
+        if previous is None or source is None or previous[0] != source[0]:
+            return False
+        if source[0]:
+            same_points = previous[1] == source[1]
+        else:
+            same_points = previous[1] is source[1]
+        return same_points and previous[2] == source[2]
+
+    def set_vertex_data(self, data, version=None):
+        """ Upload vertex data to this element's persistent vertex buffer.
+
+        See `PersistentBuffer.set_data` for a description of `version`.
+        """
+        if self._vertex_buffer.set_data(data, version=version):
+            self._program.bind(self._vertex_buffer.buffer)
+
     @abstractmethod
     def draw(self):
         """ Draw this graphics element.
@@ -25,6 +65,39 @@ class GLElement(object):
         Typically, this will draw under `self._draw_context`.
         """
 
+    def _draw_vertices(self, mode, indices=None):
+        """ Draw the vertices set by `set_vertex_data`.
+
+        Unlike `Program.draw`, which draws whole buffers, this only draws the
+        vertices (or indices) in use, not the spare capacity of persistent
+        buffers.
+
+        Parameters
+        ----------
+        mode : GL enum
+            Primitive type, e.g. `gl.GL_TRIANGLES`.
+        indices : PersistentBuffer, optional
+            Buffer of uint32 vertex indices. If not given, vertices are drawn
+            in order.
+        """
+        if indices is None:
+            count = self._vertex_buffer.size
+        else:
+            count = indices.size
+        if count == 0:
+            return
+
+        program = self._program
+        program.activate()
+        if indices is None:
+            gl.glDrawArrays(mode, 0, count)
+        else:
+            indices.buffer.activate()
+            gl.glDrawElements(mode, count, gl.GL_UNSIGNED_INT, None)
+            indices.buffer.deactivate()
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+        program.deactivate()
+
     @contextmanager
     def _draw_context(self):
         if self._rect_clip is None:
@@ -36,14 +109,105 @@ class GLElement(object):
             gl.glDisable(gl.GL_SCISSOR_TEST);
 
 
-def create_program(data, vert_shader, frag_shader):
-    """Return gloo.Program for drawing data with the given shaders. """
-    program = gloo.Program(vert_shader, frag_shader)
-    vertex_buffer = gloo.VertexBuffer(data)
-    program.bind(vertex_buffer)
-    return program
+class PersistentBuffer(object):
+    """ GPU buffer that is reused across updates.
+
+    The buffer is grown geometrically when data doesn't fit, and is otherwise
+    refilled with a sub-data upload, so steady-state updates don't reallocate
+    GPU memory. Only the first `size` elements are in use; the rest of the
+    capacity must not be drawn (see `GLElement._draw_vertices`).
+
+    Uploads are skipped if the data hasn't changed: callers that know the
+    version of their data pass it to `set_data`, which makes the check free,
+    and data without a version is compared to the previous upload.
+
+    Parameters
+    ----------
+    buffer_type : class
+        Buffer class, e.g. `gloo.VertexBuffer` or `gloo.IndexBuffer`.
+    min_capacity : int
+        Minimum number of elements allocated.
+    """
+
+    def __init__(self, buffer_type, min_capacity=1024):
+        self.buffer = None
+        self._buffer_type = buffer_type
+        self._min_capacity = min_capacity
+        #: CPU-side copy of the buffer contents.
+        self._staging = None
+        self._size = 0
+        self._version = None
+
+    @property
+    def capacity(self):
+        """ Number of elements allocated. """
+        return 0 if self._staging is None else len(self._staging)
+
+    @property
+    def size(self):
+        """ Number of elements in use. """
+        return self._size
+
+    def set_data(self, data, version=None):
+        """ Fill the start of the buffer with `data`.
+
+        Parameters
+        ----------
+        data : array
+            Elements to upload.
+        version : hashable, optional
+            Identifies the contents of `data`. If it's equal to the version
+            of the previous update, the upload is skipped without looking at
+            `data`. If None, `data` is compared to the buffer contents, which
+            costs a pass over the data.
+
+        Returns
+        -------
+        created : bool
+            True if the underlying buffer object was created, in which case it
+            must be (re)bound to the program that draws it.
+        """
+        n = len(data)
+        staging = self._staging
+        previous_version = self._version
+        self._version = version
+        if (staging is not None and staging.dtype == data.dtype and
+                n <= len(staging)):
+            if version is not None:
+                if version == previous_version:
+                    return False
+            elif n == self._size and _same_bytes(staging[:n], data):
+                return False
+            staging[:n] = data
+            self._size = n
+            if n > 0:
+                # Copy, since the upload is deferred and `staging` is reused.
+                self.buffer.set_subdata(staging[:n], copy=True)
+            return False
+
+        capacity = max(n, 2 * self.capacity, self._min_capacity)
+        self._staging = np.zeros(capacity, dtype=data.dtype)
+        self._staging[:n] = data
+        self._size = n
+        self.buffer = self._buffer_type(self._staging.copy())
+        return True
+
+
+def _same_bytes(a, b):
+    """ Return True if contiguous arrays `a` and `b` have identical bytes. """
+    b = np.ascontiguousarray(b)
+    return (a.shape == b.shape and
+            np.array_equal(a.view(np.uint8), b.view(np.uint8)))
+
 
+def affine_to_mat4(matrix):
+    """ Return 4x4 transform matrix for a (2, 3) affine `matrix`.
 
-def set_program_data(program, data):
-    vertex_buffer = gloo.VertexBuffer(data)
-    program.bind(vertex_buffer)
+    Matrices for vispy use the row-vector convention, so this is transposed
+    relative to `matrix`.
+    """
+    (a, b, tx), (c, d, ty) = matrix[:2]
+    return np.array([[a, c, 0, 0],
+                     [b, d, 0, 0],
+                     [0, 0, 1, 0],
+                     [tx, ty, 0, 1]], dtype=np.float32)
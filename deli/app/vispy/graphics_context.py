@@ -1,11 +1,18 @@
 from __future__ import absolute_import
 
+import weakref
+
 import numpy as np
 from kiva.basecore2d import GraphicsState as BaseGraphicsState
+from kiva.constants import (EOF_FILL, EOF_FILL_STROKE, FILL, FILL_STROKE,
+                            STROKE)
 
 from vispy import gloo
+from vispy.scene.visuals.text.text import FontManager
 from vispy.util.transforms import ortho, zrotate
 
+from ...layout.bbox_transform import invert_affine
+from .element import affine_to_mat4
 from .lines import LineElement
 from .markers import MarkerElement
 from .rect import RectElement
@@ -14,12 +21,73 @@ from .text import TextElement
 
 identity_transform = np.eye(4, dtype=np.float32)
 
-# These objects are expensive to initialize, and the graphics context gets
-# recreated when resizing.
-LINE_RENDERER = LineElement()
-MARKER_RENDERER = MarkerElement()
-RECT_RENDERER = RectElement()
-TEXT_RENDERER = TextElement()
+#: Element types used by the graphics context.
+ELEMENT_TYPES = (LineElement, MarkerElement, RectElement, TextElement)
+
+
+class Renderers(object):
+    """ Elements shared by all graphics contexts drawing to one GL context.
+
+    Elements are expensive to initialize (they hold shader programs, and text
+    needs a font manager that loads fonts), and the graphics context gets
+    recreated when resizing. Elements are created on first use, so importing
+    the backend is cheap; call `warm_up` to pay the cost up front instead.
+    """
+
+    def __init__(self):
+        self._elements = {}
+        self._font_manager = None
+
+    @property
+    def font_manager(self):
+        if self._font_manager is None:
+            self._font_manager = FontManager()
+        return self._font_manager
+
+    def get(self, element_type):
+        """ Return the element of the given type, creating it if needed. """
+        element = self._elements.get(element_type)
+        if element is None:
+            if element_type is TextElement:
+                element = TextElement(font_manager=self.font_manager)
+            else:
+                element = element_type()
+            self._elements[element_type] = element
+        return element
+
+    def warm_up(self):
+        """ Create all elements and load the default font. """
+        for element_type in ELEMENT_TYPES:
+            self.get(element_type)
+
+
+class _DefaultContext(object):
+    """ Key for renderers used when no GL context is given. """
+
+
+_DEFAULT_CONTEXT = _DefaultContext()
+
+_renderers = weakref.WeakKeyDictionary()
+
+
+def get_renderers(gl_context=None):
+    """ Return the renderers for the given vispy GL context.
+
+    Renderers are discarded with their GL context. If `gl_context` is None,
+    renderers that are shared process-wide are returned.
+    """
+    if gl_context is None:
+        gl_context = _DEFAULT_CONTEXT
+    renderers = _renderers.get(gl_context)
+    if renderers is None:
+        renderers = _renderers[gl_context] = Renderers()
+    return renderers
+
+
+def warm_up(gl_context=None):
+    """ Create renderers for `gl_context` now instead of on the first draw.
+    """
+    get_renderers(gl_context).warm_up()
 
 
 class GraphicsState(BaseGraphicsState):
@@ -27,11 +95,87 @@ class GraphicsState(BaseGraphicsState):
     def __init__(self, *args, **kwargs):
         super(GraphicsState, self).__init__(*args, **kwargs)
         self.rect_clip = None
+        #: Transform applied to points before the current transform matrix,
+        #: and the version of the points drawn with it. See
+        #: `GraphicsContext.set_data_transform`.
+        self.data_transform = identity_transform
+        self.data_version = None
+
+
+class RetainedDrawing(object):
+    """ GPU commands recorded while drawing an artist.
+
+    Each draw call is recorded with its own element, so that vertex buffers
+    stay on the GPU and can be drawn again without re-uploading.
+    """
+
+    def __init__(self):
+        self.version = None
+        #: Data-to-screen affine matrix at the time of recording.
+        self.matrix = None
+        #: List of (element, draw keyword arguments) pairs.
+        self.draws = []
+        #: Elements owned by this drawing, grouped by element type. Elements
+        #: are reused when re-recording to avoid recompiling shaders.
+        self._elements = {}
+
+    def start(self, version, matrix):
+        self.version = version
+        self.matrix = matrix.copy()
+        self.draws = []
+        self._n_used = dict.fromkeys(self._elements, 0)
+
+    def element(self, element_type):
+        """ Return an element of the given type that isn't used yet. """
+        elements = self._elements.setdefault(element_type, [])
+        n_used = self._n_used.get(element_type, 0)
+        if n_used == len(elements):
+            elements.append(element_type())
+        self._n_used[element_type] = n_used + 1
+        return elements[n_used]
+
+
+class RetainedDrawingCache(object):
+    """ Retained drawings keyed by the artists that drew them.
+
+    Keys are weakly referenced, so drawings are discarded with their artists.
+    This is owned by a window, since graphics contexts are recreated when the
+    window is resized.
+    """
+
+    def __init__(self):
+        self._drawings = weakref.WeakKeyDictionary()
+
+    def __len__(self):
+        return len(self._drawings)
+
+    def get(self, key):
+        drawing = self._drawings.get(key)
+        if drawing is None:
+            drawing = self._drawings[key] = RetainedDrawing()
+        return drawing
+
+    def clear(self):
+        self._drawings.clear()
 
 
 class GraphicsContext(object):
-
-    def __init__(self, size):
+    """ Graphics context that draws using vispy's OpenGL wrappers.
+
+    Parameters
+    ----------
+    size : (width, height)
+        Size of the drawing area.
+    drawing_cache : RetainedDrawingCache
+        If given, the context runs in retained mode: `draw_retained` reuses
+        GPU commands recorded for unchanged artists, and panning or zooming
+        only updates the model transform of those commands.
+    renderers : Renderers
+        Elements used to draw, which should be those of the current GL context
+        (see `get_renderers`). By default, process-wide renderers are used.
+    """
+
+    def __init__(self, size, drawing_cache=None, renderers=None):
         gloo.set_viewport(0, 0, *size)
 
         self._size = size
@@ -41,12 +185,60 @@ class GraphicsContext(object):
         self._state.ctm = identity_transform.copy()
         self._state_stack = [self._state]
 
-        self._line_renderer = LINE_RENDERER
-        self._marker_renderer = MARKER_RENDERER
-        self._rect_renderer = RECT_RENDERER
-        self._text_renderer = TEXT_RENDERER
+        if renderers is None:
+            renderers = get_renderers()
+        self._renderers = renderers
+
+        self._drawing_cache = drawing_cache
+        self._recording = None
 
         self._text_pos = (0, 0)
+        self._points = []
+        self._rects = []
+
+    @property
+    def retained(self):
+        """ True if drawings may be retained using `draw_retained`. """
+        return self._drawing_cache is not None
+
+    def draw_retained(self, key, version, matrix, draw_func):
+        """ Draw using `draw_func`, or replay the drawing retained for `key`.
+
+        Only line, marker, and rectangle drawing is recorded.
+
+        Parameters
+        ----------
+        key : object
+            Weak-referenceable object that owns the drawing (e.g. an artist).
+        version : object
+            Value that is compared to the version of the retained drawing; if
+            they differ, the drawing is recorded again.
+        matrix : array, shape (2, 3)
+            Affine transform from data to screen used by `draw_func`. When
+            replaying, the change from the recorded transform is applied
+            to the model transform, so vertices don't need to be uploaded.
+        draw_func : callable
+            Function that draws on this graphics context.
+        """
+        if not self.retained or self._recording is not None:
+            draw_func(self)
+            return
+
+        drawing = self._drawing_cache.get(key)
+        if drawing.draws and drawing.version == version:
+            self._replay(drawing, matrix)
+            return
+
+        drawing.start(version, matrix)
+        self._recording = drawing
+        try:
+            draw_func(self)
+        finally:
+            self._recording = None
+
+    @property
+    def _text_renderer(self):
+        return self._renderers.get(TextElement)
 
     def render(self, event):
         pass
@@ -79,6 +271,15 @@ class GraphicsContext(object):
         """
         self._state.ctm[3, :2] += (x, y)
 
+    @property
+    def text_measurement_key(self):
+        """ State that determines text extents (see `get_text_extents`).
+
+        Text is measured with the font of the text renderer, since `set_font`
+        isn't supported yet.
+        """
+        return self._text_renderer.measurement_key
+
     def get_full_text_extent(self, text):
         text_extent = self._text_renderer.get_text_extent(text)
         left, bottom, width, height = text_extent
@@ -89,6 +290,41 @@ class GraphicsContext(object):
         self._text_renderer.update(self._state, text)
         self._text_renderer.draw(self._size)
 
+    def show_texts(self, texts, points):
+        """ Draw many strings with a single draw call.
+
+        Parameters
+        ----------
+        texts : list of str
+            Strings to draw.
+        points : array, shape (N, 2)
+            Position of each string relative to the current origin.
+        """
+        self._update_renderer(self._text_renderer, self._state)
+        self._text_renderer.update_many(self._state, texts, points)
+        self._text_renderer.draw(self._size)
+
+    #: Line and marker points may be given in data space.
+    supports_data_transform = True
+
+    def set_data_transform(self, matrix, version=None):
+        """ Set (2, 3) affine transform applied to line and marker points.
+
+        This allows points to be passed in data space, so the data-to-screen
+        transform is done on the GPU. If `matrix` is None, points are in
+        screen space (the default).
+
+        If given, `version` identifies the data-space points drawn until the
+        transform is reset: it must change whenever they change, and is used
+        to skip rebuilding and uploading vertices for unchanged points.
+        """
+        if matrix is None:
+            self._state.data_transform = identity_transform
+            self._state.data_version = None
+        else:
+            self._state.data_transform = affine_to_mat4(matrix)
+            self._state.data_version = version
+
     def set_antialias(self, antialias):
         self._state.antialias = antialias
 
@@ -115,36 +351,87 @@ class GraphicsContext(object):
         points[::2] = starts
         points[1::2] = ends
 
-        self._update_renderer(self._line_renderer, self._state)
-        self._line_renderer.update(self._state, points, segments=True)
-        self._line_renderer.draw()
+        renderer = self._get_renderer(LineElement)
+        self._update_renderer(renderer, self._state)
+        renderer.update(self._state, points, segments=True)
+        self._draw_element(renderer)
+
+    def rects(self, rects):
+        """ Add rectangles, given as (x, y, width, height) rows, to the path.
+        """
+        self._rects.append(np.reshape(rects, (-1, 4)))
+
+    def rect(self, x, y, width, height):
+        self._rects.append([(x, y, width, height)])
 
     def begin_path(self):
         self._points = []
+        self._rects = []
 
     def stroke_path(self):
         if len(self._points) == 0:
             return
 
-        self._update_renderer(self._line_renderer, self._state)
-        self._line_renderer.update(self._state, self._points)
-        self._line_renderer.draw()
+        renderer = self._get_renderer(LineElement)
+        self._update_renderer(renderer, self._state)
+        renderer.update(self._state, self._points)
+        self._draw_element(renderer)
         self._points = []
 
     def fill_path(self):
-        pass
+        self._draw_path_rects(fill=True, stroke=False)
+
+    def draw_path(self, mode=FILL_STROKE):
+        fill = mode in (FILL, EOF_FILL, FILL_STROKE, EOF_FILL_STROKE)
+        stroke = mode in (STROKE, FILL_STROKE, EOF_FILL_STROKE)
+        self._draw_path_rects(fill=fill, stroke=stroke)
+        if stroke:
+            self.stroke_path()
+        self.begin_path()
 
     def draw_marker_at_points(self, points, size=5, marker='disc'):
         # XXX: TODO: pass marker shape to the element.
         kwargs = {'size': size, 'marker': 'disc'}
-        self._update_renderer(self._marker_renderer, self._state)
-        self._marker_renderer.update(self._state, points, **kwargs)
-        self._marker_renderer.draw()
+        renderer = self._get_renderer(MarkerElement)
+        self._update_renderer(renderer, self._state)
+        renderer.update(self._state, points, **kwargs)
+        self._draw_element(renderer)
 
     def draw_rect(self, rect):
-        self._update_renderer(self._rect_renderer, self._state)
-        self._rect_renderer.update(self._state, rect)
-        self._rect_renderer.draw()
+        renderer = self._get_renderer(RectElement)
+        self._update_renderer(renderer, self._state)
+        renderer.update(self._state, rect)
+        self._draw_element(renderer)
+
+    def draw_rects(self, rects, fill_colors=None, edge_colors=None):
+        """ Draw filled and stroked rectangles in a single batch.
+
+        Parameters
+        ----------
+        rects : array, shape (N, 4)
+            Rectangles given as (x, y, width, height).
+        fill_colors, edge_colors : array, shape (4,) or (N, 4)
+            RGBA colors for each rectangle. By default, the current fill and
+            stroke colors are used.
+        """
+        if len(rects) == 0:
+            return
+
+        renderer = self._get_renderer(RectElement)
+        self._update_renderer(renderer, self._state)
+        renderer.update(self._state, rects, fill_colors=fill_colors,
+                        edge_colors=edge_colors)
+        self._draw_element(renderer)
+
+    def _draw_path_rects(self, fill, stroke):
+        """ Draw all rectangles in the current path with a single element. """
+        if len(self._rects) == 0:
+            return
+
+        renderer = self._get_renderer(RectElement)
+        self._update_renderer(renderer, self._state)
+        renderer.update(self._state, np.concatenate(self._rects))
+        self._draw_element(renderer, fill=fill, stroke=stroke)
 
     @property
     def current_origin(self):
@@ -155,9 +442,37 @@ class GraphicsContext(object):
         x, y, width, height = rect
         self._state.rect_clip = (x0+x, y0+y, width, height)
 
+    def _get_renderer(self, element_type):
+        """ Return element used to draw, which is shared unless recording. """
+        if self._recording is not None:
+            return self._recording.element(element_type)
+        return self._renderers.get(element_type)
+
+    def _draw_element(self, element, **kwargs):
+        element.draw(**kwargs)
+        if self._recording is not None:
+            self._recording.draws.append((element, kwargs))
+
+    def _replay(self, drawing, matrix):
+        """ Draw retained commands with an updated data-to-screen matrix. """
+        inverse = _full_affine(invert_affine(drawing.matrix))
+        correction = affine_to_mat4(np.dot(_full_affine(matrix), inverse))
+        model = np.dot(correction, self._state.ctm)
+        for element, kwargs in drawing.draws:
+            self._update_renderer(element, self._state)
+            element['u_model'] = model
+            element.update_clip(self._state)
+            element.draw(**kwargs)
+
     def _update_renderer(self, renderer, state):
         renderer['u_projection'] = self._projection_matrix
         renderer["u_view"] = identity_transform
         renderer["u_model"] = self._state.ctm
         renderer["u_antialias"] = 1
         renderer["u_size"] = 1
+
+
+def _full_affine(matrix):
+    """ Return (3, 3) matrix for (2, 3) affine `matrix`. """
+    return np.vstack([matrix, [0, 0, 1]])
+
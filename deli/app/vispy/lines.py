@@ -1,8 +1,9 @@
 import numpy as np
 
 import OpenGL.GL as GL
+from vispy.gloo import gl
 
-from .element import GLElement, set_program_data
+from .element import GLElement
 
 
 class LineElement(GLElement):
@@ -15,18 +16,29 @@ class LineElement(GLElement):
 
         self._line_width =  state.line_width
         self._draw_as_segments = segments
+        self._program['u_data'] = state.data_transform
+
+        # The data version identifies the points of a single drawing call.
+        version = None
+        if isinstance(points, list) and len(points) == 1:
+            points = points[0]
+            version = state.data_version
+        style = tuple(np.ravel(state.line_color))
+        if self.is_same_source(points, style, version):
+            return
 
         data = create_data(np.vstack(points), color=state.line_color)
-        set_program_data(self._program, data)
+        upload_version = None if version is None else (version, style)
+        self.set_vertex_data(data, upload_version)
 
     def draw(self):
         with self._draw_context():
             GL.glLineWidth(self._line_width)
             GL.glEnable(GL.GL_LINE_SMOOTH)
             if self._draw_as_segments:
-                self._program.draw('lines')
+                self._draw_vertices(gl.GL_LINES)
             else:
-                self._program.draw('line_strip')
+                self._draw_vertices(gl.GL_LINE_STRIP)
             GL.glDisable(GL.GL_LINE_SMOOTH)
 
 
@@ -46,6 +58,7 @@ def create_data(points, line_width=3, color=(0, 0, 0, 1)):
 
 
 VERT_SHADER = """
+uniform mat4 u_data;
 uniform mat4 u_model;
 uniform mat4 u_view;
 uniform mat4 u_projection;
@@ -66,7 +79,8 @@ void main (void) {
     v_antialias = u_antialias;
     v_linewidth = a_linewidth;
 
-    gl_Position = u_projection * u_view * u_model * vec4(a_position,1.0);
+    gl_Position = u_projection * u_view * u_model * u_data *
+        vec4(a_position, 1.0);
 }
 """
 
@@ -6,7 +6,9 @@ Adapted from markers example from the vispy gallery.
 """
 import numpy as np
 
-from .element import GLElement, set_program_data
+from vispy.gloo import gl
+
+from .element import GLElement
 
 
 class MarkerElement(GLElement):
@@ -19,13 +21,20 @@ class MarkerElement(GLElement):
 
     def update(self, state, points, size=5, marker='disc'):
         super(MarkerElement, self).update(state)
+        self._program['u_data'] = state.data_transform
+
+        style = (size, tuple(np.ravel(state.fill_color)))
+        version = state.data_version
+        if self.is_same_source(points, style, version):
+            return
 
         data = create_data(points, size=size, fill_color=state.fill_color)
-        set_program_data(self._program, data)
+        upload_version = None if version is None else (version, style)
+        self.set_vertex_data(data, upload_version)
 
     def draw(self):
         with self._draw_context():
-            self._program.draw('points')
+            self._draw_vertices(gl.GL_POINTS)
 
 
 def create_data(points, size=5, line_width=1,
@@ -53,6 +62,7 @@ VERT_SHADER = """
 
 // Uniforms
 // ------------------------------------
+uniform mat4 u_data;
 uniform mat4 u_model;
 uniform mat4 u_view;
 uniform mat4 u_projection;
@@ -81,7 +91,7 @@ void main (void) {
     v_antialias = u_antialias;
     v_edge_color  = a_edge_color;
     v_fill_color  = a_fill_color;
-    gl_Position = u_projection * u_view * u_model *
+    gl_Position = u_projection * u_view * u_model * u_data *
         vec4(a_position*u_size,1.0);
     gl_PointSize = v_size + 2*(v_linewidth + 1.5*v_antialias);
 }
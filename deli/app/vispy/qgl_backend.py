@@ -33,6 +33,11 @@ class QGLBackend(QtOpenGL.QGLWidget):
         self.setSizePolicy(QtGui.QSizePolicy.Expanding,
                            QtGui.QSizePolicy.Expanding)
 
+    @property
+    def glcontext(self):
+        """ The vispy GL context of this widget. """
+        return self._glcontext
+
     def resizeEvent(self, event):
         size = event.size()
         self.resizeGL(size.width(), size.height())
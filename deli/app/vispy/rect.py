@@ -4,44 +4,101 @@ Rectangular element in vispy.
 import numpy as np
 
 import OpenGL.GL as GL
+from vispy import gloo
+from vispy.gloo import gl
 
-from .element import GLElement, set_program_data
+from .element import GLElement, PersistentBuffer
 
 
 class RectElement(GLElement):
 
     def __init__(self):
         super(RectElement, self).__init__(VERT_SHADER, FRAG_SHADER)
-
-    def update(self, state, rect):
+        self._fill_indices = PersistentBuffer(gloo.IndexBuffer)
+        self._edge_indices = PersistentBuffer(gloo.IndexBuffer)
+        self._n_rects = None
+
+    def update(self, state, rects, fill_colors=None, edge_colors=None):
+        """ Update element to draw one or more rectangles.
+
+        Parameters
+        ----------
+        state : GraphicsState
+            Graphics state used to draw rectangles.
+        rects : array, shape (4,) or (N, 4)
+            Rectangles given as (x, y, width, height).
+        fill_colors, edge_colors : array, shape (4,) or (N, 4)
+            RGBA colors for each rectangle. If not given, the fill and stroke
+            colors of `state` are used for all rectangles.
+        """
         super(RectElement, self).update(state)
 
-        self._fill_color = state.fill_color
-        self._edge_color = state.line_color
+        if fill_colors is None:
+            fill_colors = state.fill_color
+        if edge_colors is None:
+            edge_colors = state.line_color
+
+        data = create_data(rects, fill_colors, edge_colors)
+        self.set_vertex_data(data)
+        self._update_indices(len(data) // 4)
+
+    def draw(self, fill=True, stroke=True):
+        with self._draw_context():
+            if fill:
+                self._program['u_stroke'] = 0
+                self._draw_vertices(gl.GL_TRIANGLES, self._fill_indices)
+
+            if stroke:
+                GL.glEnable(GL.GL_LINE_SMOOTH)
+                self._program['u_stroke'] = 1
+                self._draw_vertices(gl.GL_LINES, self._edge_indices)
+                GL.glDisable(GL.GL_LINE_SMOOTH)
+
+    def _update_indices(self, n_rects):
+        """ Upload fill/edge indices if the number of rectangles changed. """
+        if n_rects == self._n_rects:
+            return
 
-        data = create_data(rect)
-        set_program_data(self._program, data)
+        fill_indices, edge_indices = create_indices(n_rects)
+        self._fill_indices.set_data(fill_indices)
+        self._edge_indices.set_data(edge_indices)
+        self._n_rects = n_rects
 
-    def draw(self):
-        self._program['u_color'] = self._fill_color
-        self._program.draw('triangle_strip')
 
-        GL.glEnable(GL.GL_LINE_SMOOTH)
-        self._program['u_color'] = self._edge_color
-        self._program.draw('line_strip')
-        GL.glDisable(GL.GL_LINE_SMOOTH)
+# Vertex indices of the two triangles and four edges of each rectangle.
+FILL_INDICES = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)
+EDGE_INDICES = np.array([0, 1, 1, 2, 2, 3, 3, 0], dtype=np.uint32)
 
 
-def create_data(rect):
-    """ Return data and fragment shader for markers. """
-    x0, y0, width, height = rect
+def create_data(rects, fill_colors=(1, 1, 1, 1), edge_colors=(0, 0, 0, 1)):
+    """ Return vertex data for rectangles.
+
+    Each rectangle is expanded into its four corners, and each corner stores
+    the fill and edge color of its rectangle, so that rectangles with
+    different colors can be drawn in a single draw call.
+    """
+    rects = np.atleast_2d(np.asarray(rects, dtype=np.float32))
+    x0, y0, width, height = rects.T
     x1, y1 = x0 + width, y0 + height
-    points = [(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)]
-    positions = np.hstack([points, np.zeros((len(points), 1))])
 
-    data = np.zeros(len(positions), dtype=[('a_position', np.float32, 3)])
-    data['a_position'] = positions
-    return data
+    n_rects = len(rects)
+    data = np.zeros((n_rects, 4), dtype=[('a_position', np.float32, 3),
+                                         ('a_fill_color', np.float32, 4),
+                                         ('a_edge_color', np.float32, 4)])
+    data['a_position'][:, :, 0] = np.column_stack([x0, x1, x1, x0])
+    data['a_position'][:, :, 1] = np.column_stack([y0, y0, y1, y1])
+    # Insert an axis so per-rect colors are repeated for each corner.
+    data['a_fill_color'] = np.asarray(fill_colors)[..., np.newaxis, :]
+    data['a_edge_color'] = np.asarray(edge_colors)[..., np.newaxis, :]
+    return data.ravel()
+
+
+def create_indices(n_rects):
+    """ Return fill and edge indices into vertex data for `n_rects`. """
+    offsets = 4 * np.arange(n_rects, dtype=np.uint32)[:, np.newaxis]
+    fill_indices = (offsets + FILL_INDICES).ravel()
+    edge_indices = (offsets + EDGE_INDICES).ravel()
+    return fill_indices, edge_indices
 
 
 VERT_SHADER = """
@@ -54,17 +111,20 @@ uniform mat4 u_view;
 uniform mat4 u_projection;
 uniform float u_antialias;
 uniform float u_size;
-uniform vec4 u_color;
+uniform float u_stroke;
 
 // Attributes
 // ------------------------------------
 attribute vec3  a_position;
+attribute vec4  a_fill_color;
+attribute vec4  a_edge_color;
 
 // Varyings
 // ------------------------------------
 varying vec4 v_color;
 
 void main (void) {
+    v_color = mix(a_fill_color, a_edge_color, u_stroke);
     gl_Position = u_projection * u_view * u_model * vec4(a_position,1.0);
 }
 """
@@ -73,15 +133,15 @@ void main (void) {
 FRAG_SHADER = """
 #version 120
 
-// Constants
+// Varyings
 // ------------------------------------
-uniform vec4 u_color;
+varying vec4 v_color;
 
 
 // Main
 // ------------------------------------
 void main()
 {
-    gl_FragColor = u_color;
+    gl_FragColor = v_color;
 }
 """
@@ -0,0 +1,129 @@
+import numpy as np
+from mock import MagicMock, patch
+from numpy.testing import assert_equal
+from vispy.gloo import gl as vispy_gl
+
+from deli.app.vispy.element import PersistentBuffer
+from deli.app.vispy.graphics_context import GraphicsState
+from deli.app.vispy.lines import LineElement
+from deli.app.vispy.markers import MarkerElement
+from deli.app.vispy.rect import RectElement
+
+
+class FakeBuffer(object):
+    """ Stand-in for a gloo buffer that records uploads. """
+
+    def __init__(self, data):
+        self.data = data.copy()
+        self.uploads = []
+
+    def set_subdata(self, data, offset=0, copy=False):
+        self.uploads.append(data.copy())
+        self.data[offset:offset + len(data)] = data
+
+
+def test_buffer_created_with_min_capacity():
+    buffer = PersistentBuffer(FakeBuffer, min_capacity=16)
+    assert buffer.set_data(np.arange(5.0))
+    assert buffer.capacity == 16
+    assert buffer.size == 5
+    assert_equal(buffer.buffer.data[:5], np.arange(5.0))
+
+
+def test_buffer_reused_when_data_fits():
+    buffer = PersistentBuffer(FakeBuffer, min_capacity=16)
+    buffer.set_data(np.arange(5.0))
+    gpu_buffer = buffer.buffer
+
+    assert not buffer.set_data(np.arange(10.0))
+    assert buffer.buffer is gpu_buffer
+    assert buffer.size == 10
+    # Only the elements in use are uploaded.
+    assert_equal(gpu_buffer.uploads[-1], np.arange(10.0))
+
+
+def test_buffer_grows_geometrically():
+    buffer = PersistentBuffer(FakeBuffer, min_capacity=4)
+    buffer.set_data(np.arange(4.0))
+    assert buffer.set_data(np.arange(5.0))
+    assert buffer.capacity == 8
+    assert buffer.set_data(np.arange(20.0))
+    assert buffer.capacity == 20
+
+
+def test_buffer_skips_upload_of_unchanged_data():
+    buffer = PersistentBuffer(FakeBuffer, min_capacity=16)
+    buffer.set_data(np.arange(5.0))
+    buffer.set_data(np.arange(5.0))
+    assert buffer.buffer.uploads == []
+
+
+def test_buffer_skips_comparison_for_same_version():
+    buffer = PersistentBuffer(FakeBuffer, min_capacity=16)
+    buffer.set_data(np.arange(5.0), version=1)
+    data = MagicMock(__len__=MagicMock(return_value=5), dtype=np.float64)
+    with patch('deli.app.vispy.element._same_bytes') as same_bytes:
+        assert not buffer.set_data(data, version=1)
+    assert not same_bytes.called
+    assert buffer.buffer.uploads == []
+
+
+def test_buffer_uploads_new_version():
+    buffer = PersistentBuffer(FakeBuffer, min_capacity=16)
+    buffer.set_data(np.arange(5.0), version=1)
+    buffer.set_data(np.arange(5.0) + 1, version=2)
+    assert_equal(buffer.buffer.uploads[-1], np.arange(5.0) + 1)
+
+
+def test_is_same_source_by_identity():
+    element = LineElement()
+    points = np.zeros((3, 2))
+    points.flags.writeable = False
+    assert not element.is_same_source(points, 'style')
+    assert element.is_same_source(points, 'style')
+    assert not element.is_same_source(points, 'other style')
+    assert not element.is_same_source(points.copy(), 'other style')
+
+
+def test_is_same_source_ignores_writeable_arrays():
+    element = LineElement()
+    points = np.zeros((3, 2))
+    element.is_same_source(points, 'style')
+    assert not element.is_same_source(points, 'style')
+
+
+def test_is_same_source_by_version():
+    element = LineElement()
+    assert not element.is_same_source(np.zeros((3, 2)), 'style', version=1)
+    assert element.is_same_source(np.zeros((3, 2)), 'style', version=1)
+    assert not element.is_same_source(np.zeros((3, 2)), 'style', version=2)
+
+
+def test_versioned_points_are_not_rebuilt():
+    element = MarkerElement()
+    state = GraphicsState()
+    state.data_version = 7
+    element.update(state, np.zeros((3, 2)))
+    with patch('deli.app.vispy.markers.create_data') as create_data:
+        element.update(state, np.zeros((3, 2)))
+    assert not create_data.called
+
+
+@patch('deli.app.vispy.element.gl')
+def test_draw_excludes_spare_capacity(gl):
+    element = LineElement()
+    element.update(GraphicsState(), np.zeros((3, 2)))
+    assert element._vertex_buffer.capacity > 3
+    element._program = MagicMock()
+    element.draw()
+    gl.glDrawArrays.assert_called_once_with(vispy_gl.GL_LINE_STRIP, 0, 3)
+
+
+@patch('deli.app.vispy.element.gl')
+def test_draw_indexed_excludes_spare_capacity(gl):
+    element = RectElement()
+    element.update(GraphicsState(), np.array([(0, 0, 10, 10.0)]))
+    element._program = MagicMock()
+    element.draw(fill=True, stroke=False)
+    gl.glDrawElements.assert_called_once_with(vispy_gl.GL_TRIANGLES, 6,
+                                              gl.GL_UNSIGNED_INT, None)
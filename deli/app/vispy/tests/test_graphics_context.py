@@ -0,0 +1,163 @@
+import gc as garbage_collector
+
+import numpy as np
+from mock import MagicMock, patch
+from numpy.testing import assert_allclose
+
+from deli.app.vispy.graphics_context import (
+    ELEMENT_TYPES, GraphicsContext, RetainedDrawingCache, _renderers,
+    get_renderers, warm_up
+)
+from deli.app.vispy.lines import LineElement
+from deli.app.vispy.markers import MarkerElement
+from deli.app.vispy.text import TextElement
+
+
+SIZE = (200, 100)
+POINTS = np.array([(1.0, 2.0), (3.0, 4.0)])
+
+
+class Key(object):
+    """ Weak-referenceable key for retained drawings. """
+
+
+def create_gc(drawing_cache=None):
+    with patch('deli.app.vispy.graphics_context.gloo'):
+        return GraphicsContext(SIZE, drawing_cache=drawing_cache,
+                               renderers=MagicMock())
+
+
+def draw_markers(gc):
+    gc.draw_marker_at_points(POINTS)
+
+
+def to_screen(model, points):
+    """ Apply a model matrix (row-vector convention) to 2D points. """
+    rows = np.column_stack([points, np.zeros(len(points)),
+                            np.ones(len(points))])
+    return np.dot(rows, model)[:, :2]
+
+
+@patch.object(MarkerElement, 'draw')
+def test_drawing_is_recorded_and_replayed(draw):
+    cache = RetainedDrawingCache()
+    gc = create_gc(cache)
+    key = Key()
+    matrix = np.array([[1.0, 0, 0], [0, 1, 0]])
+    draw_func = MagicMock(side_effect=draw_markers)
+
+    gc.draw_retained(key, 1, matrix, draw_func)
+    gc.draw_retained(key, 1, matrix, draw_func)
+    assert draw_func.call_count == 1
+    assert draw.call_count == 2
+    assert len(cache) == 1
+
+
+@patch.object(MarkerElement, 'draw')
+def test_new_version_is_recorded_again(draw):
+    cache = RetainedDrawingCache()
+    gc = create_gc(cache)
+    key = Key()
+    matrix = np.array([[1.0, 0, 0], [0, 1, 0]])
+    draw_func = MagicMock(side_effect=draw_markers)
+
+    gc.draw_retained(key, 1, matrix, draw_func)
+    element = cache.get(key).draws[0][0]
+    gc.draw_retained(key, 2, matrix, draw_func)
+    assert draw_func.call_count == 2
+    # Elements of the drawing are reused when it's recorded again.
+    assert cache.get(key).draws == [(element, {})]
+
+
+@patch.object(MarkerElement, 'draw')
+def test_replay_corrects_for_new_transform(draw):
+    cache = RetainedDrawingCache()
+    gc = create_gc(cache)
+    key = Key()
+    recorded = np.array([[2.0, 0, 5], [0, 3, -1]])
+    current = np.array([[4.0, 0, 10], [0, 1, 20]])
+    gc.draw_retained(key, 1, recorded, draw_markers)
+    gc.draw_retained(key, 1, current, draw_markers)
+
+    element = cache.get(key).draws[0][0]
+    model = np.reshape(element._program['u_model'], (4, 4))
+    # Vertices were recorded in screen space using the recorded transform.
+    recorded_points = np.dot(POINTS, recorded[:, :2].T) + recorded[:, 2]
+    expected = np.dot(POINTS, current[:, :2].T) + current[:, 2]
+    assert_allclose(to_screen(model, recorded_points), expected, rtol=1e-5)
+
+
+def test_not_retained_without_cache():
+    gc = create_gc()
+    draw_func = MagicMock()
+    assert not gc.retained
+    gc.draw_retained(Key(), 1, np.eye(2, 3), draw_func)
+    gc.draw_retained(Key(), 1, np.eye(2, 3), draw_func)
+    assert draw_func.call_count == 2
+
+
+def test_drawings_are_discarded_with_their_key():
+    cache = RetainedDrawingCache()
+    key = Key()
+    drawing = cache.get(key)
+    assert cache.get(key) is drawing
+    del key
+    garbage_collector.collect()
+    assert len(cache) == 0
+
+
+def test_cache_clear():
+    cache = RetainedDrawingCache()
+    key = Key()
+    drawing = cache.get(key)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get(key) is not drawing
+
+
+# -------------------------------------------------------------------------
+#  Renderers
+# -------------------------------------------------------------------------
+
+class FakeGLContext(object):
+    """ Weak-referenceable stand-in for a vispy GL context. """
+
+
+def test_renderers_are_per_gl_context():
+    context = FakeGLContext()
+    renderers = get_renderers(context)
+    assert get_renderers(context) is renderers
+    assert get_renderers(FakeGLContext()) is not renderers
+    assert get_renderers() is get_renderers()
+    assert get_renderers() is not renderers
+
+
+def test_renderers_are_discarded_with_gl_context():
+    context = FakeGLContext()
+    get_renderers(context)
+    n_renderers = len(_renderers)
+    del context
+    garbage_collector.collect()
+    assert len(_renderers) == n_renderers - 1
+
+
+@patch('deli.app.vispy.graphics_context.FontManager')
+def test_elements_are_created_lazily(font_manager_type):
+    renderers = get_renderers(FakeGLContext())
+    assert not font_manager_type.called
+    element = renderers.get(LineElement)
+    assert renderers.get(LineElement) is element
+    assert not font_manager_type.called
+
+
+@patch('deli.app.vispy.graphics_context.FontManager')
+@patch.object(TextElement, '__init__', return_value=None)
+def test_warm_up(text_init, font_manager_type):
+    context = FakeGLContext()
+    warm_up(context)
+    renderers = get_renderers(context)
+    assert font_manager_type.call_count == 1
+    text_init.assert_called_once_with(
+        font_manager=font_manager_type.return_value)
+    for element_type in ELEMENT_TYPES:
+        assert isinstance(renderers._elements[element_type], element_type)
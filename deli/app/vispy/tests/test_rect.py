@@ -0,0 +1,73 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+
+from deli.app.vispy.graphics_context import GraphicsState
+from deli.app.vispy.rect import RectElement, create_data, create_indices
+
+
+RECTS = np.array([(0, 0, 10, 20), (30, 40, 5, 5)], dtype=float)
+RED = (1, 0, 0, 1)
+BLUE = (0, 0, 1, 1)
+
+
+def test_create_data_corners():
+    data = create_data(RECTS)
+    assert len(data) == 8
+    assert_allclose(data['a_position'][:4, :2],
+                    [(0, 0), (10, 0), (10, 20), (0, 20)])
+    assert_allclose(data['a_position'][4:, :2],
+                    [(30, 40), (35, 40), (35, 45), (30, 45)])
+    assert_allclose(data['a_position'][:, 2], 0)
+
+
+def test_create_data_single_rect():
+    data = create_data((1, 2, 3, 4))
+    assert_allclose(data['a_position'][:, :2],
+                    [(1, 2), (4, 2), (4, 6), (1, 6)])
+
+
+def test_create_data_shared_colors():
+    data = create_data(RECTS, fill_colors=RED, edge_colors=BLUE)
+    assert_allclose(data['a_fill_color'], [RED] * 8)
+    assert_allclose(data['a_edge_color'], [BLUE] * 8)
+
+
+def test_create_data_per_rect_colors():
+    data = create_data(RECTS, fill_colors=[RED, BLUE],
+                       edge_colors=[BLUE, RED])
+    assert_allclose(data['a_fill_color'], [RED] * 4 + [BLUE] * 4)
+    assert_allclose(data['a_edge_color'], [BLUE] * 4 + [RED] * 4)
+
+
+def test_create_indices():
+    fill_indices, edge_indices = create_indices(2)
+    assert fill_indices.dtype == np.uint32
+    assert_equal(fill_indices, [0, 1, 2, 0, 2, 3, 4, 5, 6, 4, 6, 7])
+    assert_equal(edge_indices, [0, 1, 1, 2, 2, 3, 3, 0,
+                                4, 5, 5, 6, 6, 7, 7, 4])
+
+
+def test_create_indices_empty():
+    fill_indices, edge_indices = create_indices(0)
+    assert len(fill_indices) == 0
+    assert len(edge_indices) == 0
+
+
+def test_update_uploads_vertices_and_indices():
+    element = RectElement()
+    state = GraphicsState()
+    element.update(state, RECTS, fill_colors=[RED, BLUE])
+
+    assert element._vertex_buffer.size == 8
+    assert element._fill_indices.size == 12
+    assert element._edge_indices.size == 16
+
+
+def test_update_keeps_indices_for_same_number_of_rects():
+    element = RectElement()
+    state = GraphicsState()
+    element.update(state, RECTS)
+    fill_buffer = element._fill_indices.buffer
+    element.update(state, RECTS + 1)
+    assert element._fill_indices.buffer is fill_buffer
+    assert element._n_rects == 2
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+
+import numpy as np
+from mock import MagicMock, patch
+from numpy.testing import assert_allclose, assert_equal
+
+from deli.app.vispy import text
+from deli.app.vispy.text import (
+    TEXT_LAYOUT_CACHE, TextElement, _get_text_layout, _layout_text
+)
+
+
+class FakeFont(object):
+    """ Font with made-up glyph metrics, which doesn't need a GL context. """
+
+    ratio = 2.0
+    slop = 1.0
+    _lowres_size = 64
+
+    def __getitem__(self, char):
+        code = ord(char)
+        return {'offset': (code % 3, 10 + code % 7),
+                'size': (5 + code % 4, 12 + code % 5),
+                'texcoords': (code / 1000, code / 2000,
+                              code / 1000 + 0.01, code / 2000 + 0.02),
+                'advance': 6 + code % 5,
+                'kerning': {u'A': -1.5} if char == u'V' else {}}
+
+
+def layout_text_per_glyph(text, font, anchor_x, anchor_y, lowres_size):
+    """ Layout of the original implementation, which loops over glyphs. """
+    positions = []
+    texcoords = []
+    prev = None
+    width = height = ascender = descender = 0
+    ratio, slop = 1. / font.ratio, font.slop
+    x_off = -slop
+    for char in text:
+        glyph = font[char]
+        kerning = glyph['kerning'].get(prev, 0.) * ratio
+        x0 = x_off + glyph['offset'][0] * ratio + kerning
+        y0 = glyph['offset'][1] * ratio + slop
+        x1 = x0 + glyph['size'][0]
+        y1 = y0 - glyph['size'][1]
+        u0, v0, u1, v1 = glyph['texcoords']
+        positions.extend([[x0, y0], [x0, y1], [x1, y1], [x1, y0]])
+        texcoords.extend([[u0, v0], [u0, v1], [u1, v1], [u1, v0]])
+        x_move = glyph['advance'] * ratio + kerning
+        x_off += x_move
+        width += x_move
+        ascender = max(ascender, y0 - slop)
+        descender = min(descender, y1 + slop)
+        height = max(height, glyph['size'][1] - 2*slop)
+        prev = char
+
+    for char in 'hy':
+        glyph = font[char]
+        y0 = glyph['offset'][1] * ratio + slop
+        y1 = y0 - glyph['size'][1]
+        ascender = max(ascender, y0 - slop)
+        descender = min(descender, y1 + slop)
+        height = max(height, glyph['size'][1] - 2*slop)
+
+    width -= glyph['advance'] * ratio - (glyph['size'][0] - 2*slop)
+    dx = dy = 0
+    if anchor_y == 'top':
+        dy = -ascender
+    elif anchor_y in ('center', 'middle'):
+        dy = -(height / 2 + descender)
+    elif anchor_y == 'bottom':
+        dy = -descender
+    if anchor_x == 'right':
+        dx = -width
+    elif anchor_x == 'center':
+        dx = -width / 2.
+
+    positions = (np.array(positions) + (dx, dy)) / lowres_size
+    return positions, np.array(texcoords), (0, descender, width,
+                                            height - descender)
+
+
+def patch_viewport():
+    return patch.multiple(text, get_parameter=MagicMock(return_value=(0, 0)),
+                          set_viewport=MagicMock())
+
+
+def create_element(**traits):
+    font_manager = MagicMock()
+    font_manager.get_font.return_value = FakeFont()
+    return TextElement(font_manager=font_manager, **traits)
+
+
+def test_layout_matches_per_glyph_layout():
+    font = FakeFont()
+    for string in [u'0.5', u'AVAV', u'hy', u'x']:
+        for anchor_x in ('left', 'center', 'right'):
+            for anchor_y in ('top', 'center', 'baseline', 'bottom'):
+                with patch_viewport():
+                    vertices, extent = _layout_text(string, font, anchor_x,
+                                                    anchor_y, 64)
+                positions, texcoords, expected_extent = \
+                    layout_text_per_glyph(string, font, anchor_x, anchor_y, 64)
+                assert_allclose(vertices['a_position'], positions,
+                                rtol=1e-5, atol=1e-6)
+                assert_allclose(vertices['a_texcoord'], texcoords, rtol=1e-5)
+                assert_allclose(extent, expected_extent)
+
+
+def test_layout_cache_holds_no_gpu_buffers():
+    TEXT_LAYOUT_CACHE.clear()
+    font = FakeFont()
+    with patch_viewport():
+        layout = _get_text_layout(u'12', font, 'left', 'baseline', 64)
+        assert _get_text_layout('12', font, 'left', 'baseline', 64) is layout
+    assert TEXT_LAYOUT_CACHE.stats['hits'] == 1
+    vertices, extent = layout
+    assert isinstance(vertices, np.ndarray)
+    assert len(extent) == 4
+
+
+def test_gpu_buffers_are_per_element():
+    first = create_element()
+    second = create_element()
+    with patch_viewport():
+        buffers = first._get_buffers(u'10')
+        assert first._get_buffers(u'10') is buffers
+        other_buffers = second._get_buffers(u'10')
+    assert other_buffers[0] is not buffers[0]
+    assert other_buffers[1] is not buffers[1]
+    assert_equal(other_buffers[1].size, 6 * 2)
+
+
+def test_update_many_concatenates_strings():
+    element = create_element()
+    state = MagicMock(line_color=(0, 0, 0, 1), rect_clip=None)
+    offsets = np.array([(0.0, 0.0), (50.0, 10.0)])
+    with patch_viewport():
+        element.update_many(state, [u'1', u'20'], offsets)
+        one, _ = _get_text_layout(u'1', element._font, 'left', 'baseline', 64)
+
+    vertices = element._batch_vertices._staging[:element._batch_vertices.size]
+    assert len(vertices) == 4 * 3
+    assert_allclose(vertices['a_offset'], [(0, 0)] * 4 + [(50, 10)] * 8)
+    assert_allclose(vertices['a_position'][:4], one['a_position'])
+    assert element._batch_indices.size == 6 * 3
+    assert element.text == u'120'
+
+
+@patch('deli.app.vispy.element.gl')
+def test_draw_many_in_one_call(gl):
+    element = create_element()
+    element._program = MagicMock()
+    state = MagicMock(line_color=(0, 0, 0, 1), rect_clip=None)
+    with patch_viewport():
+        element.update_many(state, [u'1', u'20', u'300'], np.zeros((3, 2)))
+    element._font._atlas = np.zeros((8, 8))
+    element._font._kernel = None
+    with patch.object(text, 'set_state'):
+        element.draw((100, 100))
+    assert gl.glDrawElements.call_count == 1
+    assert gl.glDrawElements.call_args[0][1] == 6 * 6
+
+
+def test_measurement_key_depends_on_font():
+    assert (create_element().measurement_key ==
+            create_element().measurement_key)
+    assert (create_element(font_size=12).measurement_key !=
+            create_element().measurement_key)
+    assert (create_element(face='Arial').measurement_key !=
+            create_element().measurement_key)
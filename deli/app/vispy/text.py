@@ -10,86 +10,127 @@ XXX: This is mostly copied from `vispy.scene.visuals.text` and needs to be
 from __future__ import division
 
 import sys
+import weakref
 
 import numpy as np
 
 from vispy.gloo import (set_state, IndexBuffer, VertexBuffer, set_viewport,
                         get_parameter)
+from vispy.gloo import gl
 from vispy.gloo.wrappers import _check_valid
 from vispy.ext.six import string_types
 from vispy.color import Color
 from vispy.scene.visuals.text.text import FontManager
 
-from .element import GLElement
+from ...utils.data_structures import LRUCache
+from .element import GLElement, PersistentBuffer
 
 
-# Note that initializing the font manager is very costly.
-FONT_MANAGER = FontManager()
 ANCHOR_Y_ENUM = ('top', 'center', 'middle', 'baseline', 'bottom')
 ANCHOR_X_ENUM = ('left', 'center', 'right')
 BLEND_FUNC = ('src_alpha', 'one_minus_src_alpha')
+#: Glyph vertices; `a_offset` is the position of a string in a batch of text.
+TEXT_VTYPE = np.dtype([('a_position', 'f4', 2),
+                       ('a_texcoord', 'f4', 2),
+                       ('a_offset', 'f4', 2)])
+
+
+#: Laid-out text (vertices and extent) keyed by text, font, anchors, and
+#: resolution. Axis labels draw the same strings on every frame, so this
+#: avoids repeating the layout. Only CPU-side arrays are cached here, since
+#: GPU buffers belong to the GL context that created them; each text element
+#: caches the buffers it uploads (see `TextElement`).
+TEXT_LAYOUT_CACHE = LRUCache(max_size=1024)
+
+
+_default_font_manager = None
+
+
+def get_font_manager():
+    """ Return the default font manager, which is created on first use.
+
+    Note that initializing the font manager is very costly.
+    """
+    global _default_font_manager
+    if _default_font_manager is None:
+        _default_font_manager = FontManager()
+    return _default_font_manager
 
 
 def rect_extents_to_corners(x0, y0, x1, y1):
-    return [[x0, y0], [x0, y1], [x1, y1], [x1, y0]]
+    """ Return (4*N, 2) array of corners for arrays of N rect extents. """
+    corners = [[x0, y0], [x0, y1], [x1, y1], [x1, y0]]
+    # Transpose from (corner, xy, rect) to (rect, corner, xy).
+    return np.transpose(corners, (2, 0, 1)).reshape(-1, 2)
 
 
-def _text_to_vbo(text, font, anchor_x, anchor_y, lowres_size):
-    """Convert text characters to vertex buffer object."""
-    # XXX: This function may benefit from a LRU cache.
+def _get_text_layout(text, font, anchor_x, anchor_y, lowres_size):
+    """Return vertices and extent of laid-out text.
 
-    text_vtype = np.dtype([('a_position', 'f4', 2),
-                           ('a_texcoord', 'f4', 2)])
-    vertices = np.zeros(len(text) * 4, dtype=text_vtype)
-    prev = None
-    width = height = ascender = descender = 0
-    ratio, slop = 1. / font.ratio, font.slop
-    x_off = -slop
+    Results are cached in `TEXT_LAYOUT_CACHE`, so the vertices must not be
+    modified.
+    """
+    text = _as_unicode(text)
+    key = (text, font, anchor_x, anchor_y, lowres_size)
+    layout = TEXT_LAYOUT_CACHE.get(key)
+    if layout is None:
+        layout = _layout_text(text, font, anchor_x, anchor_y, lowres_size)
+        TEXT_LAYOUT_CACHE[key] = layout
+    return layout
+
+
+def _as_unicode(text):
     # Need to make sure we have a unicode string here (Py2.7 mis-interprets
     # characters like "•" otherwise)
     if sys.version[0] == '2' and isinstance(text, str):
         text = text.decode('utf-8')
-    # Need to store the original viewport, because the font[char] will
-    # trigger SDF rendering, which changes our viewport
-    orig_viewport = get_parameter('viewport')
-
-    positions = []
-    texcoords = []
-    # XXX: Iterating over characters in Python is a really bad idea.
-    for char in text:
-        glyph = font[char]
-        kerning = glyph['kerning'].get(prev, 0.) * ratio
-        x0 = x_off + glyph['offset'][0] * ratio + kerning
-        y0 = glyph['offset'][1] * ratio + slop
-        x1 = x0 + glyph['size'][0]
-        y1 = y0 - glyph['size'][1]
-        u0, v0, u1, v1 = glyph['texcoords']
-        positions.extend(rect_extents_to_corners(x0, y0, x1, y1))
-        texcoords.extend(rect_extents_to_corners(u0, v0, u1, v1))
-        x_move = glyph['advance'] * ratio + kerning
-        x_off += x_move
-        width += x_move
-        ascender = max(ascender, y0 - slop)
-        descender = min(descender, y1 + slop)
-        height = max(height, glyph['size'][1] - 2*slop)
-        prev = char
-    vertices['a_position'] = positions
-    vertices['a_texcoord'] = texcoords
+    return text
+
+
+def _glyph_indices(n_glyphs):
+    """Return triangle indices for `n_glyphs` consecutive glyph quads."""
+    idx = (np.array([0, 1, 2, 0, 2, 3], np.uint32) +
+           np.arange(0, 4*n_glyphs, 4, dtype=np.uint32)[:, np.newaxis])
+    return idx.ravel()
+
+
+def _layout_text(text, font, anchor_x, anchor_y, lowres_size):
+    """Return vertices and extent of text characters."""
+    vertices = np.zeros(len(text) * 4, dtype=TEXT_VTYPE)
+    ratio, slop = 1. / font.ratio, font.slop
+
+    metrics = _get_glyph_metrics(font)
+    idx = metrics.indices(text)
+    kerning = metrics.kerning(text, idx) * ratio
+    offsets = metrics.offsets[idx] * ratio
+    sizes = metrics.sizes[idx]
+
+    x_move = metrics.advances[idx] * ratio + kerning
+    x_off = -slop + np.concatenate([[0], np.cumsum(x_move)[:-1]])
+    x0 = x_off + offsets[:, 0] + kerning
+    y0 = offsets[:, 1] + slop
+    x1 = x0 + sizes[:, 0]
+    y1 = y0 - sizes[:, 1]
+    u0, v0, u1, v1 = metrics.texcoords[idx].T
+    vertices['a_position'] = rect_extents_to_corners(x0, y0, x1, y1)
+    vertices['a_texcoord'] = rect_extents_to_corners(u0, v0, u1, v1)
+    width = x_move.sum()
 
     # Also analyse chars with large ascender and descender, otherwise the
     # vertical alignment can be very inconsistent
-    for char in 'hy':
-        glyph = font[char]
-        y0 = glyph['offset'][1] * ratio + slop
-        y1 = y0 - glyph['size'][1]
-        ascender = max(ascender, y0 - slop)
-        descender = min(descender, y1 + slop)
-        height = max(height, glyph['size'][1] - 2*slop)
-
-    set_viewport(*orig_viewport)
+    hy_idx = metrics.indices(u'hy')
+    hy_y0 = metrics.offsets[hy_idx, 1] * ratio + slop
+    hy_y1 = hy_y0 - metrics.sizes[hy_idx, 1]
+    ascender = max(0, np.max(np.append(y0, hy_y0)) - slop)
+    descender = min(0, np.min(np.append(y1, hy_y1)) + slop)
+    heights = np.append(sizes[:, 1], metrics.sizes[hy_idx, 1])
+    height = max(0, np.max(heights) - 2*slop)
 
     # Tight bounding box (loose would be width, font.height /.asc / .desc)
-    width -= glyph['advance'] * ratio - (glyph['size'][0] - 2*slop)
+    # XXX: This uses the metrics of the last glyph analysed above ('y').
+    i_last = hy_idx[-1]
+    width -= (metrics.advances[i_last] * ratio -
+              (metrics.sizes[i_last, 0] - 2*slop))
     dx = dy = 0
 
     if anchor_y == 'top':
@@ -109,7 +150,69 @@ def _text_to_vbo(text, font, anchor_x, anchor_y, lowres_size):
 
     # XXX: Subtract descender to include that in the height
     text_extent = (0, descender, width, height - descender)
-    return VertexBuffer(vertices), text_extent
+    return vertices, text_extent
+
+
+class GlyphMetrics(object):
+    """ Glyph metrics of a font stored in arrays for vectorized text layout.
+
+    Glyphs are loaded from the font (which renders them to the font atlas)
+    the first time they're used.
+    """
+
+    def __init__(self, font):
+        self._font = font
+        self._index = {}
+        self.offsets = np.zeros((0, 2))
+        self.sizes = np.zeros((0, 2))
+        self.texcoords = np.zeros((0, 4))
+        self.advances = np.zeros(0)
+        self._has_kerning = np.zeros(0, dtype=bool)
+
+    def indices(self, text):
+        """ Return array of glyph indices for characters in `text`. """
+        new_chars = set(text).difference(self._index)
+        if new_chars:
+            self._add_glyphs(sorted(new_chars))
+        return np.fromiter((self._index[char] for char in text),
+                           dtype=int, count=len(text))
+
+    def kerning(self, text, idx):
+        """ Return kerning of each character relative to the previous one. """
+        if not self._has_kerning[idx].any():
+            return np.zeros(len(text))
+        prev_chars = [None] + list(text[:-1])
+        return np.array([self._font[char]['kerning'].get(prev, 0.)
+                         for prev, char in zip(prev_chars, text)])
+
+    def _add_glyphs(self, chars):
+        # Need to store the original viewport, because the font[char] will
+        # trigger SDF rendering, which changes our viewport
+        orig_viewport = get_parameter('viewport')
+        glyphs = [self._font[char] for char in chars]
+        set_viewport(*orig_viewport)
+
+        for char in chars:
+            self._index[char] = len(self._index)
+        self.offsets = np.vstack([self.offsets,
+                                  [g['offset'][:2] for g in glyphs]])
+        self.sizes = np.vstack([self.sizes, [g['size'] for g in glyphs]])
+        self.texcoords = np.vstack([self.texcoords,
+                                    [g['texcoords'] for g in glyphs]])
+        self.advances = np.append(self.advances,
+                                  [g['advance'] for g in glyphs])
+        self._has_kerning = np.append(self._has_kerning,
+                                      [bool(g['kerning']) for g in glyphs])
+
+
+_GLYPH_METRICS = weakref.WeakKeyDictionary()
+
+
+def _get_glyph_metrics(font):
+    metrics = _GLYPH_METRICS.get(font)
+    if metrics is None:
+        metrics = _GLYPH_METRICS[font] = GlyphMetrics(font)
+    return metrics
 
 
 class TextElement(GLElement):
@@ -154,11 +257,13 @@ class TextElement(GLElement):
 
         attribute vec2 a_position; // in point units
         attribute vec2 a_texcoord;
+        attribute vec2 a_offset;  // position of string relative to anchor
 
         varying vec2 v_texcoord;
 
         void main(void) {
-            vec4 pos = u_projection * u_view * u_model * vec4(u_pos, 0.0, 1.0);
+            vec4 pos = u_projection * u_view * u_model *
+                       vec4(u_pos + a_offset, 0.0, 1.0);
             mat2 rot = mat2(cos(u_rotation), -sin(u_rotation),
                             sin(u_rotation), cos(u_rotation));
             gl_Position = pos + vec4(rot * a_position * u_scale, 0., 0.);
@@ -293,13 +398,20 @@ class TextElement(GLElement):
 
         # Init font handling stuff
         # _font_manager is a temporary solution to use global mananger
-        self._font_manager = font_manager or FONT_MANAGER
+        self._font_manager = font_manager or get_font_manager()
         self._font = self._font_manager.get_font(face, bold, italic)
+        self._face = (face, bold, italic)
         self._vertices = None
         self._anchors = (anchor_x, anchor_y)
+        # Vertex and index buffers of recently drawn strings. These are kept
+        # per element, since elements are created for each GL context.
+        self._buffers = LRUCache(max_size=256)
         # Init text properties
         self.color = color
         self.text = text
+        # Buffers for drawing many strings at once; see `update_many`.
+        self._batch_vertices = PersistentBuffer(VertexBuffer)
+        self._batch_indices = PersistentBuffer(IndexBuffer)
         self.font_size = font_size
         self.pos = pos
         self.rotation = rotation
@@ -309,6 +421,28 @@ class TextElement(GLElement):
         self.text = text
         self.color = state.line_color
 
+    def update_many(self, state, texts, offsets):
+        """ Update element to draw many strings with a single draw call.
+
+        Glyphs of all strings are concatenated into one vertex buffer, where
+        each vertex stores the offset of its string from `pos`.
+        """
+        super(TextElement, self).update(state)
+        self.color = state.line_color
+        anchor_x, anchor_y = self._anchors
+        lowres_size = self._font._lowres_size
+        layouts = [_get_text_layout(text, self._font, anchor_x, anchor_y,
+                                    lowres_size)[0] for text in texts]
+        n_vertices = [len(vertices) for vertices in layouts]
+        vertices = np.concatenate(layouts)
+        vertices['a_offset'] = np.repeat(offsets, n_vertices, axis=0)
+
+        self.text = u''.join(_as_unicode(text) for text in texts)
+        self._batch_vertices.set_data(vertices)
+        self._batch_indices.set_data(_glyph_indices(len(vertices) // 4))
+        self._vertices = self._batch_vertices.buffer
+        self._ib = self._batch_indices
+
     @property
     def text(self):
         """The text string"""
@@ -362,16 +496,35 @@ class TextElement(GLElement):
         assert len(pos) == 2
         self._pos = tuple(pos)
 
+    @property
+    def measurement_key(self):
+        """ Hashable description of the font used by `get_text_extent`. """
+        return (self._face, self._font_size, self._anchors)
+
     def get_text_extent(self, text):
-        _, text_extent = _text_to_vbo(text, self._font,
-                                      self._anchors[0], self._anchors[1],
-                                      self._font._lowres_size)
+        _, text_extent = _get_text_layout(text, self._font,
+                                          self._anchors[0], self._anchors[1],
+                                          self._font._lowres_size)
         # XXX: Arbitrary scale, but it seems to work.
         lowres_size = self._font._lowres_size * 0.9
         scale = self._font_size / float(lowres_size)
         left, bottom, width, height = [e * scale for e in text_extent]
         return left, bottom, width, height
 
+    def _get_buffers(self, text):
+        """ Return vertex and index buffers of `text`, uploading if needed.
+        """
+        key = _as_unicode(text)
+        buffers = self._buffers.get(key)
+        if buffers is None:
+            vertices, _ = _get_text_layout(text, self._font, self._anchors[0],
+                                           self._anchors[1],
+                                           self._font._lowres_size)
+            buffers = (VertexBuffer(vertices),
+                       IndexBuffer(_glyph_indices(len(vertices) // 4)))
+            self._buffers[key] = buffers
+        return buffers
+
     def draw(self, projection_size):
         width, height = projection_size
         px_scale = 2.0/width, 2.0/height
@@ -380,15 +533,7 @@ class TextElement(GLElement):
             return
 
         if self._vertices is None:
-            self._vertices, _ = _text_to_vbo(self._text,
-                                             self._font,
-                                             self._anchors[0],
-                                             self._anchors[1],
-                                             self._font._lowres_size)
-            idx = (np.array([0, 1, 2, 0, 2, 3], np.uint32) +
-                   np.arange(0, 4*len(self._text), 4,
-                             dtype=np.uint32)[:, np.newaxis])
-            self._ib = IndexBuffer(idx.ravel())
+            self._vertices, self._ib = self._get_buffers(self._text)
 
         ps = (self._font_size / 72.) * 92.
 
@@ -404,4 +549,8 @@ class TextElement(GLElement):
         set_state(blend=True, depth_test=False, blend_func=BLEND_FUNC)
 
         with self._draw_context():
-            self._program.draw('triangles', self._ib)
+            if isinstance(self._ib, PersistentBuffer):
+                # Batches only draw the used part of the persistent buffers.
+                self._draw_vertices(gl.GL_TRIANGLES, self._ib)
+            else:
+                self._program.draw('triangles', self._ib)
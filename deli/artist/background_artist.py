@@ -21,3 +21,6 @@ class BackgroundArtist(BaseArtist):
 
     def draw(self, gc, view_rect=None):
         self.stylus.draw(gc, self.screen_bbox.rect)
+
+    def _get_styluses(self):
+        return (self.stylus,)
@@ -2,11 +2,12 @@
 """
 from contextlib import contextmanager
 
-from traits.api import Instance, Property, Tuple
+from traits.api import Instance, Property, Tuple, cached_property
 
 from ..core.component import Component
 from ..layout.bounding_box import BoundingBox
 from ..layout.bbox_transform import BboxTransform
+from ..utils.traits import get_state
 
 
 class BaseArtist(Component):
@@ -47,6 +48,7 @@ class BaseArtist(Component):
     def _data_to_screen_default(self):
         return BboxTransform(self.data_bbox, self.screen_bbox)
 
+    @cached_property
     def _get_screen_to_data(self):
         return self.data_to_screen.inverted()
 
@@ -58,6 +60,20 @@ class BaseArtist(Component):
         msg = "`BaseArtist` subclasses must implement `_get_data_extents`"
         raise NotImplementedError(msg)
 
+    def _get_styluses(self):
+        return ()
+
+    # -------------------------------------------------------------------------
+    #  Component interface
+    # -------------------------------------------------------------------------
+
+    def _draw_version(self):
+        """ Extend version with the data limits and the style of styluses. """
+        version = super(BaseArtist, self)._draw_version()
+        data_rect = None if self.data_bbox is None else self.data_bbox.rect
+        styles = [get_state(stylus) for stylus in self.styluses]
+        return (version, data_rect, styles)
+
     def _container_changed(self):
         if self.container is not None:
             self.data_bbox = self.container.data_bbox
@@ -1,12 +1,22 @@
 """ Defines the base class for XY artists.
 """
+from itertools import count
+
 import numpy as np
 
-from traits.api import CArray, Range
+from traits.api import (Any, Bool, CArray, Dict, Instance, Int, Property,
+                        Range, cached_property, on_trait_change)
 
+from ..utils.decimation import MinMaxPyramid, is_sorted
+from ..utils.ring_buffer import RingBufferDataSource
+from ..utils.traits import get_state
 from .base_artist import BaseArtist
 
 
+#: Source of data versions, which are unique across artists.
+_data_versions = count(1)
+
+
 class BasePointArtist(BaseArtist):
     """ Base class for simple point data artists that consist of a single x data
     array and a single y data array.
@@ -26,6 +36,48 @@ class BasePointArtist(BaseArtist):
     #: The data for the y coordinate.
     y_data = CArray
 
+    #: Optional source of streamed data. While a source is attached, the
+    #: artist draws the source's data (see `get_data`), and the data extents
+    #: and sortedness are tracked by the source instead of being recomputed
+    #: from all points; `x_data` and `y_data` aren't updated. Assigning
+    #: `x_data` or `y_data` detaches the source, and the source's data is
+    #: copied to them when the source is detached.
+    data_source = Instance(RingBufferDataSource)
+
+    #: True if the x data is sorted in increasing order. This is tracked by
+    #: `data_source`, or computed once for each new `x_data` array.
+    x_is_sorted = Property(Bool, depends_on='x_data, data_source')
+
+    #: Value that changes whenever the data changes, including when samples
+    #: are appended to `data_source`. Versions are unique across artists, so
+    #: they also identify the points uploaded to the GPU by elements shared
+    #: between artists, and drawings retained by a graphics context.
+    data_version = Property
+
+    #: Min/max summaries of the y data used to draw a reduced number of
+    #: points. This is only built when first requested for each version of
+    #: the data.
+    _pyramid = Property(Any)
+
+    #: Data points relative to the first point, as a read-only float32 array
+    #: for upload to the GPU. Stored as an `(origin, points)` pair.
+    _gpu_points = Property(Any)
+
+    #: Changed whenever `x_data`, `y_data` or `data_source` is assigned.
+    _data_version = Int
+
+    #: Values computed from the data, as `(data_version, value)` pairs keyed
+    #: by name.
+    _data_cache = Dict
+
+    _x_data_is_sorted = Property(Bool, depends_on='x_data')
+
+    #: True while recording a retained drawing that must include all points.
+    _draw_all_points = Bool(False)
+
+    #: True while `x_data` and `y_data` are set when detaching `data_source`.
+    _detaching_source = Bool(False)
+
     # -----------------------------------------------------------------------
     # Appearance-related traits
     # -----------------------------------------------------------------------
@@ -33,15 +85,215 @@ class BasePointArtist(BaseArtist):
     #: Overall alpha value of the image. Ranges from 0.0 for transparent to 1.0
     alpha = Range(0.0, 1.0, 1.0)
 
+    #: If True, and the graphics context supports data transforms (e.g. the
+    #: vispy backend), points are passed in data space and transformed to
+    #: screen space on the GPU. Points are then uploaded once, and panning or
+    #: zooming only updates the transform. All points are drawn, even if
+    #: they're outside the current view.
+    gpu_transform = Bool(False)
+
     # -------------------------------------------------------------------------
     #  BaseArtist interface
     # -------------------------------------------------------------------------
 
     def get_screen_points(self):
-        xy_points = np.column_stack((self.x_data, self.y_data))
+        x, y = self._data_to_draw()
+        xy_points = np.column_stack((x, y))
         return self.data_to_screen.transform(xy_points)
 
+    def get_data(self):
+        """ Return the x and y data, from `data_source` if one is attached.
+        """
+        source = self.data_source
+        if source is not None:
+            return source.x, source.y
+        return self.x_data, self.y_data
+
     def _get_data_extents(self):
+        if self.data_source is not None:
+            return self.data_source.extents
         x = self.x_data
         y = self.y_data
         return (x.min(), y.min(), x.max(), y.max())
+
+    # -------------------------------------------------------------------------
+    #  Protected interface
+    # -------------------------------------------------------------------------
+
+    def _data_to_draw(self):
+        """ Return the x and y data that is transformed to screen space.
+
+        If `x_data` is sorted, only the points within the current x-limits
+        (plus one point on each side) are returned. Subclasses may override
+        this to further reduce the number of points drawn.
+        """
+        visible = self._visible_slice()
+        x, y = self.get_data()
+        return x[visible], y[visible]
+
+    def _draw_points(self, gc, draw_func):
+        """ Call `draw_func(gc, points)` with the points to draw.
+
+        Points are in screen space, unless `gpu_transform` is enabled and `gc`
+        supports data transforms, in which case data-space points are passed
+        along with the data-to-screen transform.
+        """
+        use_gpu = (self.gpu_transform and self._can_transform_on_gpu() and
+                   getattr(gc, 'supports_data_transform', False))
+        if not use_gpu:
+            draw_func(gc, self.get_screen_points())
+            return
+
+        origin, points = self._gpu_points
+        matrix = self.data_to_screen.matrix.copy()
+        # Points are relative to `origin` to preserve float32 precision.
+        matrix[:, 2] += np.dot(matrix[:, :2], origin)
+        with gc:
+            gc.set_data_transform(matrix, version=self.data_version)
+            draw_func(gc, points)
+
+    def _can_transform_on_gpu(self):
+        """ Return True if the drawn points don't depend on the view. """
+        return True
+
+    def _draw_retained(self, gc, draw_func):
+        """ Draw with `draw_func(gc)`, or replay a drawing retained by `gc`.
+
+        Graphics contexts in retained mode record the GPU commands issued by
+        `draw_func` and replay them, with an updated data-to-screen transform,
+        until this artist's data or style changes. Since a retained drawing
+        is reused after panning and zooming, it includes all points unless
+        `_view_version` reports that the drawn points depend on the view.
+        """
+        if not getattr(gc, 'retained', False):
+            draw_func(gc)
+            return
+
+        view_version = self._view_version()
+        styles = [get_state(stylus) for stylus in self.styluses]
+        version = (self.data_version, styles, view_version)
+        self._draw_all_points = view_version is None
+        try:
+            gc.draw_retained(self, version, self.data_to_screen.matrix,
+                             draw_func)
+        finally:
+            self._draw_all_points = False
+
+    def _view_version(self):
+        """ Return the view state that the drawn points depend on.
+
+        Return None (the default) if the drawn points don't depend on the
+        view, apart from the data-to-screen transform.
+        """
+        return None
+
+    def _visible_slice(self):
+        """ Return slice of data points within the current x-limits.
+
+        Sorted data is sliced using a binary search, and one point outside of
+        the view is included on each side so lines leaving the view are drawn.
+        If `x_data` isn't sorted, the slice includes all points.
+        """
+        if (self._draw_all_points or not self.x_is_sorted or
+                self.data_bbox is None):
+            return slice(None)
+
+        x = self.get_data()[0]
+        x_min, x_max = self.data_bbox.x_limits
+        start = np.searchsorted(x, x_min, side='left') - 1
+        stop = np.searchsorted(x, x_max, side='right') + 1
+        return slice(max(start, 0), min(stop, len(x)))
+
+    def _level_of_detail_indices(self, n_buckets):
+        """ Return indices of points summarizing the data in view.
+
+        The coarsest level of the min/max pyramid that has at least
+        `n_buckets` blocks between the current x-limits is used, so the number
+        of points is proportional to `n_buckets` instead of the data length.
+        This assumes `x_data` is sorted.
+        """
+        visible = self._visible_slice()
+        start, stop, _ = visible.indices(len(self.get_data()[0]))
+        return self._pyramid.indices(start, stop, n_buckets)
+
+    def _draw_version(self):
+        version = super(BasePointArtist, self)._draw_version()
+        return (version, self.data_version)
+
+    def _cached_on_data(self, name, compute):
+        """ Return `compute(x, y)` for the current data, cached by version.
+        """
+        version = self.data_version
+        cached = self._data_cache.get(name)
+        if cached is None or cached[0] != version:
+            cached = (version, compute(*self.get_data()))
+            self._data_cache[name] = cached
+        return cached[1]
+
+    @on_trait_change('data_source:updated')
+    def _data_source_updated(self):
+        # The data is read from the source when drawn, so appending samples
+        # doesn't touch the data traits of this artist.
+        self.request_redraw()
+
+    def _data_source_changed(self, old, new):
+        self._data_version = next(_data_versions)
+        if old is not None and new is None and not self._detaching_source:
+            # Keep the data, which would otherwise change with the source.
+            self._detach_data_source(old, old.x.copy(), old.y.copy())
+        self.request_redraw()
+
+    def _x_data_changed(self, new):
+        self._data_version = next(_data_versions)
+        source = self.data_source
+        if source is not None and not self._detaching_source:
+            # Data assigned directly replaces the data of the source, whose
+            # extents and sortedness no longer apply.
+            self._detach_data_source(source, new, source.y.copy())
+
+    def _y_data_changed(self, new):
+        self._data_version = next(_data_versions)
+        source = self.data_source
+        if source is not None and not self._detaching_source:
+            self._detach_data_source(source, source.x.copy(), new)
+
+    def _detach_data_source(self, source, x, y):
+        """ Detach `source`, and set the data of this artist to `x` and `y`.
+        """
+        self._detaching_source = True
+        try:
+            self.data_source = None
+            self.x_data = x
+            self.y_data = y
+        finally:
+            self._detaching_source = False
+
+    def _get_data_version(self):
+        source = self.data_source
+        if source is None:
+            return self._data_version
+        return (self._data_version, source.version)
+
+    def _get_x_is_sorted(self):
+        if self.data_source is not None:
+            return self.data_source.x_is_sorted
+        return self._x_data_is_sorted
+
+    @cached_property
+    def _get__x_data_is_sorted(self):
+        return is_sorted(self.x_data)
+
+    def _get__gpu_points(self):
+        return self._cached_on_data('gpu_points', _relative_float32_points)
+
+    def _get__pyramid(self):
+        return self._cached_on_data('pyramid', lambda x, y: MinMaxPyramid(y))
+
+
+def _relative_float32_points(x, y):
+    """ Return first point, and read-only float32 points relative to it. """
+    points = np.column_stack((x, y))
+    origin = points[0] if len(points) > 0 else np.zeros(2)
+    points = (points - origin).astype(np.float32)
+    points.flags.writeable = False
+    return origin, points
@@ -22,3 +22,9 @@ class ImageArtist(BaseArtist):
     def _get_data_extents(self):
         height, width = self.data.shape[:2]
         return (0, 0, width, height)
+
+    def _get_styluses(self):
+        return (self.image,)
+
+    def _data_changed(self):
+        self.invalidate_draw()
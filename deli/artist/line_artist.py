@@ -1,6 +1,9 @@
-from traits.api import DelegatesTo, Instance
+import numpy as np
+
+from traits.api import DelegatesTo, Enum, Instance
 
 from ..stylus.line_stylus import LineStylus
+from ..utils.decimation import minmax_decimation_indices
 from .base_point_artist import BasePointArtist
 
 
@@ -12,10 +15,53 @@ class LineArtist(BasePointArtist):
 
     line = Instance(LineStylus, ())
 
+    #: Reduction of data points before drawing. 'minmax' keeps only the first,
+    #: last, minimum, and maximum points in each pixel column, so the cost of
+    #: drawing is bounded by the canvas width instead of the data length.
+    #: 'pyramid' draws precomputed min/max summaries at the coarsest level
+    #: that has at least one block per pixel column, which avoids touching
+    #: all data points on each draw at the cost of building the summaries
+    #: once. Reductions only apply when the x data is sorted.
+    decimation = Enum('none', 'minmax', 'pyramid')
+
     def draw(self, gc, view_rect=None):
-        points = self.get_screen_points()
         with self._clipped_context(gc):
-            self.line.draw(gc, points)
+            self._draw_retained(gc, self._draw_line)
+
+    # -------------------------------------------------------------------------
+    #  Protected interface
+    # -------------------------------------------------------------------------
+
+    def _draw_line(self, gc):
+        self._draw_points(gc, self.line.draw)
+
+    def _can_transform_on_gpu(self):
+        return self.decimation == 'none'
+
+    def _view_version(self):
+        # Decimated points depend on the x-limits and the width of the view.
+        if self.decimation == 'none' or not self.x_is_sorted:
+            return None
+        return (self.data_bbox.rect, self.screen_bbox.width)
+
+    def _data_to_draw(self):
+        if self.decimation == 'none' or not self.x_is_sorted:
+            return super(LineArtist, self)._data_to_draw()
+
+        n_columns = int(np.ceil(self.screen_bbox.width))
+        if self.decimation == 'pyramid':
+            indices = self._level_of_detail_indices(n_columns)
+            x, y = self.get_data()
+            return x[indices], y[indices]
+
+        x, y = super(LineArtist, self)._data_to_draw()
+        # Decimation keeps up to 4 points per column, so skip it if it can't
+        # reduce the number of points.
+        if len(x) > 4 * n_columns:
+            indices = minmax_decimation_indices(x, y, self.data_bbox.x_limits,
+                                                n_columns)
+            x, y = x[indices], y[indices]
+        return x, y
 
     # -------------------------------------------------------------------------
     #  Private interface
@@ -24,5 +70,8 @@ class LineArtist(BasePointArtist):
     def _color_changed(self):
         self.request_redraw()
 
+    def _decimation_changed(self):
+        self.request_redraw()
+
     def _get_styluses(self):
         return (self.line,)
@@ -12,6 +12,11 @@ class MarkerArtist(BasePointArtist):
     marker = Instance(MarkerStylus, ())
 
     def draw(self, gc, view_rect=None):
-        points = self.get_screen_points()
         with self._clipped_context(gc):
-            self.marker.draw(gc, points)
+            self._draw_retained(gc, self._draw_markers)
+
+    def _draw_markers(self, gc):
+        self._draw_points(gc, self.marker.draw)
+
+    def _get_styluses(self):
+        return (self.marker,)
@@ -0,0 +1,217 @@
+import numpy as np
+from mock import MagicMock, patch
+from numpy.testing import assert_allclose, assert_equal
+
+from deli.artist.line_artist import LineArtist
+from deli.layout.bbox_transform import BboxTransform
+from deli.layout.bounding_box import BoundingBox
+from deli.utils.ring_buffer import RingBufferDataSource
+
+
+def make_artist(x, x_limits):
+    data_bbox = BoundingBox.from_extents(x_limits[0], 0, x_limits[1], 1)
+    return LineArtist(x_data=x, y_data=np.zeros_like(x), data_bbox=data_bbox)
+
+
+def test_visible_slice_pads_one_point():
+    artist = make_artist(np.arange(10.0), (2.5, 5.5))
+    x, _ = artist._data_to_draw()
+    assert_equal(x, [2, 3, 4, 5, 6])
+
+
+def test_visible_slice_includes_boundary_values():
+    artist = make_artist(np.arange(10.0), (2, 5))
+    x, _ = artist._data_to_draw()
+    assert_equal(x, [1, 2, 3, 4, 5, 6])
+
+
+def test_visible_slice_outside_of_data():
+    artist = make_artist(np.arange(10.0), (20, 30))
+    x, _ = artist._data_to_draw()
+    assert_equal(x, [9])
+
+
+def test_unsorted_data_is_not_sliced():
+    x_data = np.array([5.0, 1.0, 3.0, 8.0])
+    artist = make_artist(x_data, (2, 4))
+    x, _ = artist._data_to_draw()
+    assert_equal(x, x_data)
+
+
+def test_screen_to_data_is_cached():
+    artist = make_artist(np.arange(10.0), (0, 10))
+    artist.screen_bbox = BoundingBox.from_size((100, 100))
+    screen_to_data = artist.screen_to_data
+    assert artist.screen_to_data is screen_to_data
+    assert_allclose(screen_to_data.transform((50, 50)), (5, 0.5))
+
+    artist.data_to_screen = BboxTransform(artist.data_bbox,
+                                          artist.screen_bbox)
+    assert artist.screen_to_data is not screen_to_data
+
+
+def test_draw_retained_without_retained_gc():
+    artist = make_artist(np.arange(10.0), (2, 5))
+    gc = MagicMock(retained=False)
+    draw_func = MagicMock()
+    artist._draw_retained(gc, draw_func)
+    draw_func.assert_called_once_with(gc)
+    assert not gc.draw_retained.called
+
+
+def test_draw_retained_includes_all_points():
+    artist = make_artist(np.arange(10.0), (2, 5))
+    artist.screen_bbox = BoundingBox.from_size((100, 100))
+    drawn = []
+
+    def draw_retained(key, version, matrix, draw_func):
+        drawn.append(artist._data_to_draw()[0])
+
+    gc = MagicMock(retained=True, draw_retained=draw_retained)
+    artist._draw_retained(gc, MagicMock())
+    assert_equal(drawn[0], artist.x_data)
+    # Points are sliced again after the retained drawing is recorded.
+    assert len(artist._data_to_draw()[0]) < len(artist.x_data)
+
+
+def test_retained_version_changes_with_data():
+    artist = make_artist(np.arange(10.0), (2, 5))
+    artist.screen_bbox = BoundingBox.from_size((100, 100))
+    gc = MagicMock(retained=True)
+
+    artist._draw_retained(gc, MagicMock())
+    version_0 = gc.draw_retained.call_args[0][1]
+    artist.data_bbox.x_limits = (0, 1)
+    artist._draw_retained(gc, MagicMock())
+    assert gc.draw_retained.call_args[0][1] == version_0
+
+    artist.y_data = np.ones(10)
+    artist._draw_retained(gc, MagicMock())
+    assert gc.draw_retained.call_args[0][1] != version_0
+
+
+def test_gpu_transform_passes_data_points():
+    x_data = np.array([100.0, 101.0, 102.0])
+    artist = make_artist(x_data, (100, 102))
+    artist.screen_bbox = BoundingBox.from_size((200, 100))
+    artist.gpu_transform = True
+    gc = MagicMock(supports_data_transform=True)
+    draw_func = MagicMock()
+    artist._draw_points(gc, draw_func)
+
+    points = draw_func.call_args[0][1]
+    assert not points.flags.writeable
+    matrix = gc.set_data_transform.call_args[0][0]
+    screen_points = np.dot(points, matrix[:, :2].T) + matrix[:, 2]
+    assert_allclose(screen_points, artist.get_screen_points())
+
+
+def test_gpu_transform_passes_data_version():
+    artist = make_artist(np.arange(10.0), (2, 5))
+    other = make_artist(np.arange(10.0), (2, 5))
+    artist.screen_bbox = BoundingBox.from_size((100, 100))
+    artist.gpu_transform = True
+    gc = MagicMock(supports_data_transform=True)
+
+    artist._draw_points(gc, MagicMock())
+    version = gc.set_data_transform.call_args[1]['version']
+    artist._draw_points(gc, MagicMock())
+    assert gc.set_data_transform.call_args[1]['version'] == version
+    # Versions identify the data of an artist, and are unique across artists.
+    assert other.data_version != version
+    artist.y_data = np.ones(10)
+    artist._draw_points(gc, MagicMock())
+    assert gc.set_data_transform.call_args[1]['version'] != version
+
+
+def test_gpu_transform_unsupported():
+    artist = make_artist(np.arange(10.0), (2, 5))
+    artist.screen_bbox = BoundingBox.from_size((100, 100))
+    artist.gpu_transform = True
+    gc = MagicMock(supports_data_transform=False)
+    draw_func = MagicMock()
+    artist._draw_points(gc, draw_func)
+    assert_allclose(draw_func.call_args[0][1], artist.get_screen_points())
+
+
+def test_data_source():
+    source = RingBufferDataSource(5)
+    source.append(np.arange(3.0), np.zeros(3))
+    artist = make_artist(np.zeros(0), (0, 10))
+    artist.data_source = source
+    assert_equal(artist.get_data()[0], [0, 1, 2])
+
+    version = artist.data_version
+    source.append([3, 4, 5], [-1, 1, 2])
+    x, y = artist.get_data()
+    assert np.may_share_memory(x, source._data)
+    assert_equal(x, [1, 2, 3, 4, 5])
+    assert_equal(y, [0, 0, -1, 1, 2])
+    assert artist.data_version != version
+    assert artist.x_is_sorted
+    assert_allclose(artist.data_extents, (1, -1, 5, 2))
+
+    x, _ = artist._data_to_draw()
+    assert_equal(x, [1, 2, 3, 4, 5])
+
+
+def test_detached_data_source_keeps_data():
+    source = RingBufferDataSource(5)
+    source.append(np.arange(5.0), np.zeros(5))
+    artist = make_artist(np.zeros(0), (0, 10))
+    artist.data_source = source
+
+    artist.data_source = None
+    source.append([5.0], [1.0])
+    assert not np.may_share_memory(artist.x_data, source._data)
+    assert_equal(artist.x_data, np.arange(5.0))
+    assert_equal(artist.y_data, np.zeros(5))
+
+
+def test_assigned_data_detaches_data_source():
+    source = RingBufferDataSource(5)
+    source.append(np.arange(5.0), np.zeros(5))
+    artist = make_artist(np.zeros(0), (0, 10))
+    artist.data_source = source
+
+    artist.x_data = np.arange(5.0)[::-1]
+    assert artist.data_source is None
+    assert not artist.x_is_sorted
+    assert_allclose(artist.data_extents, (0, 0, 4, 0))
+
+    source.append([5.0], [1.0])
+    assert_equal(artist.y_data, np.zeros(5))
+
+
+def test_data_source_update_keeps_data_traits():
+    source = RingBufferDataSource(5)
+    source.append(np.arange(3.0), np.zeros(3))
+    artist = make_artist(np.zeros(0), (0, 10))
+    artist.data_source = source
+    changed = []
+    artist.on_trait_change(lambda name: changed.append(name),
+                           'x_data, y_data')
+
+    with patch.object(LineArtist, 'request_redraw') as redraw:
+        source.append([3.0], [1.0])
+    assert changed == []
+    assert redraw.called
+    assert len(artist.x_data) == 0
+
+
+def test_data_caches_follow_data_source_version():
+    source = RingBufferDataSource(5)
+    source.append(np.arange(3.0), np.zeros(3))
+    artist = make_artist(np.zeros(0), (0, 10))
+    artist.data_source = source
+
+    points = artist._gpu_points
+    pyramid = artist._pyramid
+    assert artist._gpu_points is points
+    assert artist._pyramid is pyramid
+
+    source.append([3.0], [1.0])
+    origin, new_points = artist._gpu_points
+    assert new_points is not points[1]
+    assert_allclose(new_points[:, 0] + origin[0], [0, 1, 2, 3])
+    assert artist._pyramid is not pyramid
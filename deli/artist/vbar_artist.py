@@ -25,11 +25,15 @@ class VBarArtist(BasePointArtist):
     stylus = Instance(RectangleStylus, ())
 
     def draw(self, gc, view_rect=None):
-        bars = self._get_bar_data()
         with self._clipped_context(gc):
-            for rect in bars:
-                self.stylus.draw(gc, rect)
+            self._draw_retained(gc, self._draw_bars)
+
+    def _draw_bars(self, gc):
+        self.stylus.draw_many(gc, self._get_bar_data())
 
     def _get_bar_data(self):
-        x, y = self.x_data, self.y_data
+        x, y = self.get_data()
         return bars_from_points(x, y, self.data_to_screen, width=0.5)
+
+    def _get_styluses(self):
+        return (self.stylus,)
@@ -93,16 +93,16 @@ class BaseAxis(BaseArtist):
 
     def _draw_labels(self, gc):
         """ Draws the tick labels for the axis. """
-        xy_tick = self._get_tick_positions()
-        for xy_screen, label in zip(xy_tick, self._get_labels()):
-            with gc:
-                gc.translate_ctm(*xy_screen)
-                self.tick_label_stylus.draw(gc, label)
+        self.tick_label_stylus.draw_many(gc, self._get_tick_positions(),
+                                         self._get_labels())
 
     # -----------------------------------------------------------------------
     # Private methods for computing positions and layout
     # -----------------------------------------------------------------------
 
+    def _get_styluses(self):
+        return (self.tick_label_stylus, self.tick_stylus, self.line_stylus)
+
     def _get_labels(self):
         return [self.data_offset_to_label(z)
                 for z in self.tick_grid.axial_offsets]
@@ -1,6 +1,7 @@
 """ Defines the Component class """
 from contextlib import contextmanager
 from itertools import chain
+from math import ceil, floor
 
 from enable.base import empty_rectangle
 from enable.colors import ColorTrait
@@ -17,6 +18,18 @@ class NullDispatch(object):
         pass
 
 
+def _device_transform(gc):
+    """ Return the scale and offset of the CTM of `gc` in device pixels.
+
+    Returns (scale_x, scale_y, offset_x, offset_y), or None if the CTM
+    rotates, skews, or flips, which a backbuffer can't reproduce.
+    """
+    a, b, c, d, tx, ty = gc.get_ctm()
+    if b != 0 or c != 0 or a <= 0 or d <= 0:
+        return None
+    return (a, d, tx, ty)
+
+
 class RenderWrapper(object):
     """ A thin wrapper around a component so that it renders itself.
 
@@ -125,6 +138,20 @@ class Component(CoordinateBox):
 
     background = Instance('Component')
 
+    #: If True, the background, underlays, and main layers of this component
+    #: are rendered to an off-screen image, which is reused until the drawing
+    #: changes (see `invalidate_draw` and `_draw_version`). Overlays, e.g.
+    #: tools and cursors, are drawn on top of the image on every render.
+    #: This is ignored for graphics contexts that can't draw images, and
+    #: while the transform of the context rotates or flips the drawing.
+    use_backbuffer = Bool(False)
+
+    # The off-screen image of the non-overlay layers, or None if invalid.
+    _backbuffer = Any
+
+    # The value of `_draw_version()` when the backbuffer was drawn.
+    _backbuffer_version = Any
+
     def _bgcolor_changed(self):
         # Late import to prevent circular import
         from ..artist.background_artist import BackgroundArtist
@@ -164,15 +191,40 @@ class Component(CoordinateBox):
         """
         pass
 
-    def request_redraw(self):
+    def request_redraw(self, rect=None):
         """
         Requests that the component redraw itself.  Usually this means asking
         its parent for a repaint.
+
+        Parameters
+        ----------
+        rect : 4-tuple
+            (x, y, width, height) of the damaged area, relative to the origin
+            of this component. The rect is translated to the coordinates of
+            each container up to the window, which may repaint only that area.
+            If None, the entire window is redrawn.
         """
+        if rect is not None:
+            rect = self._to_container_rect(rect)
         if self.container is not None:
-            self.container.request_redraw()
+            self.container.request_redraw(rect)
         elif self._window:
-            self._window.redraw()
+            self._window.redraw(rect)
+
+    def invalidate_draw(self):
+        """ Invalidate the backbuffers of this component and its containers.
+
+        Call this whenever the drawing of this component changes in a way
+        that isn't reflected by `_draw_version`.
+        """
+        self._backbuffer = None
+        if self.container is not None:
+            self.container.invalidate_draw()
+
+    def invalidate_and_redraw(self, rect=None):
+        """ Invalidate backbuffers and request a redraw. """
+        self.invalidate_draw()
+        self.request_redraw(rect)
 
     def is_in(self, x, y):
         # A basic implementation of is_in(); subclasses should provide their
@@ -187,7 +239,7 @@ class Component(CoordinateBox):
         """When a window viewing or containing a component is destroyed,
         cleanup is called on the component to give it the opportunity to
         delete any transient state it may have (such as backbuffers)."""
-        pass
+        self._backbuffer = None
 
     # -----------------------------------------------------------------------
     # Layout-related concrete methods
@@ -231,11 +283,125 @@ class Component(CoordinateBox):
         pass
 
     def _draw_layers(self, gc, view_rect=None):
+        view_rect = self._to_local_rect(view_rect)
         with self._local_context(gc):
+            if self._can_use_backbuffer(gc):
+                self._draw_backbuffer(gc)
+                self._render_overlays(gc, view_rect)
+                return
+
             for component in self._iter_layers(view_rect):
                 if component.visible:
                     component.render(gc, view_rect)
 
+    def _render_content(self, gc, view_rect=None):
+        """ Render all layers except overlays, including those of children.
+
+        This is used to render a container's backbuffer, after which
+        overlays are drawn on top using `_render_overlays`.
+        """
+        if not self.visible or view_rect == empty_rectangle:
+            return
+        if self.layout_needed:
+            self.do_layout()
+
+        view_rect = self._to_local_rect(view_rect)
+        with self._local_context(gc):
+            if self._can_use_backbuffer(gc):
+                self._draw_backbuffer(gc)
+            else:
+                self._render_content_layers(gc, view_rect)
+
+    def _render_content_layers(self, gc, view_rect):
+        for layer in self._iter_content_layers(view_rect):
+            if not layer.visible:
+                continue
+            if isinstance(layer, Component):
+                layer._render_content(gc, view_rect)
+            else:
+                layer.render(gc, view_rect)
+
+    def _render_overlays(self, gc, view_rect):
+        """ Render overlays of children, and then this component's overlays.
+
+        This assumes the graphics context is in local coordinates.
+        """
+        for layer in self._main_layers(view_rect):
+            if isinstance(layer, Component) and layer.visible:
+                with layer._local_context(gc):
+                    layer._render_overlays(gc, layer._to_local_rect(view_rect))
+        for overlay in self.overlays:
+            if overlay.visible:
+                overlay.render(gc, view_rect)
+
+    def _can_use_backbuffer(self, gc):
+        # OpenGL-based graphics contexts don't draw images.
+        if not (self.use_backbuffer and hasattr(gc, 'draw_image')):
+            return False
+        return _device_transform(gc) is not None
+
+    def _draw_backbuffer(self, gc):
+        """ Draw the cached non-overlay layers, updating them if needed.
+
+        The backbuffer has the resolution of the device and the same
+        sub-pixel offset as `gc`, so it's copied to `gc` pixel for pixel.
+        """
+        scale_x, scale_y, offset_x, offset_y = _device_transform(gc)
+        # The integer part of the offset is applied when drawing the image.
+        pixel_x, pixel_y = floor(offset_x), floor(offset_y)
+        ctm = (scale_x, 0, 0, scale_y, offset_x - pixel_x, offset_y - pixel_y)
+
+        width, height = self.size
+        device_size = (int(ceil(width * scale_x + ctm[4])),
+                       int(ceil(height * scale_y + ctm[5])))
+        version = (self._draw_version(), ctm)
+        if self._backbuffer is None or version != self._backbuffer_version:
+            backbuffer = self._create_backbuffer(gc, device_size)
+            backbuffer.set_ctm(ctm)
+            self._render_content_layers(backbuffer, (0, 0, width, height))
+            self._backbuffer = backbuffer
+            self._backbuffer_version = version
+
+        with gc:
+            gc.set_ctm((1, 0, 0, 1, pixel_x, pixel_y))
+            gc.draw_image(self._backbuffer, (0, 0) + device_size)
+
+    def _create_backbuffer(self, gc, size):
+        """ Return an off-screen graphics context compatible with `gc`. """
+        gc_class = gc.__class__
+        if hasattr(gc_class, 'create_from_gc'):
+            return gc_class.create_from_gc(gc, size)
+        return gc_class(size)
+
+    def _draw_version(self):
+        """ Return value that changes when the non-overlay layers change.
+
+        Backbuffers are redrawn when this value changes. By default, this
+        depends on the visibility and size of this component, and on the
+        versions of its child layers. Subclasses should extend this with
+        their data and style.
+        """
+        layers = [layer._draw_version()
+                  for layer in self._iter_content_layers(None)
+                  if isinstance(layer, Component)]
+        return (self.visible, tuple(self.size), layers)
+
+    def _to_local_rect(self, rect):
+        """ Return rect from container coordinates relative to this component's
+        origin.
+        """
+        if rect is None or rect == empty_rectangle:
+            return rect
+        x, y, width, height = rect
+        return (x - self.x, y - self.y, width, height)
+
+    def _to_container_rect(self, rect):
+        """ Return rect relative to this component's origin in the coordinates
+        of its container.
+        """
+        x, y, width, height = rect
+        return (x + self.x, y + self.y, width, height)
+
     @contextmanager
     def _local_context(self, gc):
         with gc:
@@ -243,11 +409,15 @@ class Component(CoordinateBox):
             yield
 
     def _iter_layers(self, view_rect):
+        return chain(self._iter_content_layers(view_rect), self.overlays)
+
+    def _iter_content_layers(self, view_rect):
+        """ Iterate over the background, underlays, and main layers. """
         if self.background is not None:
             yield self.background
 
         main_layers = self._main_layers(view_rect)
-        for layer in chain(self.underlays, main_layers, self.overlays):
+        for layer in chain(self.underlays, main_layers):
             yield layer
 
     def _main_layers(self, view_rect):
@@ -0,0 +1,127 @@
+import numpy as np
+from mock import MagicMock, patch
+from numpy.testing.decorators import skipif
+
+from deli.app.offscreen import OffscreenWindow
+from deli.app.testing.mock_window import calculate_text_extent
+from deli.artist.line_artist import LineArtist
+from deli.canvas import Canvas
+from deli.graph import Graph
+from deli.testing.helpers import agg_available
+from deli.testing.line_demo import LineDemo
+from deli.tools.data_cursor_tool import DataCursorTool
+
+
+def create_backbuffer(self, gc, size):
+    backbuffer = MagicMock()
+    backbuffer.size = size
+    backbuffer.get_full_text_extent.side_effect = calculate_text_extent
+    return backbuffer
+
+
+def init_backbuffered_demo():
+    demo = LineDemo()
+    demo.graph.canvas.use_backbuffer = True
+    # Keep a reference, since `show` replaces `demo.line_artist`.
+    artist = demo.line_artist
+    DataCursorTool.attach_to(artist)
+    demo.show()
+    return demo, artist
+
+
+@patch.object(Canvas, '_create_backbuffer', create_backbuffer)
+def test_backbuffer_reused():
+    demo, artist = init_backbuffered_demo()
+    backbuffer = demo.graph.canvas._backbuffer
+    backbuffer.stroke_path.assert_called_with()
+    demo.context.draw_image.assert_called_with(
+        backbuffer, (0, 0) + tuple(demo.graph.canvas.size))
+
+    # Moving the cursor only draws the overlay on top of the backbuffer.
+    demo.context.reset_mock()
+    demo.control.move_mouse(x=350, y=250)
+    assert demo.graph.canvas._backbuffer is backbuffer
+    assert demo.context.draw_image.called
+    # Lines of the artist, grids, and axes aren't drawn again.
+    assert not demo.context.set_line_dash.called
+    assert demo.context.show_text.called
+
+
+@patch.object(Canvas, '_create_backbuffer', create_backbuffer)
+def test_backbuffer_invalidated_by_data_change():
+    demo, artist = init_backbuffered_demo()
+    backbuffer = demo.graph.canvas._backbuffer
+
+    artist.y_data = np.linspace(0, 1)
+    demo._window.render()
+    assert demo.graph.canvas._backbuffer is not backbuffer
+
+
+@patch.object(Canvas, '_create_backbuffer', create_backbuffer)
+def test_backbuffer_invalidated_by_data_limits():
+    demo, artist = init_backbuffered_demo()
+    backbuffer = demo.graph.canvas._backbuffer
+
+    demo.graph.canvas.data_bbox.x_limits = (0, 10)
+    demo._window.render()
+    assert demo.graph.canvas._backbuffer is not backbuffer
+
+
+@patch.object(Canvas, '_create_backbuffer', create_backbuffer)
+def test_backbuffer_invalidated_by_style():
+    demo, artist = init_backbuffered_demo()
+    backbuffer = demo.graph.canvas._backbuffer
+
+    artist.line.color = 'red'
+    demo._window.render()
+    assert demo.graph.canvas._backbuffer is not backbuffer
+
+
+@patch.object(Canvas, '_create_backbuffer', create_backbuffer)
+def test_backbuffer_has_device_resolution():
+    demo, artist = init_backbuffered_demo()
+    width, height = demo.graph.canvas.size
+
+    # E.g. 144 dpi, with the half-pixel offset of the Qt window.
+    demo.context.get_ctm.return_value = (2.0, 0.0, 0.0, 2.0, 10.5, 20.5)
+    demo.context.reset_mock()
+    demo._window.render()
+
+    backbuffer = demo.graph.canvas._backbuffer
+    device_size = (int(np.ceil(2 * width + 0.5)),
+                   int(np.ceil(2 * height + 0.5)))
+    assert backbuffer.size == device_size
+    backbuffer.set_ctm.assert_called_once_with((2.0, 0, 0, 2.0, 0.5, 0.5))
+    demo.context.set_ctm.assert_called_with((1, 0, 0, 1, 10.0, 20.0))
+    demo.context.draw_image.assert_called_with(backbuffer,
+                                               (0, 0) + device_size)
+
+
+@patch.object(Canvas, '_create_backbuffer', create_backbuffer)
+def test_backbuffer_not_used_for_rotated_ctm():
+    demo, artist = init_backbuffered_demo()
+    demo.context.get_ctm.return_value = (0.0, 1.0, -1.0, 0.0, 0.0, 0.0)
+    demo.graph.canvas.invalidate_draw()
+    demo.context.reset_mock()
+    demo._window.render()
+
+    assert demo.graph.canvas._backbuffer is None
+    assert not demo.context.draw_image.called
+    assert demo.context.set_line_dash.called
+
+
+@skipif(not agg_available(), "Kiva agg graphics context is unavailable")
+def test_backbuffer_matches_direct_drawing_at_high_dpi():
+    def render(use_backbuffer):
+        graph = Graph()
+        x = np.linspace(0, 10)
+        graph.add_artist(LineArtist(x_data=x, y_data=np.sin(x)))
+        graph.canvas.use_backbuffer = use_backbuffer
+        window = OffscreenWindow(graph, size=(200, 100), dpi=144)
+        return window.render_to_array().astype(int)
+
+    image = render(use_backbuffer=True)
+    expected = render(use_backbuffer=False)
+    assert image.shape == (200, 400, 4)
+    # Allow for rounding when blending the backbuffer onto the window.
+    assert np.abs(image - expected).max() <= 1
@@ -6,7 +6,7 @@ from traits.api import ABCHasStrictTraits, Instance, Str, Tuple
 
 from ..app.js.main import create_plot, show
 from ..graph import Graph
-from ..serialization.api import serialization_manager
+from ..serialization.api import serialize_binary
 
 
 WIDTH = 700
@@ -33,6 +33,6 @@ class JSView(ABCHasStrictTraits):
     def show(self):
         # XXX: This does not update the sizes of child components (e.g. canvas)
         self.graph.do_layout()
-        data = serialization_manager.serialize(self.graph)
-        create_plot(data)
+        blob = serialize_binary(self.graph)
+        create_plot(blob.tree, buffers=blob.buffers)
         show()
@@ -84,7 +84,10 @@ class BaseGrid(BaseArtist):
 
     @on_trait_change("visible,line_color,line_style,line_width")
     def _visual_attr_changed(self):
-        self.container.request_redraw()
+        self.container.invalidate_and_redraw()
+
+    def _get_styluses(self):
+        return (self.line_stylus,)
 
     def _orientation_changed(self):
         self.invalidate()
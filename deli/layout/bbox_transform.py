@@ -1,20 +1,169 @@
-from matplotlib.transforms import (  # noqa
-    blended_transform_factory, IdentityTransform,
-    Transform as BaseTransform,
-    BboxTransform as _MPLBboxTransform,
-)
+""" Affine transforms between 2D coordinate spaces.
 
+All transforms are represented by a 2x3 affine matrix::
 
-class BboxTransform(_MPLBboxTransform):
+    [[a, b, tx],
+     [c, d, ty]]
+
+which maps a point (x, y) to (a*x + b*y + tx, c*x + d*y + ty).
+"""
+import numpy as np
+
+
+__all__ = ['Affine2D', 'BaseTransform', 'BboxTransform', 'BlendedTransform',
+           'IdentityTransform', 'blend_xy_transforms']
+
+
+class BaseTransform(object):
+    """ Base class for 2D affine transforms.
+
+    Subclasses must implement the `matrix` property.
+    """
+
+    @property
+    def matrix(self):
+        """ The transform's (2, 3) affine matrix. """
+        raise NotImplementedError()
+
+    def transform(self, points, out=None):
+        """ Return transformed points.
+
+        Parameters
+        ----------
+        points : (N, 2) or (2,) array-like
+            Points to transform.
+        out : array, optional
+            Array with the same shape as `points` where the result is written.
+            This may be `points` itself for an in-place transform, and may be
+            a float32 array (e.g. a buffer sent to the GPU).
+        """
+        return apply_affine(self.matrix, points, out=out)
+
+    def inverted(self):
+        """ Return the inverse of this transform. """
+        return Affine2D(invert_affine(self.matrix))
+
+
+class Affine2D(BaseTransform):
+    """ Transform defined by a fixed affine matrix. """
+
+    def __init__(self, matrix):
+        self._matrix = np.array(matrix, dtype=np.float64)
+
+    @property
+    def matrix(self):
+        return self._matrix
+
+
+class IdentityTransform(Affine2D):
+    """ Transform that returns points unchanged. """
+
+    def __init__(self):
+        super(IdentityTransform, self).__init__([[1, 0, 0], [0, 1, 0]])
+
+
+class BboxTransform(BaseTransform):
     """ Transform from one bounding box to another.
 
-    This is a very thin wrapper around Matplotlib's `BboxTransform` to work
-    with our custom `BoundingBox` class.
+    The affine matrix is computed from the extents of the bounding boxes when
+    first needed, and is cached until either bounding box is updated.
     """
 
     def __init__(self, bbox0, bbox1):
-        super(BboxTransform, self).__init__(bbox0._bbox, bbox1._bbox)
+        self.bbox0 = bbox0
+        self.bbox1 = bbox1
+        self._matrix = None
+        self._inverse = None
+        # Notifiers only hold weak references to bound methods, so the bounding
+        # boxes don't keep this transform alive.
+        bbox0.on_trait_change(self._invalidate, 'updated')
+        bbox1.on_trait_change(self._invalidate, 'updated')
+
+    @property
+    def matrix(self):
+        if self._matrix is None:
+            self._matrix = self._compute_matrix()
+        return self._matrix
+
+    def inverted(self):
+        # The inverse tracks updates of the bounding boxes itself, so it's
+        # created once and shared by all callers.
+        if self._inverse is None:
+            self._inverse = BboxTransform(self.bbox1, self.bbox0)
+        return self._inverse
+
+    def _compute_matrix(self):
+        x0_in, x1_in = self.bbox0.x_limits
+        y0_in, y1_in = self.bbox0.y_limits
+        x0_out, x1_out = self.bbox1.x_limits
+        y0_out, y1_out = self.bbox1.y_limits
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sx = np.float64(x1_out - x0_out) / (x1_in - x0_in)
+            sy = np.float64(y1_out - y0_out) / (y1_in - y0_in)
+        return np.array([[sx, 0.0, x0_out - sx * x0_in],
+                         [0.0, sy, y0_out - sy * y0_in]])
+
+    def _invalidate(self):
+        self._matrix = None
+
+
+class BlendedTransform(BaseTransform):
+    """ Transform that uses separate transforms for x and y coordinates.
+
+    The x-coordinate of the output is given by `x_transform` and the
+    y-coordinate by `y_transform`.
+    """
+
+    def __init__(self, x_transform, y_transform):
+        self.x_transform = x_transform
+        self.y_transform = y_transform
+
+    @property
+    def matrix(self):
+        return np.vstack([self.x_transform.matrix[0],
+                          self.y_transform.matrix[1]])
 
 
 def blend_xy_transforms(x_transform, y_transform):
-    return blended_transform_factory(x_transform, y_transform)
+    return BlendedTransform(x_transform, y_transform)
+
+
+# -----------------------------------------------------------------------------
+#  Helper functions
+# -----------------------------------------------------------------------------
+
+def apply_affine(matrix, points, out=None):
+    """ Return `points` transformed by a (2, 3) affine `matrix`.
+
+    See `BaseTransform.transform` for a description of the parameters.
+    """
+    points = np.asarray(points)
+    if points.dtype.kind != 'f':
+        points = points.astype(np.float64)
+    if out is None:
+        out = np.empty(points.shape, dtype=np.float64)
+
+    (a, b, tx), (c, d, ty) = matrix
+    x = points[..., 0]
+    y = points[..., 1]
+    x_out = out[..., 0]
+    y_out = out[..., 1]
+    if b == 0 and c == 0:
+        # Scale and translation only: operate in-place without temporaries.
+        np.multiply(x, a, out=x_out)
+        x_out += tx
+        np.multiply(y, d, out=y_out)
+        y_out += ty
+    else:
+        # Compute x into a temporary, since `out` may share memory with `x`.
+        new_x = a * x + b * y + tx
+        y_out[...] = c * x + d * y + ty
+        x_out[...] = new_x
+    return out
+
+
+def invert_affine(matrix):
+    """ Return the inverse of a (2, 3) affine `matrix`. """
+    full_matrix = np.vstack([matrix, [0, 0, 1]])
+    return np.linalg.inv(full_matrix)[:2]
@@ -1,5 +1,4 @@
 import numpy as np
-from matplotlib.transforms import Bbox
 
 from traits.api import Event, HasStrictTraits, Instance, Property
 
@@ -17,143 +16,95 @@ def calc_bounds(x, current_bounds):
         return None
 
 
-class Signal(object):
-    """ Signal that calls all connected handlers when fired.
-
-    This event signal is connected to `MPLBbox`, which is not a HasTraits
-    class, and thus, cannot fire Traits events.
-    """
-
-    def __init__(self):
-        self._handlers = []
-
-    def connect(self, handler):
-        self._handlers.append(handler)
-
-    def fire(self, *args):
-        for handler in self._handlers:
-            handler(*args)
-
-
-class MPLBbox(Bbox):
-    """ Bounding box represented by two (x, y) pairs.
-
-    Subclass Matplotlib's `Bbox` to fire an event when the bounds are changed.
-    """
-
-    def __init__(self, points):
-        self.changed = Signal()
-        super(MPLBbox, self).__init__(points)
-
-    def invalidate(self):
-        super(MPLBbox, self).invalidate()
-        self.changed.fire()
-
-    @classmethod
-    def from_rect(cls, rect):
-        """ Return bounding box from rect given as (x0, y0, width, height).
-
-        Override this since matplotlib returns `Bbox`, not subclass, instance.
-        """
-        x0, y0, width, height = rect
-        return cls.from_extents(x0, y0, x0 + width, y0 + height)
-
-    @classmethod
-    def from_extents(cls, x0, y0, x1, y1):
-        """ Return bounding box from extents given as (x0, y0, x1, y1).
-
-        Override this since matplotlib returns `Bbox`, not subclass, instance.
-        """
-        points = np.array([[x0, y0],
-                           [x1, y1]], dtype=np.float_)
-        return cls(points)
-
-
-def BboxProperty(attr_name, readonly=False):
-    """ Property trait that accesses an attr on a BoundingBox's `_bbox` trait.
+def PointsProperty(index, readonly=False):
+    """ Property trait that accesses elements of a BoundingBox's `_points`.
 
     Parameters
     ----------
-    attr_name : str
-        Name of attribute on `BoundingBox._bbox` (i.e. matplotlib's `Bbox`).
+    index : int, slice, or tuple
+        Index into the (2, 2) array of points, `[[x0, y0], [x1, y1]]`.
     readonly : bool
         If True, no setter is defined for this property.
     """
 
-    def _bbox_getter(attr_name):
-        def get_attr(self):
-            return getattr(self._bbox, attr_name)
-        return get_attr
+    def get_points(self):
+        value = self._points[index]
+        return value.copy() if isinstance(value, np.ndarray) else value
 
-    def _bbox_setter(attr_name):
-        def set_attr(self, value):
-            return setattr(self._bbox, attr_name, value)
-        return set_attr
+    def set_points(self, value):
+        points = self._points.copy()
+        points[index] = np.reshape(value, np.shape(points[index]))
+        self._set_points(points)
 
     if readonly:
-        return Property(fget=_bbox_getter(attr_name))
-    return Property(fget=_bbox_getter(attr_name),
-                    fset=_bbox_setter(attr_name))
+        return Property(fget=get_points)
+    return Property(fget=get_points, fset=set_points)
 
 
 class BoundingBox(HasStrictTraits):
     """ Bounding box represented by two (x, y) pairs.
 
-    This is a traits-wrapper around matplotlib's `Bbox`. Whenever the
-    underlying bounding-box is changed, the `updated` event is fired.
+    The bounds are stored in a (2, 2) array of float64 values,
+    `[[x0, y0], [x1, y1]]`. Whenever the bounds are changed, the `updated`
+    event is fired.
     """
 
-    _bbox = Instance(MPLBbox)
+    _points = Instance(np.ndarray)
 
     updated = Event
 
+    def __init__(self, points=None, **traits):
+        if points is None:
+            points = np.zeros((2, 2))
+        points = np.array(points, dtype=np.float64).reshape(2, 2)
+        super(BoundingBox, self).__init__(_points=points, **traits)
+
     @classmethod
     def from_rect(cls, rect):
-        return cls.from_mpl_bbox(MPLBbox.from_rect(rect))
+        """ Return bounding box from rect given as (x0, y0, width, height). """
+        x0, y0, width, height = rect
+        return cls.from_extents(x0, y0, x0 + width, y0 + height)
 
     @classmethod
     def from_size(cls, size):
         rect = [0, 0] + list(size)
-        return cls.from_mpl_bbox(MPLBbox.from_rect(rect))
+        return cls.from_rect(rect)
 
     @classmethod
     def from_extents(cls, x0, y0, x1, y1):
-        return cls.from_mpl_bbox(MPLBbox.from_extents(x0, y0, x1, y1))
-
-    @classmethod
-    def from_mpl_bbox(cls, bbox):
-        instance = cls(_bbox=bbox)
-        bbox.changed.connect(instance._bbox_updated)
-        return instance
+        """ Return bounding box from extents given as (x0, y0, x1, y1). """
+        return cls([[x0, y0], [x1, y1]])
 
     def copy(self):
-        return self.__class__.from_rect(self.rect)
+        return self.__class__(self._points)
 
-    def _bbox_updated(self):
-        """Callback method for observer pattern."""
-        self.updated = True
+    def _set_points(self, points):
+        """ Set bounds and fire `updated` if the bounds actually changed. """
+        if not np.array_equal(points, self._points):
+            self._points = points
+            self.updated = True
 
     # -------------------------------------------------------------------------
     #  Bounds Accessors
     # -------------------------------------------------------------------------
 
-    x0 = BboxProperty('x0')
+    x0 = PointsProperty((0, 0))
 
-    x1 = BboxProperty('x1')
+    x1 = PointsProperty((1, 0))
 
-    y0 = BboxProperty('y0')
+    y0 = PointsProperty((0, 1))
 
-    y1 = BboxProperty('y1')
+    y1 = PointsProperty((1, 1))
 
-    x_limits = BboxProperty('intervalx')
+    x_limits = PointsProperty((slice(None), 0))
 
-    y_limits = BboxProperty('intervaly')
+    y_limits = PointsProperty((slice(None), 1))
 
-    rect = BboxProperty('bounds')
+    rect = Property
 
-    width = BboxProperty('width', readonly=True)
+    width = Property
 
-    height = BboxProperty('height', readonly=True)
+    height = Property
 
     size = Property
 
@@ -174,6 +125,21 @@ class BoundingBox(HasStrictTraits):
         y1 = max(y_max, self.y_limits[1])
         self.rect = (x0, y0, x1 - x0, y1 - y0)
 
+    def _get_rect(self):
+        (x0, y0), (x1, y1) = self._points
+        return (x0, y0, x1 - x0, y1 - y0)
+
+    def _set_rect(self, rect):
+        x0, y0, width, height = rect
+        self._set_points(np.array([[x0, y0], [x0 + width, y0 + height]],
+                                  dtype=np.float64))
+
+    def _get_width(self):
+        return self._points[1, 0] - self._points[0, 0]
+
+    def _get_height(self):
+        return self._points[1, 1] - self._points[0, 1]
+
     def _get_size(self):
         return (self.width, self.height)
 
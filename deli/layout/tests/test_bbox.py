@@ -1,6 +1,7 @@
 from contextlib import contextmanager
 from unittest import TestCase
 
+import numpy as np
 from numpy.testing import assert_allclose, assert_raises
 
 from traits.api import TraitError
@@ -93,3 +94,38 @@ class TestSetProperties(TestCase, UnittestTools):
         with self.assert_bbox_updated():
             self.bbox.y_limits = (20, 40)
         assert_allclose(self.bbox.y_limits, (20, 40))
+
+    def test_rect_updated(self):
+        with self.assert_bbox_updated():
+            self.bbox.rect = (10, 20, 30, 40)
+        assert_allclose(self.bbox.rect, (10, 20, 30, 40))
+
+    def test_unchanged_bounds_not_updated(self):
+        with self.assertTraitDoesNotChange(self.bbox, 'updated'):
+            self.bbox.x_limits = (1, 3)
+            self.bbox.rect = (1, 2, 2, 2)
+
+
+def test_limits_are_copies():
+    bbox = BoundingBox.from_extents(1, 2, 3, 4)
+    x_limits = bbox.x_limits
+    x_limits[0] = 100
+    assert_allclose(bbox.x0, 1)
+
+
+def test_copy():
+    bbox = BoundingBox.from_extents(1, 2, 3, 4)
+    bbox_copy = bbox.copy()
+    bbox_copy.x0 = 0
+    assert_allclose(bbox.x0, 1)
+
+
+def test_update_from_data():
+    small = BoundingBox.from_rect(BoundingBox.from_extents(1, 2, 3, 4).rect)
+    small.update_from_x_data(np.array([3]))
+    small.update_from_y_data(np.array([3]))
+    assert_allclose(small.x_limits, (1, 3))
+    assert_allclose(small.y_limits, (2, 4))
+
+    small.update_from_x_data(np.array([0, 5]))
+    assert_allclose(small.x_limits, (0, 5))
@@ -0,0 +1,178 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from deli.layout.bbox_transform import (
+    Affine2D, BboxTransform, IdentityTransform, blend_xy_transforms
+)
+from deli.layout.bounding_box import BoundingBox
+
+
+# -------------------------------------------------------------------------
+#  Utilities and test data
+# -------------------------------------------------------------------------
+
+SMALL = BoundingBox.from_extents(1, 2, 3, 4)
+MEDIUM = BoundingBox.from_extents(10, 20, 30, 40)
+LARGE = BoundingBox.from_extents(100, 200, 300, 400)
+
+
+def _test_transform_corners(transform_instance, bbox0, bbox1):
+    transform = transform_instance.transform
+    assert_allclose(transform((bbox0.x0, bbox0.y0)), (bbox1.x0, bbox1.y0))
+    assert_allclose(transform((bbox0.x1, bbox0.y0)), (bbox1.x1, bbox1.y0))
+    assert_allclose(transform((bbox0.x0, bbox0.y1)), (bbox1.x0, bbox1.y1))
+    assert_allclose(transform((bbox0.x1, bbox0.y1)), (bbox1.x1, bbox1.y1))
+
+
+def compose(first, second):
+    """ Return transform applying `first`, then `second`. """
+    def full(matrix):
+        return np.vstack([matrix, [0, 0, 1]])
+    return Affine2D(np.dot(full(second.matrix), full(first.matrix))[:2])
+
+
+# -------------------------------------------------------------------------
+#  Basic tests
+# -------------------------------------------------------------------------
+
+def test_basic():
+    _test_transform_corners(BboxTransform(SMALL, LARGE), SMALL, LARGE)
+
+
+def test_matrix():
+    transform = BboxTransform(SMALL, LARGE)
+    assert_allclose(transform.matrix, [[100, 0, 0], [0, 100, 0]])
+
+
+def test_inverted():
+    inv = BboxTransform(SMALL, LARGE).inverted()
+    _test_transform_corners(inv, LARGE, SMALL)
+
+
+def test_inverted_is_cached():
+    transform = BboxTransform(SMALL, LARGE)
+    assert transform.inverted() is transform.inverted()
+
+
+def test_composite():
+    small_to_medium = BboxTransform(SMALL, MEDIUM)
+    medium_to_large = BboxTransform(MEDIUM, LARGE)
+    composite = compose(small_to_medium, medium_to_large)
+    _test_transform_corners(composite, SMALL, LARGE)
+
+
+def test_composite_inverted():
+    small_to_medium = BboxTransform(SMALL, MEDIUM)
+    medium_to_large = BboxTransform(MEDIUM, LARGE)
+    inv = compose(small_to_medium, medium_to_large).inverted()
+    _test_transform_corners(inv, LARGE, SMALL)
+    # Composing the inverses in the reverse order gives the same transform.
+    reverse = compose(medium_to_large.inverted(), small_to_medium.inverted())
+    assert_allclose(reverse.matrix, inv.matrix)
+
+
+def test_identity():
+    points = np.array([(1.0, 2.0), (3.0, 4.0)])
+    assert_allclose(IdentityTransform().transform(points), points)
+
+
+def test_blended():
+    transform = blend_xy_transforms(BboxTransform(SMALL, LARGE),
+                                    IdentityTransform())
+    assert_allclose(transform.transform([(2, 3)]), [(200, 3)])
+
+
+def test_blended_inverted():
+    transform = blend_xy_transforms(BboxTransform(SMALL, LARGE),
+                                    BboxTransform(SMALL, MEDIUM))
+    inv = transform.inverted()
+    assert_allclose(inv.transform([(200, 30)]), [(2, 3)])
+
+
+# -------------------------------------------------------------------------
+#  Test updates
+# -------------------------------------------------------------------------
+
+def test_updated():
+    # Copy this bbox, since we're going to modify it later.
+    large = LARGE.copy()
+    small_to_medium = BboxTransform(SMALL, MEDIUM)
+    small_to_large = BboxTransform(SMALL, large)
+
+    # Sanity check before manipulating bounds.
+    _test_transform_corners(small_to_large, SMALL, LARGE)
+    _test_transform_corners(small_to_medium, SMALL, MEDIUM)
+
+    # Update bounds of large bbox and test updated transform.
+    large.rect = MEDIUM.rect
+    _test_transform_corners(small_to_large, SMALL, MEDIUM)
+    assert_allclose(LARGE.rect, (100, 200, 200, 200))
+
+
+def test_inverted_updated():
+    large = LARGE.copy()
+    inv = BboxTransform(SMALL, large).inverted()
+    large.rect = MEDIUM.rect
+    _test_transform_corners(inv, MEDIUM, SMALL)
+
+
+def test_composite_updated():
+    medium = MEDIUM.copy()
+    small_to_medium = BboxTransform(SMALL, medium)
+    medium_to_large = BboxTransform(medium, LARGE)
+    medium.rect = (0, 0, 1, 1)
+    # Both transforms follow the update, so the composite is unchanged.
+    composite = compose(small_to_medium, medium_to_large)
+    _test_transform_corners(composite, SMALL, LARGE)
+
+
+def test_blended_updated():
+    large = LARGE.copy()
+    transform = blend_xy_transforms(IdentityTransform(),
+                                    BboxTransform(SMALL, large))
+    large.y_limits = (0, 20)
+    assert_allclose(transform.transform([(2, 3)]), [(2, 10)])
+
+
+# -------------------------------------------------------------------------
+#  Test transform inputs and outputs
+# -------------------------------------------------------------------------
+
+def test_transform_list_of_points():
+    trans = BboxTransform(SMALL, LARGE)
+    result = trans.transform([(SMALL.x0, SMALL.y0),
+                              (SMALL.x1, SMALL.y1)])
+    expected = [(LARGE.x0, LARGE.y0),
+                (LARGE.x1, LARGE.y1)]
+    assert_allclose(result, expected)
+
+
+def test_transform_array():
+    trans = BboxTransform(SMALL, LARGE)
+    result = trans.transform(np.array([(SMALL.x0, SMALL.y0),
+                                       (SMALL.x1, SMALL.y1)]))
+    expected = [(LARGE.x0, LARGE.y0),
+                (LARGE.x1, LARGE.y1)]
+    assert_allclose(result, expected)
+
+
+def test_transform_integer_points():
+    trans = BboxTransform(SMALL, LARGE)
+    result = trans.transform(np.array([(2, 3)]))
+    assert result.dtype == np.float64
+    assert_allclose(result, [(200, 300)])
+
+
+def test_transform_in_place():
+    trans = BboxTransform(SMALL, LARGE)
+    points = np.array([(SMALL.x0, SMALL.y0), (SMALL.x1, SMALL.y1)])
+    result = trans.transform(points, out=points)
+    assert result is points
+    assert_allclose(points, [(LARGE.x0, LARGE.y0), (LARGE.x1, LARGE.y1)])
+
+
+def test_transform_float32_out():
+    trans = BboxTransform(SMALL, LARGE)
+    out = np.empty((1, 2), dtype=np.float32)
+    trans.transform([(2, 3)], out=out)
+    assert_allclose(out, [(200, 300)])
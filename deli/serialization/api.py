@@ -1,9 +1,12 @@
 from importlib import import_module
+
+from . import binary
 from .manager import SerializationManager
 
 
 def register_default_serializers(manager):
-    for mod_name in ('.basic_adapters', '.core_adapters', '.stylus_adapters'):
+    for mod_name in ('.basic_adapters', '.core_adapters', '.artist_adapters',
+                     '.stylus_adapters'):
         module = import_module(mod_name, package='deli.serialization')
         module.register_serializers(manager)
 
@@ -15,3 +18,56 @@ register_default_serializers(serialization_manager)
 def serialize(obj):
     """ Return serialized mapping of the given object. """
     return serialization_manager.serialize(obj)
+
+
+def serialize_binary(obj, compression=None):
+    """ Return serialized tree of the given object and its array buffers.
+
+    Arrays are replaced by references to binary buffers in the returned
+    `SerializedBlob`; see `deli.serialization.binary` for details.
+
+    Parameters
+    ----------
+    obj : object
+        Object to serialize.
+    compression : {None, 'zlib'}
+        Compression applied to array buffers.
+    """
+    return binary.serialize_binary(obj, serialization_manager,
+                                   compression=compression)
+
+
+def dump(obj, file, compression=None):
+    """ Write the given object to a binary file with its arrays as buffers.
+
+    `file` is a path or a binary file object.
+    """
+    binary.dump(obj, file, serialization_manager, compression=compression)
+
+
+def dumps(obj, compression=None):
+    """ Return the given object serialized to bytes, as written by `dump`. """
+    return binary.dumps(obj, serialization_manager, compression=compression)
+
+
+def deserialize(blob):
+    """ Return object rebuilt from the output of `serialize` or
+    `serialize_binary`.
+    """
+    if isinstance(blob, binary.SerializedBlob):
+        return binary.deserialize_binary(blob, serialization_manager)
+    return serialization_manager.deserialize(blob)
+
+
+def load(file, mmap=True):
+    """ Return object read from a binary file written by `dump`.
+
+    If `file` is a path and `mmap` is True, uncompressed arrays are
+    memory-mapped, so they're only read from disk when they're accessed.
+    """
+    return binary.load(file, serialization_manager, mmap=mmap)
+
+
+def loads(data):
+    """ Return object read from bytes returned by `dumps`. """
+    return binary.loads(data, serialization_manager)
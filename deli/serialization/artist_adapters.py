@@ -0,0 +1,33 @@
+from traits.api import List, Str
+
+from ..artist.base_point_artist import BasePointArtist
+from ..artist.image_artist import ImageArtist
+from .core_adapters import component_attrs
+from .default_adapter import DefaultAdapter, deserialize_children
+
+
+image_artist_attrs = component_attrs + ['data']
+
+
+class PointArtistAdapter(DefaultAdapter):
+    """ Adapter for point artists, which serialize the data they draw.
+
+    The data of an attached data source is serialized as `x_data` and
+    `y_data`, which are what deserialization sets.
+    """
+
+    children = List(Str, value=component_attrs)
+
+    def _serialize_hook(self, handler):
+        x, y = self.adaptee.get_data()
+        return {'x_data': handler.serialize(x),
+                'y_data': handler.serialize(y)}
+
+    def _deserialize_hook(self, blob, handler):
+        deserialize_children(self.adaptee, blob, ['x_data', 'y_data'],
+                             handler)
+
+
+def register_serializers(manager):
+    manager.register(PointArtistAdapter, BasePointArtist)
+    manager.register_attrs(image_artist_attrs, ImageArtist)
@@ -3,30 +3,54 @@ import numpy as np
 from .default_adapter import DefaultAdapter
 
 
+def serialize_value(obj, handler):
+    return obj
+
+
+def serialize_list(obj, handler):
+    return [handler.serialize(value) for value in obj]
+
+
+def serialize_dict(obj, handler):
+    return {key: handler.serialize(value) for key, value in obj.iteritems()}
+
+
 class ValueAdapter(DefaultAdapter):
 
     def serialize(self, handler):
-        return self.adaptee
+        return serialize_value(self.adaptee, handler)
 
 
 class ListAdapter(DefaultAdapter):
 
     def serialize(self, handler):
-        return [handler.serialize(value) for value in self.adaptee]
+        return serialize_list(self.adaptee, handler)
+
+
+class ArrayAdapter(DefaultAdapter):
+
+    def serialize(self, handler):
+        return handler.serialize_array(self.adaptee)
 
 
 class DictAdapter(DefaultAdapter):
 
     def serialize(self, handler):
-        dict_obj = self.adaptee
-        return {key: handler.serialize(value)
-                for key, value in dict_obj.iteritems()}
+        return serialize_dict(self.adaptee, handler)
 
 
 def register_serializers(manager):
-    manager.register(ValueAdapter, int)
-    manager.register(ValueAdapter, float)
-    manager.register(ValueAdapter, str)
+    # Strings are unicode after a round trip through JSON on Python 2.
+    value_types = set([int, float, str, type(u'')])
+    for value_type in value_types:
+        manager.register(ValueAdapter, value_type)
     manager.register(ListAdapter, list)
     manager.register(DictAdapter, dict)
-    manager.register(ValueAdapter, np.ndarray)
+    manager.register(ArrayAdapter, np.ndarray)
+
+    # Builtins make up most of a serialized tree, so skip adapter lookup for
+    # them. Subclasses (e.g. traits' list and dict objects) use the adapters.
+    for value_type in value_types:
+        manager.register_fast_path(serialize_value, value_type)
+    manager.register_fast_path(serialize_list, list)
+    manager.register_fast_path(serialize_dict, dict)
@@ -0,0 +1,298 @@
+""" Serialization to a JSON tree with arrays stored in separate binary buffers.
+
+Arrays in the serialized tree are replaced by reference nodes::
+
+    {'__protocol__': 'ndarray', '__version__': 1, 'buffer': 0,
+     'dtype': '<f8', 'shape': [1000000], 'compression': None}
+
+where `buffer` is an index into the list of binary buffers. Buffers hold the
+C-ordered, little-endian bytes of the array, compressed with `zlib` if the
+reference node's `compression` is 'zlib'.
+
+A serialized tree can be written to a single file (see `dump`) and read back
+(see `load`). The file is laid out as::
+
+    MAGIC | header length (uint64, little-endian) | JSON header | buffers
+
+The JSON header contains the tree, and the offset and size of each buffer.
+Buffers are aligned to `ALIGNMENT` bytes (relative to the start of the file)
+so that uncompressed arrays can be memory-mapped: loading a file only reads
+its header, and array data is read from disk when it's first accessed.
+"""
+import json
+import struct
+import zlib
+from collections import namedtuple
+
+import numpy as np
+
+from .manager import ARRAY_PROTOCOL
+
+
+__all__ = ['ALIGNMENT', 'ARRAY_PROTOCOL', 'BinaryDeserializer',
+           'BinarySerializer', 'FORMAT_VERSION', 'MAGIC', 'SerializedBlob',
+           'deserialize_binary', 'dump', 'dumps', 'load', 'loads', 'read_blob',
+           'serialize_binary', 'write_blob']
+
+
+MAGIC = b'DELIBLOB'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+HEADER_LENGTH_FORMAT = '<Q'
+
+ARRAY_VERSION = 1
+COMPRESSION_TYPES = (None, 'zlib')
+
+
+#: Serialized tree and the binary buffers it references.
+SerializedBlob = namedtuple('SerializedBlob', ['tree', 'buffers'])
+
+
+class BinarySerializer(object):
+    """ Serialization handler that stores arrays in separate binary buffers.
+
+    Adapters call `serialize` on the handler passed to them to serialize
+    child objects, so this handler is used in place of the manager.
+
+    Parameters
+    ----------
+    manager : SerializationManager
+        Manager with the adapters used to serialize objects.
+    compression : {None, 'zlib'}
+        Compression applied to array buffers.
+    compression_level : int
+        Level of compression, from 1 (fastest) to 9 (smallest).
+    """
+
+    def __init__(self, manager, compression=None, compression_level=6):
+        if compression not in COMPRESSION_TYPES:
+            msg = "Unknown compression {!r}; expected one of {}."
+            raise ValueError(msg.format(compression, COMPRESSION_TYPES))
+        self.manager = manager
+        self.compression = compression
+        self.compression_level = compression_level
+        #: Bytes of the buffers referenced by the serialized tree.
+        self.buffers = []
+
+    def serialize(self, obj):
+        return self.manager.serialize(obj, handler=self)
+
+    def serialize_array(self, array):
+        """ Store `array` in a buffer and return a reference node. """
+        if array.dtype.hasobject:
+            return self.serialize(array.tolist())
+
+        dtype = array.dtype.newbyteorder('<')
+        array = np.asarray(array, dtype=dtype)
+        # Copying the data into bytes is a single memcpy for C-ordered arrays.
+        data = array.tobytes()
+        if self.compression == 'zlib':
+            data = zlib.compress(data, self.compression_level)
+
+        self.buffers.append(data)
+        return {'__protocol__': ARRAY_PROTOCOL,
+                '__version__': ARRAY_VERSION,
+                'buffer': len(self.buffers) - 1,
+                'dtype': dtype.str,
+                'shape': list(array.shape),
+                'compression': self.compression}
+
+
+class BinaryDeserializer(object):
+    """ Deserialization handler that reads arrays from binary buffers.
+
+    Parameters
+    ----------
+    manager : SerializationManager
+        Manager with the adapters used to deserialize objects.
+    buffers : list of bytes or uint8 arrays
+        Buffers referenced by the serialized tree. Arrays are returned as
+        views of uncompressed buffers given as arrays (e.g. memory-maps), so
+        their data is never copied.
+    """
+
+    def __init__(self, manager, buffers):
+        self.manager = manager
+        self.buffers = buffers
+
+    def deserialize(self, blob, obj=None):
+        return self.manager.deserialize(blob, obj, handler=self)
+
+    def deserialize_array(self, node):
+        """ Return the array referenced by a reference node. """
+        data = self.buffers[node['buffer']]
+        dtype = np.dtype(str(node['dtype']))
+        if node['compression'] == 'zlib':
+            data = zlib.decompress(data)
+        elif node['compression'] is not None:
+            msg = "Unknown compression {!r}"
+            raise ValueError(msg.format(node['compression']))
+
+        if isinstance(data, np.ndarray):
+            array = data.view(dtype)
+        else:
+            array = np.frombuffer(data, dtype=dtype)
+        return array.reshape(node['shape'])
+
+
+def serialize_binary(obj, manager, **kwargs):
+    """ Return the serialized tree of `obj` and the array buffers it uses.
+
+    See `BinarySerializer` for a description of keyword arguments.
+    """
+    serializer = BinarySerializer(manager, **kwargs)
+    tree = serializer.serialize(obj)
+    return SerializedBlob(tree, serializer.buffers)
+
+
+def deserialize_binary(blob, manager):
+    """ Return object rebuilt from a `SerializedBlob`. """
+    return BinaryDeserializer(manager, blob.buffers).deserialize(blob.tree)
+
+
+def dump(obj, file, manager, **kwargs):
+    """ Serialize `obj` and write it to a binary `file`, given as a path or
+    a file object.
+
+    See `BinarySerializer` for a description of keyword arguments.
+    """
+    blob = serialize_binary(obj, manager, **kwargs)
+    write_blob(blob, file)
+
+
+def dumps(obj, manager, **kwargs):
+    """ Return `obj` serialized to bytes in the format written by `dump`. """
+    from io import BytesIO
+
+    stream = BytesIO()
+    dump(obj, stream, manager, **kwargs)
+    return stream.getvalue()
+
+
+def load(file, manager, mmap=True):
+    """ Return object read from a file written by `dump`.
+
+    Parameters
+    ----------
+    file : str or file-like
+        Path or binary file object.
+    manager : SerializationManager
+        Manager with the adapters used to deserialize objects.
+    mmap : bool
+        If True and `file` is a path, uncompressed arrays are memory-mapped
+        (read-only) instead of being read into memory.
+    """
+    return deserialize_binary(read_blob(file, mmap=mmap), manager)
+
+
+def loads(data, manager):
+    """ Return object read from bytes in the format written by `dump`.
+
+    Uncompressed arrays are read-only views of `data`.
+    """
+    from io import BytesIO
+
+    header, data_start = _read_header(BytesIO(data))
+    data = np.frombuffer(data, dtype=np.uint8)[data_start:]
+    return deserialize_binary(_blob_from_data(header, data), manager)
+
+
+def read_blob(file, mmap=True):
+    """ Return `SerializedBlob` read from a file written by `dump`.
+
+    See `load` for a description of the parameters.
+    """
+    if not hasattr(file, 'read'):
+        with open(file, 'rb') as f:
+            header, data_start = _read_header(f)
+            if not mmap:
+                return _blob_from_data(header, _read_data(f))
+        if not header['buffers']:
+            data = np.empty(0, dtype=np.uint8)
+        else:
+            data = np.memmap(file, dtype=np.uint8, mode='r',
+                             offset=data_start)
+        return _blob_from_data(header, data)
+
+    header, data_start = _read_header(file)
+    return _blob_from_data(header, _read_data(file))
+
+
+def write_blob(blob, file):
+    """ Write a serialized tree and its buffers to a binary `file`, given as
+    a path or a file object.
+    """
+    if not hasattr(file, 'write'):
+        with open(file, 'wb') as f:
+            write_blob(blob, f)
+        return
+
+    buffer_sizes = [len(data) for data in blob.buffers]
+
+    # Buffer offsets are relative to the end of the (padded) header, so they
+    # don't depend on the length of the header that contains them.
+    offsets = []
+    offset = 0
+    for size in buffer_sizes:
+        offsets.append(offset)
+        offset = _align(offset + size)
+
+    header = {'version': FORMAT_VERSION,
+              'tree': blob.tree,
+              'buffers': [{'offset': offset, 'nbytes': size}
+                          for offset, size in zip(offsets, buffer_sizes)]}
+    header_bytes = json.dumps(header, separators=(',', ':'),
+                              default=_to_json).encode('utf-8')
+    header_end = len(MAGIC) + struct.calcsize(HEADER_LENGTH_FORMAT)
+    header_end += len(header_bytes)
+    # Pad the header so the buffers start at an aligned position.
+    header_bytes += b' ' * (_align(header_end) - header_end)
+
+    file.write(MAGIC)
+    file.write(struct.pack(HEADER_LENGTH_FORMAT, len(header_bytes)))
+    file.write(header_bytes)
+    position = 0
+    for offset, size, data in zip(offsets, buffer_sizes, blob.buffers):
+        file.write(b'\0' * (offset - position))
+        file.write(data)
+        position = offset + size
+
+
+# -----------------------------------------------------------------------------
+#  Helper functions
+# -----------------------------------------------------------------------------
+
+def _read_header(file):
+    """ Return header read from `file`, and the position where it ends. """
+    magic = file.read(len(MAGIC))
+    if magic != MAGIC:
+        raise ValueError("File isn't a serialized deli object.")
+    length_size = struct.calcsize(HEADER_LENGTH_FORMAT)
+    length, = struct.unpack(HEADER_LENGTH_FORMAT, file.read(length_size))
+    header = json.loads(file.read(length).decode('utf-8'))
+    if header['version'] > FORMAT_VERSION:
+        msg = "Can't read format version {} (latest is {})."
+        raise ValueError(msg.format(header['version'], FORMAT_VERSION))
+    return header, len(MAGIC) + length_size + length
+
+
+def _read_data(file):
+    return np.frombuffer(file.read(), dtype=np.uint8)
+
+
+def _blob_from_data(header, data):
+    """ Return `SerializedBlob` with buffers that are views of `data`. """
+    buffers = [data[info['offset']:info['offset'] + info['nbytes']]
+               for info in header['buffers']]
+    return SerializedBlob(header['tree'], buffers)
+
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _to_json(obj):
+    """ Convert numpy scalars, which `json` doesn't recognize. """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError("{!r} is not JSON serializable".format(obj))
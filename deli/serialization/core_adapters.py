@@ -1,14 +1,56 @@
+from traits.api import List, Str
+
 from ..core.component import Component
 from ..canvas import Canvas
 from ..graph import Graph
+from ..layout.bounding_box import BoundingBox
+from ..plot_label import PlotLabel
+from .default_adapter import DefaultAdapter
 
 
 component_attrs = ['origin', 'size']
 graph_attrs = component_attrs + ['canvas', 'title']
 canvas_attrs = component_attrs + ['artists']
+plot_label_attrs = component_attrs + ['text']
+
+
+class BoundingBoxAdapter(DefaultAdapter):
+
+    def _serialize_hook(self, handler):
+        return {'rect': handler.serialize(list(self.adaptee.rect))}
+
+    def _deserialize_hook(self, blob, handler):
+        self.adaptee.rect = blob['rect']
+
+
+class CanvasAdapter(DefaultAdapter):
+    """ Adapter for canvases, which add deserialized artists to themselves.
+    """
+
+    children = List(Str, value=component_attrs)
+
+    def _serialize_hook(self, handler):
+        canvas = self.adaptee
+        return {'artists': handler.serialize(canvas.artists),
+                'data_bbox': handler.serialize(canvas.data_bbox)}
+
+    def _deserialize_hook(self, blob, handler):
+        canvas = self.adaptee
+        for name, artist_blob in sorted(blob.get('artists', {}).items()):
+            old = canvas.artists.get(name)
+            artist = handler.deserialize(artist_blob, old)
+            if artist is not old:
+                if old is not None:
+                    canvas.remove(old)
+                canvas.add_artist(artist, name=name)
+        # Adding artists expands the data bounds, so restore them afterwards.
+        if 'data_bbox' in blob:
+            handler.deserialize(blob['data_bbox'], canvas.data_bbox)
 
 
 def register_serializers(manager):
     manager.register_attrs(component_attrs, Component)
     manager.register_attrs(graph_attrs, Graph)
-    manager.register_attrs(canvas_attrs, Canvas)
+    manager.register(CanvasAdapter, Canvas)
+    manager.register(BoundingBoxAdapter, BoundingBox)
+    manager.register_attrs(plot_label_attrs, PlotLabel)
@@ -9,6 +9,18 @@ def serialize_children(obj, children, handler):
     return {name: handler.serialize(getattr(obj, name)) for name in children}
 
 
+def deserialize_children(obj, blob, children, handler):
+    """ Set the attributes of `obj` named in `children` from `blob`.
+
+    Objects that are already present with the same protocol are updated in
+    place instead of being replaced.
+    """
+    for name in children:
+        if name in blob:
+            current = getattr(obj, name, None)
+            setattr(obj, name, handler.deserialize(blob[name], current))
+
+
 class DefaultAdapter(Adapter):
 
     version = Constant(1)
@@ -28,6 +40,20 @@ class DefaultAdapter(Adapter):
     def _serialize_hook(self, handler):
         return {}
 
+    def deserialize(self, blob, handler):
+        """ Update adaptee from serialized `blob` and return it. """
+        if blob['__version__'] > self.version:
+            msg = "Can't deserialize version {} of {!r} (latest is {})."
+            raise ValueError(msg.format(blob['__version__'],
+                                        blob['__protocol__'], self.version))
+        obj = self.adaptee
+        deserialize_children(obj, blob, self.children, handler)
+        self._deserialize_hook(blob, handler)
+        return obj
+
+    def _deserialize_hook(self, blob, handler):
+        pass
+
 
 def create_simple_adapter(children_names):
     class SimpleAdapter(DefaultAdapter):
@@ -1,9 +1,18 @@
 from abc import abstractmethod
+from functools import cmp_to_key
 
-from traits.api import ABCHasStrictTraits, Type
+from traits.api import ABCHasStrictTraits, Callable, Dict, Str, Type
 from traits.adaptation.api import AdaptationManager
+from traits.adaptation.adaptation_manager import (
+    _by_weight_then_from_protocol_specificity
+)
 
-from .default_adapter import create_simple_adapter
+from . import snapshot
+from .default_adapter import create_simple_adapter, get_protocol
+
+
+#: Protocol of serialized arrays that reference a binary buffer.
+ARRAY_PROTOCOL = 'ndarray'
 
 
 class ISerializeFactory(ABCHasStrictTraits):
@@ -17,21 +26,167 @@ class SerializationManager(AdaptationManager):
 
     _interface = Type(ISerializeFactory)
 
+    #: Classes that can be deserialized, keyed by their protocol name.
+    _protocol_classes = Dict(Str, Type)
+
+    #: Adapter factories resolved for each type of serialized object.
+    _adapter_cache = Dict(Type, Callable)
+
+    #: Functions that serialize objects of exactly the given type without
+    #: adaptation, given `obj` and `handler` arguments.
+    _fast_paths = Dict(Type, Callable)
+
     def __init__(self, *args, **traits):
         super(SerializationManager, self).__init__(*args, **traits)
 
     def register(self, serialize_func, from_protocol):
         self.register_factory(serialize_func, from_protocol, self._interface)
 
+    def register_offer(self, offer):
+        """ Register an offer to adapt from one protocol to another.
+
+        Unlike the base `AdaptationManager`, where the first offer
+        registered for a protocol wins, the newest offer for a protocol takes
+        precedence, so adapters registered later (e.g. by applications)
+        override the default adapters.
+        """
+        # The list of offers is replaced, not modified, since traits fails to
+        # notify changes of lists nested in `_adaptation_offers` and the list
+        # may be shared with a copy of this manager.
+        name = offer.from_protocol_name
+        offers = self._adaptation_offers.get(name, [])
+        self._adaptation_offers[name] = [offer] + list(offers)
+        # The new offer may change the adapter resolved for any type.
+        self._adapter_cache = {}
+        self._protocol_classes = {}
+        self._fast_paths.pop(offer.from_protocol, None)
+
+    def register_fast_path(self, serialize_func, from_type):
+        """ Serialize objects of exactly `from_type` with `serialize_func`.
+
+        This bypasses adapter lookup for the builtin types that make up most
+        of a serialized tree. `serialize_func(obj, handler)` must return the
+        same output as the adapter registered for `from_type`. Registering an
+        adapter for `from_type` afterwards removes the fast path.
+        """
+        self._fast_paths[from_type] = serialize_func
+
     def register_attrs(self, attrs, from_protocol):
         """Register a simple adapter based on the attributes to be serialized.
         """
         adapter = create_simple_adapter(attrs)
         self.register(adapter, from_protocol)
 
-    def serialize(self, obj):
-        serialization_factory = self.adapt(obj, self._interface)
-        return serialization_factory.serialize(self)
+    def serialize(self, obj, handler=None):
+        """ Return serialized output of `obj`.
+
+        `handler` is passed to adapters to serialize child objects and
+        arrays; it defaults to this manager.
+        """
+        if handler is None:
+            handler = self
+        fast_path = self._fast_paths.get(type(obj))
+        if fast_path is not None:
+            return fast_path(obj, handler)
+        return self.get_adapter(obj).serialize(handler)
+
+    def serialize_array(self, array):
+        """ Return serialized array; arrays are returned unchanged.
+
+        Handlers that store arrays separately from the serialized tree (see
+        `deli.serialization.binary`) override this.
+        """
+        return array
+
+    def get_adapter(self, obj):
+        """ Return the serialization adapter for `obj`.
+
+        The factories of offers that adapt objects directly to the
+        serialization interface are cached by type, so the adaptation offers
+        are only searched for the first object of each type.
+        """
+        obj_type = type(obj)
+        factory = self._adapter_cache.get(obj_type)
+        if factory is not None:
+            adapter = factory(obj)
+            # Factories may decline to adapt some objects of a type.
+            if adapter is not None:
+                return adapter
+
+        if self.provides_protocol(obj.__class__, self._interface):
+            return obj
+        for offer in self._direct_offers(obj_type):
+            adapter = offer.factory(obj)
+            if adapter is not None:
+                self._adapter_cache[obj_type] = offer.factory
+                return adapter
+        # Chains of adapters aren't cached.
+        return self.adapt(obj, self._interface)
+
+    def snapshot(self, obj, previous=None):
+        """ Return versioned `Snapshot` of the serialized `obj`.
+
+        The version follows that of the `previous` snapshot, if given.
+        """
+        return snapshot.take_snapshot(obj, self, previous=previous)
+
+    def diff(self, old, new):
+        """ Return list of operations that update snapshot `old` to `new`.
+
+        See `deli.serialization.snapshot` for a description of operations.
+        """
+        return snapshot.diff(old.tree, new.tree)
+
+    def deserialize(self, blob, obj=None, handler=None):
+        """ Return object rebuilt from serialized `blob`.
+
+        Parameters
+        ----------
+        blob : object
+            Output of `serialize`.
+        obj : object, optional
+            Object that is updated in place if it has the protocol of `blob`.
+            Otherwise, a new object is created.
+        handler : object, optional
+            Handler passed to adapters to deserialize child objects and
+            arrays. Defaults to this manager.
+        """
+        if handler is None:
+            handler = self
+
+        if isinstance(blob, list):
+            return [handler.deserialize(value) for value in blob]
+        if not isinstance(blob, dict):
+            return blob
+        if '__protocol__' not in blob:
+            return {key: handler.deserialize(value)
+                    for key, value in blob.items()}
+
+        protocol = blob['__protocol__']
+        if protocol == ARRAY_PROTOCOL:
+            return handler.deserialize_array(blob)
+        if obj is None or get_protocol(obj) != protocol:
+            obj = self.get_protocol_class(protocol)()
+        return self.get_adapter(obj).deserialize(blob, handler)
+
+    def deserialize_array(self, blob):
+        """ Return array from a reference to a binary buffer.
+
+        Buffers are only available when deserializing binary data, see
+        `deli.serialization.binary`.
+        """
+        raise ValueError("Serialized array references a binary buffer, but "
+                         "no buffers were given.")
+
+    def get_protocol_class(self, protocol):
+        """ Return the class named `protocol` that can be deserialized. """
+        if protocol not in self._protocol_classes:
+            # Subclasses may have been defined since the last lookup.
+            self._protocol_classes = self._find_protocol_classes()
+        try:
+            return self._protocol_classes[protocol]
+        except KeyError:
+            raise ValueError("Unknown protocol {!r}".format(protocol))
 
     def is_serializable(self, obj):
         return self.supports_protocol(obj, self._interface)
@@ -40,4 +195,27 @@ class SerializationManager(AdaptationManager):
         cls = self.__class__
         # This copy isn't really necessary since traits `Dict`s are copied.
         adaptation_offers = self._adaptation_offers.copy()
-        return cls(_adaptation_offers=adaptation_offers)
+        return cls(_adaptation_offers=adaptation_offers,
+                   _fast_paths=dict(self._fast_paths))
+
+    def _direct_offers(self, from_type):
+        """ Return offers adapting `from_type` to the serialization interface,
+        in the order they're tried by `adapt`.
+        """
+        edges = [(distance, offer) for distance, offer
+                 in self._get_applicable_offers(from_type, [])
+                 if self.provides_protocol(offer.to_protocol, self._interface)]
+        edges.sort(key=cmp_to_key(_by_weight_then_from_protocol_specificity))
+        return [offer for distance, offer in edges]
+
+    def _find_protocol_classes(self):
+        classes = {}
+        stack = [offer.from_protocol
+                 for offers in self._adaptation_offers.values()
+                 for offer in offers]
+        while stack:
+            cls = stack.pop()
+            if cls.__name__ not in classes:
+                classes[cls.__name__] = cls
+                stack.extend(cls.__subclasses__())
+        return classes
@@ -0,0 +1,282 @@
+""" Versioned snapshots of serialized objects and differences between them.
+
+A difference between two serialized trees is a list of operations, each a
+dict with an 'op' name and the 'path' of keys from the root of the tree:
+
+- {'op': 'set', 'path': path, 'value': value} replaces a value (an empty
+  path replaces the whole tree),
+- {'op': 'remove', 'path': path} removes a key from a dict,
+- {'op': 'append', 'path': path, 'value': array} appends rows to an array,
+  which is how data streamed to an artist is sent,
+- {'op': 'roll', 'path': path, 'drop': n, 'value': array} drops the first
+  `n` rows of an array and appends rows, which is how data streamed to a
+  full `RingBufferDataSource` is sent.
+
+Snapshots copy the arrays of the serialized objects, since arrays such as
+the views of a `RingBufferDataSource` are modified in place. Objects with a
+`data_version` (see `BasePointArtist`) are assumed to change their arrays
+only along with their version: while it's unchanged, the copies of their
+arrays in the previous snapshot are reused, so unchanged data is neither
+copied nor compared (`diff` skips identical objects).
+"""
+import json
+from collections import deque, namedtuple
+
+import numpy as np
+
+
+__all__ = ['Snapshot', 'SnapshotHistory', 'SnapshotSerializer', 'apply_diff',
+           'diff', 'dumps_delta', 'take_snapshot']
+
+
+#: Serialized tree of an object, the version number of the snapshot, and
+#: the copied arrays of objects with a data version, keyed by data version
+#: and order of serialization.
+Snapshot = namedtuple('Snapshot', ['version', 'tree', 'data_arrays'])
+
+#: Maximum number of rows of an old array tried as the start of a new array
+#: when looking for a 'roll' operation.
+MAX_ROLL_CANDIDATES = 4
+
+
+def take_snapshot(obj, manager, previous=None):
+    """ Return a snapshot of `obj` with a version following `previous`.
+
+    Arrays in the serialized tree are copied, except for the arrays of
+    objects whose data version is unchanged since `previous`, which are
+    shared with `previous`.
+    """
+    if previous is None:
+        version, data_arrays = 0, {}
+    else:
+        version, data_arrays = previous.version + 1, previous.data_arrays
+    handler = SnapshotSerializer(manager, data_arrays)
+    tree = handler.serialize(obj)
+    return Snapshot(version, tree, handler.data_arrays)
+
+
+def diff(old, new):
+    """ Return list of operations that update serialized tree `old` to `new`.
+    """
+    operations = []
+    _diff(old, new, [], operations)
+    return operations
+
+
+def apply_diff(tree, operations):
+    """ Return serialized tree updated by `operations`.
+
+    Dicts in `tree` are updated in place.
+    """
+    for operation in operations:
+        path = operation['path']
+        if not path:
+            tree = operation['value']
+            continue
+        parent = tree
+        for key in path[:-1]:
+            parent = parent[key]
+        key = path[-1]
+        if operation['op'] == 'set':
+            parent[key] = operation['value']
+        elif operation['op'] == 'remove':
+            del parent[key]
+        elif operation['op'] == 'append':
+            parent[key] = np.concatenate([parent[key], operation['value']])
+        elif operation['op'] == 'roll':
+            kept = parent[key][operation['drop']:]
+            parent[key] = np.concatenate([kept, operation['value']])
+        else:
+            raise ValueError("Unknown operation {!r}".format(operation['op']))
+    return tree
+
+
+def dumps_delta(delta):
+    """ Return JSON for a delta (see `SnapshotHistory.delta`).
+
+    Arrays are converted to (nested) lists.
+    """
+    return json.dumps(delta, separators=(',', ':'), default=_to_json)
+
+
+class SnapshotSerializer(object):
+    """ Serialization handler that copies arrays.
+
+    Parameters
+    ----------
+    manager : SerializationManager
+        Manager with the adapters used to serialize objects.
+    previous_arrays : dict
+        Copied arrays of objects with a data version, from the previous
+        snapshot; they are reused instead of copied again.
+    """
+
+    def __init__(self, manager, previous_arrays=None):
+        self.manager = manager
+        self.previous_arrays = previous_arrays or {}
+        #: Copied arrays of objects with a data version, keyed by data
+        #: version and order of serialization.
+        self.data_arrays = {}
+        # Data version of the object being serialized and the number of its
+        # arrays serialized so far, or None.
+        self._data_key = None
+
+    def serialize(self, obj):
+        data_version = getattr(obj, 'data_version', None)
+        if data_version is None:
+            return self.manager.serialize(obj, handler=self)
+        outer_key = self._data_key
+        self._data_key = [data_version, 0]
+        try:
+            return self.manager.serialize(obj, handler=self)
+        finally:
+            self._data_key = outer_key
+
+    def serialize_array(self, array):
+        """ Return a copy of `array`, reused while its data is unchanged. """
+        if self._data_key is None:
+            return array.copy()
+        key = tuple(self._data_key)
+        self._data_key[1] += 1
+        copy = self.previous_arrays.get(key)
+        if copy is None:
+            copy = array.copy()
+        self.data_arrays[key] = copy
+        return copy
+
+
+class SnapshotHistory(object):
+    """ Recent snapshots of an object, used to send changes to clients.
+
+    Clients request the changes since the version they last received (see
+    `delta`); clients that are too far behind receive the whole tree.
+
+    Parameters
+    ----------
+    obj : object
+        Object that is serialized.
+    manager : SerializationManager
+        Manager used to serialize `obj`.
+    max_snapshots : int
+        Number of snapshots kept to compute differences.
+    """
+
+    def __init__(self, obj, manager, max_snapshots=16):
+        self.obj = obj
+        self.manager = manager
+        self._snapshots = deque(maxlen=max_snapshots)
+        self._snapshots.append(take_snapshot(obj, manager))
+
+    @property
+    def current(self):
+        """ The latest snapshot. """
+        return self._snapshots[-1]
+
+    def update(self):
+        """ Take a snapshot if the object changed and return the current one.
+        """
+        current = self.current
+        snapshot = take_snapshot(self.obj, self.manager, previous=current)
+        if diff(current.tree, snapshot.tree):
+            self._snapshots.append(snapshot)
+        return self.current
+
+    def delta(self, since=None):
+        """ Return changes since the snapshot with version `since`.
+
+        Returns
+        -------
+        delta : dict
+            The current 'version', and the 'ops' (see `diff`) that update
+            the tree of version `since` to it. If `since` is None or is no
+            longer kept, 'ops' replaces the whole tree.
+        """
+        current = self.current
+        for snapshot in self._snapshots:
+            if snapshot.version == since:
+                operations = diff(snapshot.tree, current.tree)
+                break
+        else:
+            operations = [{'op': 'set', 'path': [], 'value': current.tree}]
+        return {'version': current.version, 'ops': operations}
+
+
+# -----------------------------------------------------------------------------
+#  Helper functions
+# -----------------------------------------------------------------------------
+
+def _diff(old, new, path, operations):
+    if old is new:
+        return
+    if isinstance(old, np.ndarray) or isinstance(new, np.ndarray):
+        _diff_arrays(old, new, path, operations)
+    elif isinstance(old, dict) and isinstance(new, dict):
+        if old.get('__protocol__') != new.get('__protocol__'):
+            operations.append({'op': 'set', 'path': path, 'value': new})
+            return
+        for key in sorted(old):
+            if key not in new:
+                operations.append({'op': 'remove', 'path': path + [key]})
+        for key in sorted(new):
+            if key in old:
+                _diff(old[key], new[key], path + [key], operations)
+            else:
+                operations.append({'op': 'set', 'path': path + [key],
+                                   'value': new[key]})
+    elif isinstance(old, list) and isinstance(new, list):
+        if len(old) != len(new):
+            operations.append({'op': 'set', 'path': path, 'value': new})
+            return
+        for i, (old_item, new_item) in enumerate(zip(old, new)):
+            _diff(old_item, new_item, path + [i], operations)
+    elif type(old) != type(new) or old != new:
+        operations.append({'op': 'set', 'path': path, 'value': new})
+
+
+def _diff_arrays(old, new, path, operations):
+    if isinstance(old, np.ndarray) and isinstance(new, np.ndarray):
+        if old.shape == new.shape and np.array_equal(old, new):
+            return
+        if (old.ndim == new.ndim > 0 and old.dtype == new.dtype and
+                old.shape[1:] == new.shape[1:] and len(old) > 0):
+            drop = _find_dropped_rows(old, new)
+            if drop == 0:
+                operations.append({'op': 'append', 'path': path,
+                                   'value': new[len(old):]})
+                return
+            elif drop is not None:
+                n_kept = len(old) - drop
+                operations.append({'op': 'roll', 'path': path, 'drop': drop,
+                                   'value': new[n_kept:]})
+                return
+    operations.append({'op': 'set', 'path': path, 'value': new})
+
+
+def _find_dropped_rows(old, new):
+    """ Return the number of rows dropped from the start of `old` such that
+    the rest of `old` starts `new`, or None if there's no such number.
+
+    Only the first `MAX_ROLL_CANDIDATES` rows of `old` matching the first row
+    of `new` are tried, and the rows kept from `old` must make up at least
+    half of `new`; otherwise, sending `new` as is costs about as much.
+    """
+    if len(new) == 0:
+        return None
+    n_old = len(old)
+    if len(new) > n_old and np.array_equal(new[:n_old], old):
+        return 0
+    rows = old.reshape(n_old, -1)
+    matches = np.flatnonzero(np.all(rows == np.ravel(new[0]), axis=1))
+    n_kept = n_old - matches
+    candidates = matches[(matches > 0) & (2 * n_kept >= len(new))]
+    for drop in candidates[:MAX_ROLL_CANDIDATES]:
+        n_kept = n_old - drop
+        if n_kept <= len(new) and np.array_equal(new[:n_kept], old[drop:]):
+            return int(drop)
+    return None
+
+
+def _to_json(obj):
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError("{!r} is not JSON serializable".format(obj))
@@ -0,0 +1,124 @@
+import os
+from timeit import default_timer
+
+from mock import patch
+from numpy.testing.decorators import skipif
+from traits.adaptation.api import AdaptationManager
+
+from deli.serialization.api import serialization_manager
+from deli.serialization.default_adapter import DefaultAdapter
+from deli.serialization.manager import SerializationManager
+
+
+class UncachedManager(SerializationManager):
+    """ Manager that adapts every object, as done before adapter caching. """
+
+    def serialize(self, obj, handler=None):
+        return self.adapt(obj, self._interface).serialize(self)
+
+
+def make_data(n_items=2000):
+    return [{'x': float(i), 'label': 'point {}'.format(i), 'ids': [i, i + 1]}
+            for i in range(n_items)]
+
+
+def time_serialize(manager, data, repeat):
+    times = []
+    for i in range(repeat):
+        t_start = default_timer()
+        output = manager.serialize(data)
+        times.append(default_timer() - t_start)
+    return min(times), output
+
+
+@skipif(not os.environ.get('DELI_BENCHMARKS'),
+        "Set DELI_BENCHMARKS=1 to run benchmarks")
+def test_benchmark_builtin_containers():
+    data = make_data()
+    uncached = UncachedManager(
+        _adaptation_offers=serialization_manager._adaptation_offers.copy())
+
+    t_uncached, expected = time_serialize(uncached, data, repeat=3)
+    t_cached, output = time_serialize(serialization_manager, data, repeat=3)
+    assert output == expected
+    assert t_cached * 5 < t_uncached
+
+
+class A(object):
+    pass
+
+
+class B(A):
+    pass
+
+
+class AdapterA(DefaultAdapter):
+    pass
+
+
+class AdapterB(DefaultAdapter):
+    pass
+
+
+@patch.object(SerializationManager, '_get_applicable_offers', autospec=True,
+              side_effect=AdaptationManager._get_applicable_offers)
+def test_offers_searched_once_per_type(get_offers):
+    manager = SerializationManager()
+    manager.register(AdapterA, A)
+    for obj in [A(), A(), B(), A(), B()]:
+        assert manager.serialize(obj)['__protocol__'] == type(obj).__name__
+
+    searched_types = [args[1] for args, kwargs in get_offers.call_args_list]
+    assert searched_types == [A, B]
+
+
+def test_cached_factory_is_called():
+    adapted = []
+
+    def adapt_a(obj):
+        adapted.append(obj)
+        return AdapterA(adaptee=obj)
+
+    manager = SerializationManager()
+    manager.register(adapt_a, A)
+    objects = [A(), A()]
+    for obj in objects:
+        assert isinstance(manager.get_adapter(obj), AdapterA)
+    assert adapted == objects
+
+
+def test_later_offer_overrides_earlier():
+    manager = SerializationManager()
+    manager.register(AdapterA, A)
+    manager.register(AdapterB, A)
+    assert isinstance(manager.get_adapter(A()), AdapterB)
+
+
+def test_adapter_cache_invalidated_on_register():
+    manager = SerializationManager()
+    manager.register(AdapterA, A)
+    assert isinstance(manager.get_adapter(B()), AdapterA)
+    assert B in manager._adapter_cache
+
+    manager.register(AdapterB, B)
+    assert isinstance(manager.get_adapter(B()), AdapterB)
+
+
+def test_fast_path_removed_on_register():
+    manager = serialization_manager.copy()
+    assert int in manager._fast_paths
+
+    class IntAdapter(DefaultAdapter):
+        def serialize(self, handler):
+            return str(self.adaptee)
+
+    manager.register(IntAdapter, int)
+    assert manager.serialize([1, 2]) == ['1', '2']
+    assert serialization_manager.serialize([1, 2]) == [1, 2]
+
+
+def test_copy_has_own_fast_paths():
+    manager = serialization_manager.copy()
+    assert manager._fast_paths is not serialization_manager._fast_paths
+    manager.register_fast_path(lambda obj, handler: 'float', float)
+    assert serialization_manager.serialize(1.5) == 1.5
@@ -0,0 +1,92 @@
+import json
+import struct
+import zlib
+from io import BytesIO
+
+import numpy as np
+from numpy.testing import assert_equal
+
+from deli.artist.line_artist import LineArtist
+from deli.serialization import binary
+from deli.serialization.api import (dump, dumps, serialization_manager,
+                                    serialize, serialize_binary)
+
+
+def read_buffer(blob, node):
+    data = blob.buffers[node['buffer']]
+    if node['compression'] == 'zlib':
+        data = zlib.decompress(data)
+    array = np.frombuffer(data, dtype=node['dtype'])
+    return array.reshape(node['shape'])
+
+
+def test_serialize_keeps_arrays():
+    artist = LineArtist(x_data=np.arange(5), y_data=np.arange(5))
+    output = serialize(artist)
+    assert isinstance(output['x_data'], np.ndarray)
+
+
+def test_array_reference():
+    artist = LineArtist(x_data=np.arange(5.0), y_data=np.ones(5))
+    blob = serialize_binary(artist)
+
+    node = blob.tree['x_data']
+    assert node['__protocol__'] == binary.ARRAY_PROTOCOL
+    assert node['dtype'] == '<f8'
+    assert node['shape'] == [5]
+    assert len(blob.buffers) == 2
+    assert_equal(read_buffer(blob, node), np.arange(5.0))
+    assert_equal(read_buffer(blob, blob.tree['y_data']), np.ones(5))
+
+
+def test_big_endian_and_non_contiguous_arrays():
+    array = np.arange(12, dtype='>i4').reshape(3, 4).T
+    blob = binary.serialize_binary(array, serialization_manager)
+    assert blob.tree['dtype'] == '<i4'
+    assert blob.tree['shape'] == [4, 3]
+    assert_equal(read_buffer(blob, blob.tree), array)
+
+
+def test_compression():
+    array = np.zeros(10000)
+    blob = serialize_binary(array, compression='zlib')
+    assert blob.tree['compression'] == 'zlib'
+    assert len(blob.buffers[0]) < array.nbytes
+    assert_equal(read_buffer(blob, blob.tree), array)
+
+
+def test_unknown_compression():
+    try:
+        serialize_binary(np.zeros(3), compression='lzma')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError")
+
+
+def test_dump_layout():
+    artist = LineArtist(x_data=np.arange(3.0), y_data=np.arange(7.0))
+    stream = BytesIO()
+    dump(artist, stream)
+    data = stream.getvalue()
+    assert data == dumps(artist)
+
+    assert data.startswith(binary.MAGIC)
+    start = len(binary.MAGIC)
+    header_size = struct.calcsize(binary.HEADER_LENGTH_FORMAT)
+    header_length, = struct.unpack(binary.HEADER_LENGTH_FORMAT,
+                                   data[start:start + header_size])
+    data_start = start + header_size + header_length
+    assert data_start % binary.ALIGNMENT == 0
+
+    header = json.loads(data[start + header_size:data_start].decode('utf-8'))
+    assert header['version'] == binary.FORMAT_VERSION
+    for name, expected in (('x_data', np.arange(3.0)),
+                           ('y_data', np.arange(7.0))):
+        node = header['tree'][name]
+        info = header['buffers'][node['buffer']]
+        assert info['offset'] % binary.ALIGNMENT == 0
+        offset = data_start + info['offset']
+        array = np.frombuffer(data[offset:offset + info['nbytes']],
+                              dtype=node['dtype'])
+        assert_equal(array, expected)
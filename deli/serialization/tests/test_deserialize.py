@@ -0,0 +1,135 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+
+from deli.artist.line_artist import LineArtist
+from deli.graph import Graph
+from deli.serialization.api import (deserialize, dump, dumps, load, loads,
+                                    serialization_manager, serialize,
+                                    serialize_binary)
+from deli.testing.mock_view import MockView
+
+
+x = np.linspace(0, 10, 100)
+y = np.sin(x)
+
+
+class Demo(MockView):
+
+    def setup_graph(self):
+        graph = Graph()
+        graph.title.text = "Line Artist"
+        graph.add_artist(LineArtist(x_data=x, y_data=y), name='line')
+        return graph
+
+
+def init_demo():
+    demo = Demo()
+    demo.do_layout()
+    return demo
+
+
+def check_graph(graph):
+    assert isinstance(graph, Graph)
+    assert graph.title.text == "Line Artist"
+    artist = graph.canvas.artists['line']
+    assert isinstance(artist, LineArtist)
+    assert_equal(artist.x_data, x)
+    assert_equal(artist.y_data, y)
+    assert artist.data_bbox is graph.canvas.data_bbox
+    assert_allclose(graph.canvas.data_bbox.rect, (0, -1, 10, 2), atol=0.01)
+
+
+def is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = getattr(array, 'base', None)
+    return False
+
+
+def test_deserialize():
+    demo = init_demo()
+    graph = deserialize(serialize(demo.graph))
+    check_graph(graph)
+    assert_allclose(graph.size, demo.graph.size)
+
+
+def test_deserialize_binary():
+    demo = init_demo()
+    check_graph(deserialize(serialize_binary(demo.graph)))
+    check_graph(loads(dumps(demo.graph, compression='zlib')))
+
+
+def test_deserialize_in_place():
+    demo = init_demo()
+    blob = serialize(demo.graph)
+    graph = Graph()
+    canvas = graph.canvas
+    assert serialization_manager.deserialize(blob, graph) is graph
+    assert graph.canvas is canvas
+    check_graph(graph)
+
+
+def test_deserialized_graph_renders():
+    demo = init_demo()
+    graph = loads(dumps(demo.graph))
+
+    class LoadedDemo(Demo):
+        def setup_graph(self):
+            return graph
+
+    loaded = LoadedDemo()
+    loaded.show()
+    assert loaded.context.draw_path.called or loaded.context.stroke_path.called
+
+
+def test_unknown_protocol():
+    try:
+        deserialize({'__protocol__': 'NotAClass', '__version__': 1})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError")
+
+
+def test_newer_version():
+    blob = serialize(LineArtist(x_data=x, y_data=y))
+    blob['__version__'] += 1
+    try:
+        deserialize(blob)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError")
+
+
+class TestLoadFile(object):
+
+    def setup(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'graph.deli')
+
+    def teardown(self):
+        shutil.rmtree(self.directory)
+
+    def test_load_mmap(self):
+        with open(self.path, 'wb') as f:
+            dump(init_demo().graph, f)
+        graph = load(self.path)
+        check_graph(graph)
+        assert is_memory_mapped(graph.canvas.artists['line'].x_data)
+
+    def test_dump_to_path(self):
+        dump(init_demo().graph, self.path)
+        check_graph(load(self.path))
+
+    def test_load_without_mmap(self):
+        with open(self.path, 'wb') as f:
+            dump(init_demo().graph, f, compression='zlib')
+        check_graph(load(self.path, mmap=False))
+        with open(self.path, 'rb') as f:
+            check_graph(load(f))
@@ -0,0 +1,160 @@
+import json
+
+import numpy as np
+from mock import patch
+from numpy.testing import assert_equal
+
+from deli.artist.line_artist import LineArtist
+from deli.graph import Graph
+from deli.serialization.api import serialization_manager, serialize
+from deli.serialization.snapshot import (SnapshotHistory, apply_diff, diff,
+                                         dumps_delta)
+from deli.utils.ring_buffer import RingBufferDataSource
+
+
+def make_graph(n_points=10):
+    graph = Graph()
+    x = np.arange(n_points, dtype=float)
+    graph.add_artist(LineArtist(x_data=x, y_data=x), name='line')
+    return graph
+
+
+def artist_path(name):
+    return ['canvas', 'artists', 'line', name]
+
+
+def test_snapshot_versions():
+    graph = make_graph()
+    first = serialization_manager.snapshot(graph)
+    second = serialization_manager.snapshot(graph, previous=first)
+    assert (first.version, second.version) == (0, 1)
+    assert serialization_manager.diff(first, second) == []
+
+
+def test_diff_appended_data():
+    graph = make_graph()
+    old = serialize(graph)
+    artist = graph.canvas.artists['line']
+    x = np.arange(15, dtype=float)
+    artist.set(x_data=x, y_data=x)
+    graph.canvas.data_bbox.rect = (0, 0, 14, 14)
+    new = serialize(graph)
+
+    operations = diff(old, new)
+    appended = [op for op in operations if op['op'] == 'append']
+    assert [op['path'] for op in appended] == [artist_path('x_data'),
+                                               artist_path('y_data')]
+    assert_equal(appended[0]['value'], np.arange(10, 15))
+    assert {'op': 'set', 'path': ['canvas', 'data_bbox', 'rect', 2],
+            'value': 14.0} in operations
+
+    updated = apply_diff(old, operations)
+    assert_equal(updated['canvas']['artists']['line']['x_data'], x)
+    assert diff(updated, new) == []
+
+
+def test_diff_rolled_data():
+    old = {'a': np.arange(10), 'b': np.arange(20).reshape(10, 2)}
+    new = {'a': np.arange(3, 13), 'b': np.arange(4, 24).reshape(10, 2)}
+    operations = diff(old, new)
+    assert [(op['op'], op['path'], op['drop']) for op in operations] == [
+        ('roll', ['a'], 3), ('roll', ['b'], 2)]
+    assert_equal(operations[0]['value'], [10, 11, 12])
+
+    updated = apply_diff(old, operations)
+    assert diff(updated, new) == []
+
+
+def test_diff_replaced_data():
+    old = {'a': np.arange(5), 'b': 1, 'c': 'removed'}
+    new = {'a': np.arange(5)[::-1], 'b': 2}
+    operations = diff(old, new)
+    assert [(op['op'], op['path']) for op in operations] == [
+        ('remove', ['c']), ('set', ['a']), ('set', ['b'])]
+
+
+def test_history_delta():
+    graph = make_graph()
+    history = SnapshotHistory(graph, serialization_manager, max_snapshots=2)
+    assert history.update().version == 0
+
+    delta = history.delta()
+    assert delta['ops'][0]['path'] == []
+    assert delta['version'] == 0
+
+    for n_points in (11, 12):
+        x = np.arange(n_points, dtype=float)
+        graph.canvas.artists['line'].set(x_data=x, y_data=x)
+        history.update()
+    assert history.current.version == 2
+
+    delta = history.delta(since=1)
+    assert all(op['op'] == 'append' for op in delta['ops'])
+    # Version 0 is no longer kept, so the whole tree is sent.
+    assert history.delta(since=0)['ops'][0]['path'] == []
+
+    decoded = json.loads(dumps_delta(history.delta(since=1)))
+    assert decoded['ops'][0]['value'] == [11.0]
+
+
+def test_history_delta_of_ring_buffer():
+    graph = make_graph()
+    source = RingBufferDataSource(capacity=8)
+    source.append(np.arange(8.0), np.arange(8.0))
+    graph.canvas.artists['line'].data_source = source
+    history = SnapshotHistory(graph, serialization_manager)
+
+    source.append([8.0, 9.0], [8.0, 9.0])
+    history.update()
+    operations = history.delta(since=0)['ops']
+    assert [(op['op'], op['path'][-1], op['drop']) for op in operations] == [
+        ('roll', 'x_data', 2), ('roll', 'y_data', 2)]
+    assert_equal(operations[0]['value'], [8.0, 9.0])
+
+    # The views of the ring buffer are updated in place: here, the data of
+    # the previous snapshot would be overwritten by the new data.
+    x = np.arange(10.0, 18.0)
+    source.append(x, x)
+    history.update()
+    assert history.current.version == 2
+    operations = history.delta(since=1)['ops']
+    assert [op['op'] for op in operations] == ['set', 'set']
+    assert_equal(operations[0]['value'], x)
+
+
+def test_snapshot_reuses_unchanged_data():
+    graph = make_graph()
+    artist = graph.canvas.artists['line']
+    first = serialization_manager.snapshot(graph)
+    graph.canvas.data_bbox.rect = (0, 0, 5, 5)
+    second = serialization_manager.snapshot(graph, previous=first)
+
+    old = first.tree['canvas']['artists']['line']
+    new = second.tree['canvas']['artists']['line']
+    assert new['x_data'] is old['x_data']
+    assert not np.may_share_memory(new['x_data'], artist.x_data)
+    with patch('numpy.array_equal') as array_equal:
+        operations = serialization_manager.diff(first, second)
+    assert not array_equal.called
+    assert operations
+    assert all(op['path'][:2] == ['canvas', 'data_bbox'] for op in operations)
+
+    artist.y_data = np.ones(10)
+    third = serialization_manager.snapshot(graph, previous=second)
+    new_line = third.tree['canvas']['artists']['line']
+    assert new_line['x_data'] is not new['x_data']
+    assert_equal(new_line['y_data'], np.ones(10))
+
+
+def test_snapshot_copies_data_source_updates():
+    graph = make_graph()
+    source = RingBufferDataSource(capacity=4)
+    source.append([0.0, 1.0], [0.0, 1.0])
+    graph.canvas.artists['line'].data_source = source
+    first = serialization_manager.snapshot(graph)
+
+    source.append([2.0], [2.0])
+    second = serialization_manager.snapshot(graph, previous=first)
+    assert_equal(first.tree['canvas']['artists']['line']['x_data'], [0, 1])
+    assert_equal(second.tree['canvas']['artists']['line']['x_data'],
+                 [0, 1, 2])
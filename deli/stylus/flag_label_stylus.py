@@ -51,9 +51,23 @@ class FlagLabelStylus(HasStrictTraits):
         text : str
             The text for the displayed label.
         """
+        self.flag.draw(gc, self._flag_rect(gc, text))
+        self.label.draw(gc, text)
+
+    def bounding_rect(self, gc, text):
+        """ Return the (x, y, width, height) area covered by the flag-label.
+
+        The rect is relative to the origin of the flag, and includes the edge
+        of the flag.
+        """
+        x, y, width, height = self._flag_rect(gc, text)
+        x0, x1 = min(x, 0), max(x + width, 0)
+        y0, y1 = min(y, 0), max(y + height, 0)
+        # Pad for the anti-aliased edge of the flag.
+        pad = 2
+        return (x0 - pad, y0 - pad, x1 - x0 + 2 * pad, y1 - y0 + 2 * pad)
+
+    def _flag_rect(self, gc, text):
         x, y, width, height = self.label.text_rect(gc, text)
         x_offset, y_offset = self.label.bbox_offset(gc, text, width, height)
-        rect = (x_offset, y_offset, width, height)
-
-        self.flag.draw(gc, rect)
-        self.label.draw(gc, text)
+        return (x_offset, y_offset, width, height)
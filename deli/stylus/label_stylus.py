@@ -2,12 +2,14 @@
 """
 from math import pi
 
+import numpy as np
 from enable.api import ColorTrait
 from kiva.trait_defs.kiva_font_trait import KivaFont
 from traits.api import (Enum, Float, HasStrictTraits, Int, Property, Str,
                         cached_property)
 
 from ..style import config
+from ..utils.text import get_text_extents
 
 
 class LabelStylus(HasStrictTraits):
@@ -66,18 +68,63 @@ class LabelStylus(HasStrictTraits):
             gc.set_text_position(x + x_offset, y + y_offset)
             gc.show_text(text)
 
+    def draw_many(self, gc, positions, texts):
+        """ Draws many labels, measuring all of them in a single pass.
+
+        The style of the graphics context is only set once for all labels. If
+        the graphics context can draw many strings at once (`show_texts`),
+        unrotated labels are drawn with a single call.
+
+        Parameters
+        ----------
+        gc : GraphicsContext
+            The graphics context where elements are drawn.
+        positions : array, shape (N, 2)
+            Screen positions of the labels, which have the same meaning as the
+            translation of the graphics context in `draw`.
+        texts : list of str
+            The text for each label.
+        """
+        if len(texts) == 0:
+            return
+
+        rects = self.text_rects(gc, texts)
+        x, y, width, height = rects.T
+        x_offset, y_offset = self.bbox_offset(gc, texts, width, height)
+        text_positions = np.column_stack((x + x_offset, y + y_offset))
+
+        with gc:
+            self.update_style(gc)
+            if self.rotate_angle == 0 and hasattr(gc, 'show_texts'):
+                gc.show_texts(texts, positions + text_positions)
+                return
+
+            for xy_screen, text, rect, xy_text in zip(positions, texts, rects,
+                                                      text_positions):
+                with gc:
+                    gc.translate_ctm(*xy_screen)
+                    self._set_rotation_angle(gc, text, rect[2], rect[3])
+                    gc.set_text_position(*xy_text)
+                    gc.show_text(text)
+
     def text_rect(self, gc, text):
         """ Return bounding rectangle for text, including margin. """
-        with gc:
-            gc.set_font(self.font)
-            text_extent = gc.get_full_text_extent(text)
-        width, height, descent, leading = text_extent
+        return tuple(self.text_rects(gc, [text])[0])
+
+    def text_rects(self, gc, texts):
+        """ Return (N, 4) array of bounding rectangles for many texts.
+
+        Text extents are shared by all labels through `TEXT_EXTENT_CACHE`, and
+        the font is only set once to measure texts that aren't cached.
+        """
+        text_extents = get_text_extents(gc, self.font, texts)
+        width, height, descent, leading = np.reshape(text_extents, (-1, 4)).T
 
         x = -leading + self.margin
-        y = self.margin
-        width += 2 * self.margin
-        height += 2 * self.margin - abs(descent)
-        return x, y, width, height
+        y = np.zeros_like(x) + self.margin
+        width = width + 2 * self.margin
+        height = height + 2 * self.margin - np.abs(descent)
+        return np.column_stack((x, y, width, height))
 
     def bbox_offset(self, gc, text, width, height):
         """ Return offset distance for text rendering.
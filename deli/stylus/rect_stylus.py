@@ -1,5 +1,8 @@
+import numpy as np
 from enable.api import ColorTrait
 
+from kiva.constants import FILL_STROKE, STROKE
+
 from .base_patch_stylus import BasePatchStylus
 
 
@@ -18,3 +21,28 @@ class RectangleStylus(BasePatchStylus):
                 gc.set_fill_color(self.fill_color_)
                 gc.fill_path()
             gc.draw_rect([int(a) for a in rect])
+
+    def draw_many(self, gc, rects):
+        """ Draw many rectangles with a single path.
+
+        Parameters
+        ----------
+        gc : GraphicsContext
+            The graphics context where elements are drawn.
+        rects : array, shape (N, 4)
+            Draw rectangles given as (x, y, width, height) rows.
+        """
+        if len(rects) == 0:
+            return
+
+        # Truncate to integer pixels, as in `draw`, in a single operation.
+        rects = np.asarray(rects).astype(int)
+        with gc:
+            gc.set_stroke_color(self.edge_color_)
+            gc.begin_path()
+            gc.rects(rects)
+            if self.fill_color != 'none':
+                gc.set_fill_color(self.fill_color_)
+                gc.draw_path(FILL_STROKE)
+            else:
+                gc.draw_path(STROKE)
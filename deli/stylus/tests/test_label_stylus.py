@@ -0,0 +1,95 @@
+import numpy as np
+from mock import MagicMock
+from numpy.testing import assert_allclose
+
+from deli.stylus.flag_label_stylus import FlagLabelStylus
+from deli.stylus.label_stylus import LabelStylus
+from deli.utils.text import TEXT_EXTENT_CACHE
+
+
+POSITIONS = np.array([(10.0, 20.0), (30.0, 40.0)])
+TEXTS = ['1', '100']
+
+
+def text_extent(text):
+    # (width, height, descent, leading)
+    return (10.0 * len(text), 12.0, -2.0, 0.0)
+
+
+def setup():
+    TEXT_EXTENT_CACHE.clear()
+
+
+def make_context(batch=True):
+    context = MagicMock()
+    context.get_full_text_extent.side_effect = text_extent
+    if not batch:
+        del context.show_texts
+    return context
+
+
+def test_text_rect():
+    stylus = LabelStylus(margin=1)
+    rect = stylus.text_rect(make_context(), '100')
+    assert_allclose(rect, (1, 1, 32, 12))
+
+
+def test_draw_many_batch():
+    stylus = LabelStylus(margin=0)
+    context = make_context()
+    stylus.draw_many(context, POSITIONS, TEXTS)
+
+    assert context.get_full_text_extent.call_count == 2
+    assert context.set_font.call_count == 2
+    texts, points = context.show_texts.call_args[0]
+    assert texts == TEXTS
+    # Labels are centered on each position by default.
+    assert_allclose(points, [(5, 15), (15, 35)])
+    assert not context.show_text.called
+
+
+def test_draw_many_matches_draw():
+    stylus = LabelStylus(margin=2, rotate_angle=30)
+    context = make_context()
+    stylus.draw_many(context, POSITIONS, TEXTS)
+
+    # Rotated labels are drawn one at a time.
+    assert not context.show_texts.called
+    batch_calls = context.method_calls
+
+    context = make_context()
+    for position, text in zip(POSITIONS, TEXTS):
+        with context:
+            context.translate_ctm(*position)
+            stylus.draw(context, text)
+    drawn = [c for c in context.method_calls
+             if c[0] in ('translate_ctm', 'set_text_position', 'show_text')]
+    batch_drawn = [c for c in batch_calls
+                   if c[0] in ('translate_ctm', 'set_text_position',
+                               'show_text')]
+    assert_allclose([c[1] for c in batch_drawn if c[0] != 'show_text'],
+                    [c[1] for c in drawn if c[0] != 'show_text'])
+    assert ([c[1] for c in batch_drawn if c[0] == 'show_text'] ==
+            [c[1] for c in drawn if c[0] == 'show_text'])
+
+
+def test_draw_many_without_batch_support():
+    stylus = LabelStylus()
+    context = make_context(batch=False)
+    stylus.draw_many(context, POSITIONS, TEXTS)
+    assert context.show_text.call_count == 2
+
+
+def test_draw_many_empty():
+    stylus = LabelStylus()
+    context = make_context()
+    stylus.draw_many(context, np.empty((0, 2)), [])
+    assert not context.get_full_text_extent.called
+
+
+def test_flag_label_measures_once():
+    stylus = FlagLabelStylus()
+    context = make_context()
+    stylus.draw(context, '(1.0, 2.0)')
+    stylus.draw(context, '(1.0, 2.0)')
+    assert context.get_full_text_extent.call_count == 1
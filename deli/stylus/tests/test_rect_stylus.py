@@ -0,0 +1,44 @@
+import numpy as np
+from mock import MagicMock
+from numpy.testing import assert_equal
+
+from kiva.constants import FILL_STROKE, STROKE
+
+from deli.stylus.rect_stylus import RectangleStylus
+
+
+RECTS = np.array([(0.5, 1.5, 10, 20), (20.5, 1.5, 10, 30)])
+
+
+def test_draw_many():
+    stylus = RectangleStylus()
+    context = MagicMock()
+    stylus.draw_many(context, RECTS)
+
+    context.begin_path.assert_called_once_with()
+    rects = context.rects.call_args[0][0]
+    assert_equal(rects, [(0, 1, 10, 20), (20, 1, 10, 30)])
+    context.draw_path.assert_called_once_with(FILL_STROKE)
+    assert not context.draw_rect.called
+
+
+def test_draw_many_without_fill():
+    stylus = RectangleStylus(fill_color='none')
+    context = MagicMock()
+    stylus.draw_many(context, RECTS)
+    context.draw_path.assert_called_once_with(STROKE)
+
+
+def test_draw_many_empty():
+    stylus = RectangleStylus()
+    context = MagicMock()
+    stylus.draw_many(context, np.empty((0, 4)))
+    assert not context.draw_path.called
+
+
+def test_draw_many_without_fill_from_built_string():
+    # Compare by value: a 'none' string built at runtime isn't interned.
+    stylus = RectangleStylus(fill_color=''.join(['no', 'ne']))
+    context = MagicMock()
+    stylus.draw_many(context, RECTS)
+    context.draw_path.assert_called_once_with(STROKE)
@@ -1,3 +1,6 @@
+from mock import MagicMock
+
+
 class Bunch(object):
     """Collect a Bunch of named items.
 
@@ -20,3 +23,31 @@ class Bunch(object):
 
     def to_dict(self):
         return self._kwargs
+
+
+def agg_available():
+    """ Return True if Kiva's agg image graphics context can be created. """
+    from kiva.image import GraphicsContext
+    try:
+        GraphicsContext((1, 1))
+    except Exception:
+        return False
+    return True
+
+
+def qt_available():
+    """ Return True if a Qt binding can be imported through pyface. """
+    try:
+        import pyface.qt  # noqa
+    except ImportError:
+        return False
+    return True
+
+
+def mock_graphics_context(size, **kwargs):
+    """ Return mock of a Kiva image graphics context with the given size. """
+    gc = MagicMock()
+    gc.size = size
+    gc.get_full_text_extent.return_value = (1, 1, 0, 0)
+    gc.get_ctm.return_value = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+    return gc
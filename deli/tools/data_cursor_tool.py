@@ -1,5 +1,5 @@
 import numpy as np
-from traits.api import CArray, HasStrictTraits, Instance, Str
+from traits.api import Any, CArray, HasStrictTraits, Instance, Str
 
 from ..abstract_overlay import AbstractOverlay
 from ..stylus.flag_label_stylus import FlagLabelStylus
@@ -14,8 +14,9 @@ def format_floats(array, significant_digits=3):
     if max_digit != 0:
         max_digit = np.log10(max_digit)
     max_digit -= (significant_digits - 1)
+    precision = 0
     if max_digit < 0:
-        precision = np.ceil(-max_digit)
+        precision = int(np.ceil(-max_digit))
     text = np.array2string(np.asarray(array), separator=',',
                            precision=precision)
     return switch_delimiters(text, '[]', '()')
@@ -33,6 +34,14 @@ def choose_black_or_white(contrasting_color, threshold=0.4):
     return 'black' if gray > threshold else 'white'
 
 
+def _contains_rect(outer, inner):
+    """ Return True if (x, y, w, h) rect `outer` contains rect `inner`. """
+    x0, y0, width0, height0 = outer
+    x1, y1, width1, height1 = inner
+    return (x1 >= x0 and y1 >= y0 and
+            x1 + width1 <= x0 + width0 and y1 + height1 <= y0 + height0)
+
+
 class DataCursorOverlay(AbstractOverlay):
 
     label = Instance(HasStrictTraits)
@@ -41,17 +50,39 @@ class DataCursorOverlay(AbstractOverlay):
 
     _text = Str
 
+    #: Area covered by the label when last drawn, or None if not drawn.
+    _drawn_rect = Any
+
+    #: Area requested to be redrawn for the label at its current position.
+    _damaged_rect = Any
+
     def _label_default(self):
         return FlagLabelStylus()
 
     def reset(self):
         self._text = ''
         self._origin = np.empty((0, 2))
+        if self._drawn_rect is not None:
+            self.component.request_redraw(self._drawn_rect)
+            self._drawn_rect = self._damaged_rect = None
 
     def update_point(self, data_point, screen_point):
+        old_origin = self._origin
         self._text = self.data_point_to_string(data_point)
         self._origin = screen_point
-        self.component.request_redraw()
+
+        if self._drawn_rect is None:
+            self.component.request_redraw()
+            return
+
+        # Damage the old label, and where the label is expected to be drawn,
+        # assuming the label size doesn't change. If it does, `draw` requests
+        # another redraw.
+        dx, dy = np.subtract(screen_point, old_origin)
+        x, y, width, height = self._drawn_rect
+        self._damaged_rect = (x + dx, y + dy, width, height)
+        self.component.request_redraw(self._drawn_rect)
+        self.component.request_redraw(self._damaged_rect)
 
     def data_point_to_string(self, point):
         return format_floats(point)
@@ -64,6 +95,15 @@ class DataCursorOverlay(AbstractOverlay):
             gc.translate_ctm(*self._origin)
             self.label.draw(gc, self._text)
 
+        x, y, width, height = self.label.bounding_rect(gc, self._text)
+        x0, y0 = self._origin
+        self._drawn_rect = (x0 + x, y0 + y, width, height)
+        damaged = self._damaged_rect
+        if damaged is not None and not _contains_rect(damaged,
+                                                      self._drawn_rect):
+            self._damaged_rect = self._drawn_rect
+            self.component.request_redraw(self._drawn_rect)
+
 
 class DataCursorTool(BaseTool):
 
@@ -84,8 +124,7 @@ class DataCursorTool(BaseTool):
         self.overlay.label.text_color = choose_black_or_white(flag_color)
 
     def on_mouse_move(self, event):
-        x_data = self.component.x_data
-        y_data = self.component.y_data
+        x_data, y_data = self.component.get_data()
 
         screen_to_data = self.component.screen_to_data.transform
         x_cursor, y_cursor = screen_to_data((event.x, event.y))
@@ -96,12 +135,11 @@ class DataCursorTool(BaseTool):
     def _update_overlay(self, data_point):
         data_to_screen = self.component.data_to_screen.transform
         screen_point = data_to_screen(data_point)
+        # The overlay requests a redraw of the area covered by its label.
         if self.component.is_in(*screen_point):
             self.overlay.update_point(data_point, screen_point)
         else:
             self.overlay.reset()
-        self.component.request_redraw()
 
     def on_mouse_leave(self, event):
         self.overlay.reset()
-        self.component.request_redraw()
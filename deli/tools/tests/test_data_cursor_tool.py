@@ -0,0 +1,18 @@
+from deli.tools.data_cursor_tool import format_floats
+
+
+def check_format(values, expected):
+    assert format_floats(values).replace(' ', '') == expected
+
+
+def test_format_floats_small_values():
+    check_format((4.2, 0.042), '(4.2,0.04)')
+
+
+def test_format_floats_large_values():
+    # Values with `significant_digits` digits or more are shown as integers.
+    check_format((420.0, 1234.5), '(420.,1234.)')
+
+
+def test_format_floats_zero():
+    check_format((0.0, 0.0), '(0.,0.)')
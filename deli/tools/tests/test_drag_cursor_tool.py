@@ -40,3 +40,33 @@ def test_data_cursor_draw():
     demo.control.move_mouse(x=4200, y=0)
     data_point = demo.tool.overlay.data_point_to_string((42, 4.2))
     demo.context.show_text.assert_any_call(data_point)
+
+
+def test_data_cursor_partial_repaint():
+    demo = init_demo()
+    demo.control.width = WIDTH
+    demo.control.height = HEIGHT
+    demo._window.partial_repaint = True
+    demo.control.move_mouse(x=4200, y=0)
+
+    demo.context.reset_mock()
+    demo.control.move_mouse(x=4300, y=0)
+    # Only the areas around the old and new labels are repainted.
+    assert not demo.context.clear.called
+    clip_rects = [c[0] for c in demo.context.clip_to_rect.call_args_list]
+    region_rects = [rect for rect in clip_rects if rect[2] < WIDTH / 10]
+    assert len(region_rects) == 2
+    data_point = demo.tool.overlay.data_point_to_string((43, 4.3))
+    demo.context.show_text.assert_any_call(data_point)
+
+
+def test_data_cursor_coalesces_redraws():
+    demo = init_demo()
+    demo.control.move_mouse(x=4200, y=0)
+
+    window = demo._window
+    window.redraw_count = window.render_count = 0
+    demo.control.move_mouse(x=4300, y=0)
+    # The old and new label areas are requested separately, but rendered once.
+    assert window.redraw_count == 2
+    assert window.render_count == 1
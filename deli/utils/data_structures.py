@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+from collections import OrderedDict
+
 from traits.api import Dict, Event, HasStrictTraits
 
 
@@ -30,3 +32,59 @@ class NoisyDict(HasStrictTraits):
 
         self._dict_data.update(data)
         self.updated = event
+
+
+class LRUCache(object):
+    """ Mapping that discards the least-recently-used items when full.
+
+    Lookups with `get` are counted as hits or misses, and discarded items are
+    counted as evictions, to help tune the cache size.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of items stored.
+    """
+
+    def __init__(self, max_size=128):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """ Return value for `key` and mark it as recently used. """
+        try:
+            value = self._data.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data[key] = value
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        self._data.pop(key, None)
+        self._data[key] = value
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """ Remove all items and reset statistics. """
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def stats(self):
+        """ Dict of cache statistics. """
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'size': len(self._data),
+                'max_size': self.max_size}
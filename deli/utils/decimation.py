@@ -0,0 +1,155 @@
+""" Helper functions for reducing the number of points drawn for dense data.
+"""
+import numpy as np
+
+
+def is_sorted(x):
+    """ Return True if the values in `x` are monotonically non-decreasing. """
+    x = np.asarray(x)
+    if len(x) < 2:
+        return True
+    return bool(np.all(x[1:] >= x[:-1]))
+
+
+def minmax_decimation_indices(x, y, x_limits, n_columns):
+    """ Return indices of points that preserve a line's appearance on screen.
+
+    Points are grouped into `n_columns` buckets spanning `x_limits` (i.e. one
+    bucket per pixel column), and only the first, last, minimum, and maximum
+    points of each bucket are kept (a.k.a. M4 decimation). Points outside of
+    `x_limits` are collapsed into a single bucket on each side so that lines
+    leaving the view remain continuous.
+
+    Parameters
+    ----------
+    x, y : (N,) array
+        Data points. `x` must be sorted in increasing order.
+    x_limits : (x_min, x_max)
+        Limits of the view in data space.
+    n_columns : int
+        Number of pixel columns spanning `x_limits`.
+
+    Returns
+    -------
+    indices : (M,) array
+        Sorted indices of points to keep, where M <= 4 * (n_columns + 2).
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n_points = len(x)
+    x_min, x_max = x_limits
+    if n_points == 0 or n_columns < 1 or not x_max > x_min:
+        return np.arange(n_points)
+
+    scale = n_columns / float(x_max - x_min)
+    columns = np.floor((x - x_min) * scale)
+    np.clip(columns, -1, n_columns, out=columns)
+
+    # Since `x` is sorted, each bucket is a contiguous run of points.
+    starts = np.flatnonzero(np.diff(columns)) + 1
+    starts = np.concatenate(([0], starts))
+    ends = np.concatenate((starts[1:], [n_points]))
+    bucket_ids = np.repeat(np.arange(len(starts)), ends - starts)
+
+    # `fmin`/`fmax` ignore NaNs, unless a bucket contains nothing but NaNs.
+    y_min = np.fmin.reduceat(y, starts)
+    y_max = np.fmax.reduceat(y, starts)
+    i_min = _first_index_per_bucket(y == y_min[bucket_ids], bucket_ids)
+    i_max = _first_index_per_bucket(y == y_max[bucket_ids], bucket_ids)
+
+    indices = np.concatenate((starts, ends - 1, i_min, i_max))
+    return np.unique(indices)
+
+
+def _first_index_per_bucket(mask, bucket_ids):
+    """ Return index of the first True value of `mask` in each bucket. """
+    candidates = np.flatnonzero(mask)
+    _, first = np.unique(bucket_ids[candidates], return_index=True)
+    return candidates[first]
+
+
+class MinMaxPyramid(object):
+    """ Precomputed min/max summaries of data at power-of-two block sizes.
+
+    Level `k` of the pyramid stores, for each block of `2**k` consecutive
+    points, the index of the minimum and maximum point of that block. Each
+    level is computed from the level below it, so building the pyramid takes
+    O(N) time and stores roughly 2N indices.
+
+    Parameters
+    ----------
+    y : (N,) array
+        Data that is summarized. The array is referenced, not copied, so it
+        shouldn't be modified in place after creating the pyramid.
+    """
+
+    def __init__(self, y):
+        self._y = y = np.asarray(y)
+        index_type = np.int32 if len(y) < 2 ** 31 else np.int64
+
+        #: Pairs of (argmin, argmax) arrays for each level, starting at 1.
+        self._levels = []
+        i_min = i_max = np.arange(len(y), dtype=index_type)
+        while len(i_min) > 1:
+            i_min = _pairwise_extreme(y, i_min, np.less)
+            i_max = _pairwise_extreme(y, i_max, np.greater)
+            self._levels.append((i_min, i_max))
+
+    @property
+    def n_levels(self):
+        """ Number of levels, excluding the full-resolution data. """
+        return len(self._levels)
+
+    def choose_level(self, n_points, n_buckets):
+        """ Return the coarsest level with at least `n_buckets` blocks. """
+        if n_buckets < 1 or n_points <= n_buckets:
+            return 0
+        level = int(np.floor(np.log2(n_points / float(n_buckets))))
+        return min(level, self.n_levels)
+
+    def indices(self, start, stop, n_buckets):
+        """ Return sorted indices of points summarizing `y[start:stop]`.
+
+        The coarsest level that still has at least `n_buckets` blocks within
+        the range is used, so that at most ~4 points per bucket are returned.
+        The end points of the range are always included.
+        """
+        level = self.choose_level(stop - start, n_buckets)
+        # Level 1 returns as many points as the raw data, so skip it.
+        if level <= 1:
+            return np.arange(start, stop)
+
+        i_min, i_max = self._levels[level - 1]
+        block_size = 2 ** level
+        # Blocks that lie completely within the range.
+        b0 = -(-start // block_size)
+        b1 = stop // block_size
+        indices = [i_min[b0:b1], i_max[b0:b1], [start, stop - 1]]
+        # Partial blocks at the edges are summarized from the raw data.
+        edges = ((start, min(b0 * block_size, stop)),
+                 (max(b1 * block_size, start), stop))
+        for lo, hi in edges:
+            if lo < hi:
+                indices.append(_extreme_indices(self._y, lo, hi))
+        return np.unique(np.concatenate(indices))
+
+
+def _extreme_indices(y, start, stop):
+    """ Return indices of the minimum and maximum of `y[start:stop]`. """
+    y = y[start:stop]
+    if np.all(np.isnan(y)):
+        return [start]
+    return [start + np.nanargmin(y), start + np.nanargmax(y)]
+
+
+def _pairwise_extreme(y, indices, compare):
+    """ Return indices of extreme values between neighboring pairs of indices.
+    """
+    if len(indices) % 2:
+        indices = np.append(indices, indices[-1])
+    a = indices[0::2]
+    b = indices[1::2]
+    y_a = y[a]
+    # Prefer `b` if `a` is NaN so that NaNs only win if both values are NaN.
+    use_b = compare(y[b], y_a) | np.isnan(y_a)
+    return np.where(use_b, b, a)
@@ -0,0 +1,249 @@
+""" Fixed-capacity storage for streaming x/y data.
+"""
+from __future__ import absolute_import
+
+import numpy as np
+
+from traits.api import Bool, Event, HasStrictTraits, Int, Property, ReadOnly
+
+
+__all__ = ['RingBufferDataSource']
+
+
+class RingBufferDataSource(HasStrictTraits):
+    """ The latest `capacity` x/y samples of a stream, in preallocated arrays.
+
+    Appending a chunk of samples only costs time proportional to the chunk:
+    samples are written over the oldest samples, and the data is never
+    reallocated. Each sample is written twice, at ring position `i` and
+    `i + capacity`, so the samples in the window are always a contiguous
+    slice of the storage: `x` and `y` are views, not copies.
+
+    The data extents are also updated incrementally. The ring is split into
+    blocks of `block_size` samples, and the min/max of each block (and of
+    each suffix of a block) is computed once, when the block is filled. The
+    extents are then combined from these summaries and from the samples of
+    the block being filled, in O(capacity / block_size + block_size) time.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of samples kept.
+    block_size : int, optional
+        Number of samples summarized together. Defaults to the square root
+        of `capacity`, which minimizes the cost of computing extents.
+    """
+
+    #: Maximum number of samples kept.
+    capacity = ReadOnly
+
+    #: Number of samples summarized together when computing extents.
+    block_size = ReadOnly
+
+    #: Number of samples currently stored.
+    size = Property(Int)
+
+    #: View of the x data, from the oldest to the newest sample.
+    x = Property
+
+    #: View of the y data, from the oldest to the newest sample.
+    y = Property
+
+    #: Extents of the data, (x_min, y_min, x_max, y_max), ignoring NaNs.
+    extents = Property
+
+    #: True if the x data is sorted in increasing order.
+    x_is_sorted = Property(Bool)
+
+    #: Number of times the data has changed. Incremented before `updated`
+    #: fires, so it can key values computed from the data.
+    version = Property(Int)
+
+    #: Event fired with the number of samples appended.
+    updated = Event
+
+    # Stacked x and y storage, of shape (2, 2 * capacity).
+    _data = ReadOnly
+
+    # Position in the ring where the next sample is written.
+    _head = Int(0)
+
+    _size = Int(0)
+
+    _version = Int(0)
+
+    # Number of decreasing steps between consecutive x values in the window.
+    _n_descents = Int(0)
+
+    # Min/max of the x and y data in each block, of shape (2, n_blocks).
+    _block_min = ReadOnly
+    _block_max = ReadOnly
+
+    # Min/max of the x and y data from each position to the end of its
+    # block, of shape (2, capacity).
+    _suffix_min = ReadOnly
+    _suffix_max = ReadOnly
+
+    def __init__(self, capacity, block_size=None, **traits):
+        capacity = int(capacity)
+        if capacity < 1:
+            msg = "Capacity must be positive, not {}."
+            raise ValueError(msg.format(capacity))
+        if block_size is None:
+            block_size = int(np.sqrt(capacity))
+        block_size = min(max(int(block_size), 1), capacity)
+        n_blocks = -(-capacity // block_size)
+
+        super(RingBufferDataSource, self).__init__(**traits)
+        self.capacity = capacity
+        self.block_size = block_size
+        self._data = np.zeros((2, 2 * capacity))
+        self._block_min = np.zeros((2, n_blocks))
+        self._block_max = np.zeros((2, n_blocks))
+        self._suffix_min = np.zeros((2, capacity))
+        self._suffix_max = np.zeros((2, capacity))
+
+    def append(self, x, y):
+        """ Append samples, discarding the oldest samples if full.
+
+        Parameters
+        ----------
+        x, y : scalar or (N,) array-like
+            Coordinates of the new samples.
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=np.float64))
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+        if x.shape != y.shape or x.ndim != 1:
+            msg = "x and y must be 1D with the same length, not {} and {}."
+            raise ValueError(msg.format(x.shape, y.shape))
+        n_new = len(x)
+        if n_new == 0:
+            return
+        if n_new > self.capacity:
+            x, y = x[-self.capacity:], y[-self.capacity:]
+
+        self._update_descents(x)
+        head = self._head
+        n_first = min(len(x), self.capacity - head)
+        self._write(head, x[:n_first], y[:n_first])
+        self._write(0, x[n_first:], y[n_first:])
+
+        self._head = (head + len(x)) % self.capacity
+        self._size = min(self._size + len(x), self.capacity)
+        self._version += 1
+        self.updated = n_new
+
+    def clear(self):
+        """ Discard all samples. """
+        self._head = 0
+        self._size = 0
+        self._n_descents = 0
+        self._version += 1
+        self.updated = 0
+
+    # -------------------------------------------------------------------------
+    #  Traits properties
+    # -------------------------------------------------------------------------
+
+    def _get_version(self):
+        return self._version
+
+    def _get_size(self):
+        return self._size
+
+    def _get_x(self):
+        return self._data[0, self._window_slice()]
+
+    def _get_y(self):
+        return self._data[1, self._window_slice()]
+
+    def _get_x_is_sorted(self):
+        return self._n_descents == 0
+
+    def _get_extents(self):
+        if self._size == 0:
+            raise ValueError("Data source is empty.")
+
+        head = self._head
+        block = head // self.block_size
+        block_start = block * self.block_size
+        block_end = min(block_start + self.block_size, self.capacity)
+        is_full = self._size == self.capacity
+
+        # All blocks apart from the one being filled are summarized.
+        if is_full:
+            others = np.arange(self._block_min.shape[1]) != block
+        else:
+            others = slice(0, block)
+        minima = [self._block_min[:, others]]
+        maxima = [self._block_max[:, others]]
+
+        # New samples of the block being filled.
+        if head > block_start:
+            new = self._data[:, block_start:head]
+            minima.append(np.fmin.reduce(new, axis=1)[:, np.newaxis])
+            maxima.append(np.fmax.reduce(new, axis=1)[:, np.newaxis])
+        # Old samples of the block being filled, which remain in the window.
+        if is_full and head < block_end:
+            minima.append(self._suffix_min[:, head, np.newaxis])
+            maxima.append(self._suffix_max[:, head, np.newaxis])
+
+        (x_min, y_min) = np.fmin.reduce(np.hstack(minima), axis=1)
+        (x_max, y_max) = np.fmax.reduce(np.hstack(maxima), axis=1)
+        return (x_min, y_min, x_max, y_max)
+
+    # -------------------------------------------------------------------------
+    #  Private interface
+    # -------------------------------------------------------------------------
+
+    def _window_slice(self):
+        start = (self._head - self._size) % self.capacity
+        return slice(start, start + self._size)
+
+    def _write(self, start, x, y):
+        """ Write samples at ring positions starting at `start`. """
+        stop = start + len(x)
+        if stop == start:
+            return
+        self._data[0, start:stop] = x
+        self._data[1, start:stop] = y
+        offset = self.capacity
+        self._data[:, start + offset:stop + offset] = self._data[:, start:stop]
+
+        # Summarize the blocks that were filled.
+        block_size = self.block_size
+        for block in range(start // block_size, (stop - 1) // block_size + 1):
+            block_start = block * block_size
+            block_end = min(block_start + block_size, self.capacity)
+            if block_end <= stop:
+                self._summarize_block(block, block_start, block_end)
+
+    def _summarize_block(self, block, start, stop):
+        data = self._data[:, start:stop]
+        self._block_min[:, block] = np.fmin.reduce(data, axis=1)
+        self._block_max[:, block] = np.fmax.reduce(data, axis=1)
+        reverse = data[:, ::-1]
+        self._suffix_min[:, start:stop] = \
+            np.fmin.accumulate(reverse, axis=1)[:, ::-1]
+        self._suffix_max[:, start:stop] = \
+            np.fmax.accumulate(reverse, axis=1)[:, ::-1]
+
+    def _update_descents(self, x):
+        """ Update the count of descents for new `x`, before it's written. """
+        old_x = self.x
+        n_old = len(old_x)
+        n_discarded = min(max(n_old + len(x) - self.capacity, 0), n_old)
+        if n_discarded == n_old:
+            self._n_descents = _count_descents(x)
+            return
+        # Remove the steps from discarded samples, including the step to the
+        # oldest remaining sample, and add the steps to the new samples.
+        self._n_descents -= _count_descents(old_x[:n_discarded + 1])
+        self._n_descents += _count_descents(np.r_[old_x[-1], x])
+
+
+def _count_descents(x):
+    """ Return number of steps in `x` that aren't increasing or constant. """
+    if len(x) < 2:
+        return 0
+    return int(np.count_nonzero(~(x[1:] >= x[:-1])))
@@ -3,7 +3,7 @@ from unittest import TestCase
 from traits.api import HasStrictTraits, Instance
 from traits.testing.unittest_tools import UnittestTools
 
-from deli.utils.data_structures import NoisyDict
+from deli.utils.data_structures import LRUCache, NoisyDict
 
 
 class TestDict(TestCase, UnittestTools):
@@ -16,3 +16,32 @@ class TestDict(TestCase, UnittestTools):
 
         with self.assertTraitChanges(obj_with_dict, 'data.updated', count=1):
             obj_with_dict.data['a'] = 1
+
+
+class TestLRUCache(TestCase):
+
+    def test_get_counts_hits_and_misses(self):
+        cache = LRUCache(max_size=2)
+        cache['a'] = 1
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_size=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.get('a')
+        cache['c'] = 3
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache['a'] = 1
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats['hits'], 0)
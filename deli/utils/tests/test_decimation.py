@@ -0,0 +1,96 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+
+from deli.utils.decimation import (MinMaxPyramid, is_sorted,
+                                   minmax_decimation_indices)
+
+
+def test_is_sorted():
+    assert is_sorted([])
+    assert is_sorted([1, 2, 2, 3])
+    assert not is_sorted([1, 3, 2])
+
+
+def test_minmax_decimation_bounds_number_of_points():
+    x = np.linspace(0, 1, 100000)
+    y = np.random.normal(size=x.shape)
+    n_columns = 50
+
+    indices = minmax_decimation_indices(x, y, (0, 1), n_columns)
+    assert len(indices) <= 4 * (n_columns + 2)
+
+
+def test_minmax_decimation_preserves_column_extremes():
+    x = np.linspace(0, 1, 10000, endpoint=False)
+    y = np.random.normal(size=x.shape)
+    n_columns = 10
+
+    indices = minmax_decimation_indices(x, y, (0, 1), n_columns)
+    assert_equal(indices[[0, -1]], [0, len(x) - 1])
+
+    columns = np.floor(x * n_columns)
+    for i in range(n_columns):
+        in_column = columns == i
+        kept = in_column[indices]
+        assert_allclose(y[indices][kept].min(), y[in_column].min())
+        assert_allclose(y[indices][kept].max(), y[in_column].max())
+
+
+def test_minmax_decimation_collapses_points_outside_view():
+    x = np.arange(100.0)
+    y = np.sin(x)
+
+    indices = minmax_decimation_indices(x, y, (40, 60), 20)
+    outside = (x[indices] < 40) | (x[indices] >= 60)
+    # First, last, min, and max of each side of the view.
+    assert np.sum(outside) <= 8
+
+
+def test_minmax_decimation_ignores_nans():
+    x = np.arange(10.0)
+    y = np.array([0, np.nan, 5, 1, 1, 1, -5, 1, np.nan, 0])
+
+    indices = minmax_decimation_indices(x, y, (0, 10), 1)
+    assert_equal(indices, [0, 2, 6, 9])
+
+
+def test_pyramid_levels():
+    y = np.arange(10.0)
+    pyramid = MinMaxPyramid(y)
+    # Block sizes of 2, 4, 8, and 16.
+    assert_equal(pyramid.n_levels, 4)
+
+
+def test_pyramid_choose_level():
+    pyramid = MinMaxPyramid(np.zeros(1024))
+    assert_equal(pyramid.choose_level(1024, 2000), 0)
+    assert_equal(pyramid.choose_level(1024, 256), 2)
+    assert_equal(pyramid.choose_level(1024, 200), 2)
+    assert_equal(pyramid.choose_level(1024, 1), pyramid.n_levels)
+
+
+def test_pyramid_indices_preserve_extremes():
+    y = np.random.normal(size=10000)
+    pyramid = MinMaxPyramid(y)
+    start, stop = 1234, 8765
+    n_buckets = 50
+
+    indices = pyramid.indices(start, stop, n_buckets)
+    assert len(indices) <= 4 * (n_buckets + 1)
+    assert_equal(indices[[0, -1]], [start, stop - 1])
+    assert_allclose(y[indices].min(), y[start:stop].min())
+    assert_allclose(y[indices].max(), y[start:stop].max())
+
+
+def test_pyramid_indices_at_full_resolution():
+    pyramid = MinMaxPyramid(np.zeros(100))
+    assert_equal(pyramid.indices(10, 20, 50), np.arange(10, 20))
+
+
+def test_pyramid_indices_within_single_block():
+    y = np.random.normal(size=64)
+    pyramid = MinMaxPyramid(y)
+    # The range straddles two blocks of 16 points, neither fully contained.
+    indices = pyramid.indices(9, 25, 1)
+    assert indices.min() >= 9 and indices.max() < 25
+    assert_allclose(y[indices].min(), y[9:25].min())
@@ -0,0 +1,83 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+
+from deli.utils.ring_buffer import RingBufferDataSource
+
+
+def check_source(source, x, y):
+    x = np.asarray(x, dtype=float)[-source.capacity:]
+    y = np.asarray(y, dtype=float)[-source.capacity:]
+    assert_equal(source.x, x)
+    assert_equal(source.y, y)
+    assert source.size == len(x)
+    if len(x) > 0:
+        assert_allclose(source.extents,
+                        (np.nanmin(x), np.nanmin(y), np.nanmax(x),
+                         np.nanmax(y)))
+    assert source.x_is_sorted == bool(np.all(x[1:] >= x[:-1]))
+
+
+def test_append_until_full():
+    source = RingBufferDataSource(5, block_size=2)
+    source.append([0, 1, 2], [5, 4, 3])
+    check_source(source, [0, 1, 2], [5, 4, 3])
+    source.append([3, 4, 5, 6], [2, 1, 0, -1])
+    check_source(source, range(7), [5, 4, 3, 2, 1, 0, -1])
+
+
+def test_views_share_storage():
+    source = RingBufferDataSource(4)
+    source.append(np.arange(6), np.arange(6))
+    x = source.x
+    assert x.flags.c_contiguous
+    assert np.may_share_memory(x, source._data)
+
+
+def test_chunk_larger_than_capacity():
+    source = RingBufferDataSource(3)
+    source.append([1, 2], [1, 2])
+    source.append(np.arange(10), np.arange(10) ** 2)
+    check_source(source, np.arange(10), np.arange(10) ** 2)
+
+
+def test_unsorted_samples_are_discarded():
+    source = RingBufferDataSource(4, block_size=3)
+    source.append([0, 2, 1, 3], [0, 0, 0, 0])
+    assert not source.x_is_sorted
+    source.append([4, 5, 6], [0, 0, 0])
+    # The decreasing step from 2 to 1 is no longer in the window.
+    check_source(source, [0, 2, 1, 3, 4, 5, 6], [0] * 7)
+
+
+def test_nan_values_are_ignored_by_extents():
+    source = RingBufferDataSource(4)
+    source.append([0, 1, 2], [1, np.nan, -1])
+    assert_allclose(source.extents, (0, -1, 2, 1))
+
+
+def test_random_chunks():
+    random = np.random.RandomState(42)
+    for capacity, block_size in [(1, None), (7, None), (10, 3), (50, 7)]:
+        source = RingBufferDataSource(capacity, block_size=block_size)
+        x_all, y_all = [], []
+        for i in range(100):
+            n = random.randint(0, 2 * capacity + 2)
+            start = x_all[-1] if x_all else 0
+            # Data is occasionally unsorted.
+            x = start + np.cumsum(random.rand(n)) - (random.rand() < 0.2)
+            y = random.randn(n)
+            source.append(x, y)
+            x_all.extend(x)
+            y_all.extend(y)
+            check_source(source, x_all, y_all)
+
+
+def test_updated_event():
+    source = RingBufferDataSource(3)
+    counts = []
+    source.on_trait_change(lambda new: counts.append(new), 'updated')
+    source.append([1, 2], [3, 4])
+    source.append([], [])
+    source.clear()
+    assert counts == [2, 0]
+    assert source.size == 0
@@ -0,0 +1,83 @@
+from kiva.fonttools import Font
+from mock import MagicMock
+
+from deli.utils.text import TEXT_EXTENT_CACHE, get_text_extents
+
+
+class FakeContext(object):
+    """ Graphics context that measures text as `scale` units per character.
+    """
+
+    def __init__(self, scale=1):
+        self.scale = scale
+        self.set_font = MagicMock()
+        self.get_full_text_extent = MagicMock(
+            side_effect=lambda text: (self.scale * len(text), 1, 0, 0))
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *args):
+        pass
+
+
+class ScaledContext(FakeContext):
+    """ Context whose measurements depend on its scale. """
+
+    @property
+    def text_measurement_key(self):
+        return self.scale
+
+
+def test_get_text_extents_cached():
+    TEXT_EXTENT_CACHE.clear()
+    context = FakeContext()
+    font = Font(size=10)
+    extents = get_text_extents(context, font, ['a', 'bb'])
+    assert extents == [(1, 1, 0, 0), (2, 1, 0, 0)]
+    assert context.get_full_text_extent.call_count == 2
+    context.set_font.assert_called_once_with(font)
+
+    # Equal fonts share cached extents.
+    extents = get_text_extents(context, Font(size=10), ['bb', 'ccc'])
+    assert extents == [(2, 1, 0, 0), (3, 1, 0, 0)]
+    assert context.get_full_text_extent.call_count == 3
+
+
+def test_get_text_extents_depends_on_font():
+    TEXT_EXTENT_CACHE.clear()
+    context = FakeContext()
+    get_text_extents(context, Font(size=10), ['a'])
+    get_text_extents(context, Font(size=12), ['a'])
+    assert context.get_full_text_extent.call_count == 2
+
+
+def test_get_text_extents_all_cached():
+    TEXT_EXTENT_CACHE.clear()
+    context = FakeContext()
+    get_text_extents(context, Font(size=10), ['a'])
+    context.set_font.reset_mock()
+    context.get_full_text_extent.reset_mock()
+    get_text_extents(context, Font(size=10), ['a'])
+    assert not context.set_font.called
+    assert not context.get_full_text_extent.called
+
+
+def test_get_text_extents_shared_by_contexts_of_same_backend():
+    TEXT_EXTENT_CACHE.clear()
+    get_text_extents(FakeContext(), Font(size=10), ['abc'])
+    other = FakeContext()
+    assert get_text_extents(other, Font(size=10), ['abc']) == [(3, 1, 0, 0)]
+    assert not other.get_full_text_extent.called
+
+
+def test_get_text_extents_depends_on_measurement_key():
+    TEXT_EXTENT_CACHE.clear()
+    small = ScaledContext(scale=1)
+    large = ScaledContext(scale=2)
+    font = Font(size=10)
+    assert get_text_extents(small, font, ['abc']) == [(3, 1, 0, 0)]
+    assert get_text_extents(large, font, ['abc']) == [(6, 1, 0, 0)]
+    assert get_text_extents(ScaledContext(scale=2), font,
+                            ['abc']) == [(6, 1, 0, 0)]
+    assert large.get_full_text_extent.call_count == 1
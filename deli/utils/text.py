@@ -1,5 +1,7 @@
 from string import maketrans
 
+from .data_structures import LRUCache
+
 
 _translation_table = {}
 
@@ -16,3 +18,70 @@ def _get_translation(src, dst):
 def switch_delimiters(text, from_delim, to_delim):
     translation_table = _get_translation(from_delim, to_delim)
     return text.translate(translation_table)
+
+
+# -----------------------------------------------------------------------------
+#  Text measurement
+# -----------------------------------------------------------------------------
+
+#: Text extents keyed by font, measurement key (see `measurement_key`), and
+#: text. Labels are redrawn with the same strings on every frame (e.g. axis
+#: labels, or the data cursor on mouse moves), so this avoids measuring them
+#: again.
+TEXT_EXTENT_CACHE = LRUCache(max_size=4096)
+
+
+def font_key(font):
+    """ Return hashable key for the attributes of a kiva `Font`.
+
+    Fonts are mutable and compared by identity, so the attributes are used.
+    """
+    return (font.face_name, font.size, font.family, font.weight, font.style,
+            font.underline, font.encoding)
+
+
+def measurement_key(gc):
+    """ Return hashable key for what, apart from the font, determines the
+    text extents measured by `gc`.
+
+    Kiva measures text in user space with the font set on the graphics
+    context, so by default this is the backend, i.e. the type of `gc`.
+    Graphics contexts whose measurements depend on other state (e.g. a font
+    that isn't set with `set_font`) describe it with a `text_measurement_key`
+    attribute, which is added to the key.
+    """
+    return (type(gc), getattr(gc, 'text_measurement_key', None))
+
+
+def get_text_extents(gc, font, texts):
+    """ Return full text extents of many texts, using `TEXT_EXTENT_CACHE`.
+
+    Parameters
+    ----------
+    gc : GraphicsContext
+        The graphics context used to measure texts that aren't cached.
+        Extents measured by other graphics contexts are reused if they have
+        the same `measurement_key`.
+    font : Font
+        The font of all texts.
+    texts : list of str
+        Texts that are measured.
+
+    Returns
+    -------
+    text_extents : list
+        Tuples of (width, height, descent, leading) for each text, as returned
+        by `gc.get_full_text_extent`.
+    """
+    base_key = (font_key(font), measurement_key(gc))
+    text_extents = [TEXT_EXTENT_CACHE.get(base_key + (text,))
+                    for text in texts]
+    missing = [i for i, extent in enumerate(text_extents) if extent is None]
+    if missing:
+        with gc:
+            gc.set_font(font)
+            for i in missing:
+                extent = tuple(gc.get_full_text_extent(texts[i]))
+                TEXT_EXTENT_CACHE[base_key + (texts[i],)] = extent
+                text_extents[i] = extent
+    return text_extents
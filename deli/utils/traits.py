@@ -1,5 +1,6 @@
 from __future__ import absolute_import
 
+import numpy as np
 from traits.api import Property
 from .misc import getattr_recurse, setattr_recurse
 
@@ -25,3 +26,22 @@ def switch_trait_handler(old, new, observed_trait_name, handler):
         old.on_trait_change(handler, observed_trait_name, remove=True)
     if new is not None:
         new.on_trait_change(handler, observed_trait_name)
+
+
+def get_state(obj):
+    """ Return dict of the values of all stored traits of a `HasTraits` object.
+
+    Properties and events are excluded, since they don't store values (and
+    may be write-only), as are shadow values of mapped traits. Arrays are
+    converted to lists, so that states can be compared with `==`. This is
+    useful to detect changes in style objects.
+    """
+    names = obj.trait_names(type=lambda t: t not in ('event', 'property'))
+    state = {}
+    for name, value in obj.trait_get(names).items():
+        if name.endswith('_') and name[:-1] in names:
+            continue
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        state[name] = value
+    return state
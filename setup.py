@@ -14,6 +14,11 @@ setup(
     maintainer = 'Tony S. Yu',
     maintainer_email = 'tyu@enthought.com',
     description = 'Interactive 2-dimensional plotting',
+    entry_points = {
+        'console_scripts': [
+            'deli-batch-render = deli.app.batch_render:main',
+        ],
+    },
     include_package_data = True,
     install_requires = info['__requires__'],
     license = 'BSD',